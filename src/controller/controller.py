@@ -1,29 +1,55 @@
 from view.vista import ProcesoTableView
-from model.proceso import Proceso
+from model.proceso import Proceso, secuencia_rafagas
 from model.fcfs import FCFS
-from model.prioridades import Prioridades
 from model.planificador import Planificador
+from model.simulacion import (
+    ALGORITMOS, ENVEJECIMIENTO_REFERENCIA, ORDEN_PREVIO, REQUIEREN_PRIORIDAD, ParametrosPlanificacion,
+    esperas_por_envejecimiento, orden_resultante, planificar,
+)
 import tkinter as tk
-from typing import List, Any
+from typing import List, Any, Tuple, TYPE_CHECKING
+import logging
 import threading
 import time
 import random
-from utils.logger import setup_logger  # <--- Importar logger
+from utils.logger import setup_logger, LineasDiferidas  # <--- Importar logger
+from utils.cache import ScheduleCache
+from utils.sesion import cargar_sesion, guardar_sesion
+from utils.traza import LLEGADA, DESPACHO, FIN, EXPULSION
+from utils.perfil import perfil
+from model.indice import IndiceIntervalos
+
+# Carga diferida: checkpoints, resultados, historial (sqlite3) y el grabador de
+# trazas se importan en su primer uso para no sumar al arranque
+if TYPE_CHECKING:
+    from utils.historial import HistorialEjecuciones
+    from utils.traza import GrabadorTraza
+
+# Workload inicial: (nombre, llegada, ráfaga, algoritmo, prioridad)
+PROCESOS_POR_DEFECTO = (
+    ("P1", 0, 5, "FCFS", None),
+    ("P2", 2, 3, "FCFS", None),
+    ("P3", 4, 1, "FCFS", None),
+    ("P4", 0, 5, "Prioridades", 2),
+    ("P5", 0, 3, "Prioridades", 3),
+    ("P6", 0, 1, "Prioridades", 1),
+)
+
+
+def crear_procesos_por_defecto() -> List[Proceso]:
+    """Construye los procesos del workload inicial (objetos nuevos, mutables)"""
+    return [Proceso(*spec) for spec in PROCESOS_POR_DEFECTO]
 
 class Controller:
     def __init__(self) -> None:
         self.planificador: Planificador = FCFS()
-        self.root = tk.Tk()
+        with perfil.seccion("tk.Tk()"):
+            self.root = tk.Tk()
         self.root.title("Planificador de Procesos - Simulación Dinámica")
-        self.default_procesos = [
-            Proceso("P1", 0, 5, "FCFS"),
-            Proceso("P2", 2, 3, "FCFS"),
-            Proceso("P3", 4, 1, "FCFS"),
-            Proceso("P4", 0, 5, "Prioridades",2),
-            Proceso("P5", 0, 3, "Prioridades",3),
-            Proceso("P6", 0, 1, "Prioridades",1),
-        ]
-        self.procesos: List[Proceso] = [Proceso(p.nombre, p.tiempo_llegada, p.rafaga, p.algoritmo, p.prioridad) for p in self.default_procesos]
+        self.default_procesos = PROCESOS_POR_DEFECTO
+        # Workload de la sesión anterior, ya planificado, si la caché de arranque es válida
+        with perfil.seccion("caché de sesión"):
+            self.procesos: List[Proceso] = cargar_sesion() or crear_procesos_por_defecto()
         
         # Variables para controlar la ejecución
         self.ejecutando = False
@@ -31,24 +57,45 @@ class Controller:
         self.tiempo_actual_simulacion = 0
         self.velocidad_simulacion = 1.0  # segundos por unidad de tiempo
         self.thread_ejecucion = None
+        self._generacion = 0  # Identifica el hilo de simulación vigente
         self.lock = threading.Lock()  # Para thread safety
+        self.cache = ScheduleCache()  # Planificaciones memorizadas por huella del workload
+        self.parametros = ParametrosPlanificacion()  # Envejecimiento, etc.
+        self.indice: IndiceIntervalos | None = None  # Índice de la planificación vigente (uno por cálculo)
+        self.grabador: "GrabadorTraza | None" = None  # Traza binaria de la ejecución en curso
+        self.reproduciendo = False
+        self._historial: "HistorialEjecuciones | None" = None  # Se abre en el primer uso
         
-        self.view = ProcesoTableView(
-            master=self.root,
-            procesos=self.procesos,
-            on_edit=self.on_edit,
-            on_add=self.add_proceso,
-            on_run=self.ejecutar_planificador,
-            on_pause=self.pausar_reanudar,
-            on_stop=self.detener_ejecucion,
-            on_speed_change=self.cambiar_velocidad,
-            on_reset=self.reiniciar_simulacion,
-            on_add_fcfs=self.add_proceso_fcfs,              # <-- Nuevo
-            on_add_prioridad=self.add_proceso_prioridad      # <-- Nuevo
-        )
+        with perfil.seccion("vista"):
+            self.view = ProcesoTableView(
+                master=self.root,
+                procesos=self.procesos,
+                on_edit=self.on_edit,
+                on_edit_batch=self.apply_edits,
+                on_add=self.add_proceso,
+                on_run=self.ejecutar_planificador,
+                on_pause=self.pausar_reanudar,
+                on_stop=self.detener_ejecucion,
+                on_speed_change=self.cambiar_velocidad,
+                on_reset=self.reiniciar_simulacion,
+                on_add_fcfs=self.add_proceso_fcfs,              # <-- Nuevo
+                on_add_prioridad=self.add_proceso_prioridad,     # <-- Nuevo
+                get_cache_stats=self.cache.estadisticas,
+                on_seek=self.seek,
+                on_replay=self.reproducir_traza,
+                on_save_state=self.guardar_estado,
+                on_load_state=self.cargar_estado,
+                on_open_results=self.cargar_resultados,
+                on_import=self.agregar_procesos,
+                get_historial=self.consultar_historial,
+                get_parametros=lambda: self.parametros.como_dict(),
+                on_parametros=self.cambiar_parametros,
+                get_envejecimiento=self.comparar_envejecimiento,
+                algoritmos=ALGORITMOS
+            )
         
         self.planificador.add_observer(self.view)
-        self.logger = setup_logger()  # <--- Instanciar logger
+        self.logger = setup_logger()  # Idempotente: reutiliza la configuración de main.py
 
     def add_proceso(self) -> None:
         """Agregar proceso durante la ejecución"""
@@ -60,108 +107,167 @@ class Controller:
             self.procesos.append(nuevo)
             
             # Si está ejecutando, recalcular inmediatamente
-            if self.ejecutando:
-                self.recalcular_durante_ejecucion()
-            
-            self.view.refresh(self.procesos)
+            self._tras_cambios()
 
     def on_edit(self, idx: int, field: str, value: Any) -> None:
         """Editar proceso existente"""
+        self.apply_edits([(idx, field, value)])
+
+    def apply_edits(self, cambios: List[Tuple[int, str, Any]]) -> None:
+        """
+        Aplica un lote de ediciones (idx, campo, valor) de forma transaccional.
+        Todos los cambios se validan antes de aplicar ninguno; luego se aplican
+        bajo un único bloqueo con un solo recálculo y un solo refresco de la vista.
+        """
+        with self.lock:
+            validados = [self._validar_cambio(idx, field, value) for idx, field, value in cambios]
+            if not validados:
+                return
+            self._validar_estado_resultante(validados)
+            for idx, field, value in validados:
+                p = self.procesos[idx]
+                if field == "secuencia":
+                    p.fijar_secuencia(value)
+                    continue
+                if field == "rafaga" and value != p.rafaga:
+                    p.secuencia = []  # Una ráfaga editada a mano reemplaza las ráfagas de CPU y E/S
+                setattr(p, field, value)
+            self._tras_cambios()
+
+    def agregar_procesos(self, procesos: List[Proceso]) -> None:
+        """
+        Agrega un lote de procesos (p. ej. un workload importado) con un único
+        bloqueo, un solo recálculo y un solo refresco de la vista.
+        """
+        if not procesos:
+            return
         with self.lock:
-            proceso: Proceso = self.procesos[idx]
-            if field == "nombre":
-                proceso.nombre = value
-            elif field == "tiempo_llegada":
-                proceso.tiempo_llegada = int(value)
-            elif field == "rafaga":
-                proceso.rafaga = int(value)
-            elif field == "prioridad":
-                proceso.prioridad = int(value) if value != '' else None
-            elif field == "algoritmo":
-                proceso.algoritmo = value
-            
-            # Si está ejecutando, recalcular
             if self.ejecutando:
-                self.recalcular_durante_ejecucion()
-            
-            self.view.refresh(self.procesos)
+                # Igual que al agregar uno a uno: no pueden llegar en el pasado
+                for p in procesos:
+                    p.tiempo_llegada = max(p.tiempo_llegada, self.tiempo_actual_simulacion)
+            self.procesos.extend(procesos)
+            self._tras_cambios()
+        self.logger.info("Importados %d procesos", len(procesos))
+
+    def _tras_cambios(self) -> None:
+        """Recalcula (si está ejecutando) y refresca la vista una sola vez por lote"""
+        if self.ejecutando:
+            self.recalcular_durante_ejecucion()
+        else:
+            self.indice = None  # Los procesos cambiaron sin recalcular
+        self._refrescar_vista()
+
+    def _refrescar_vista(self) -> None:
+        """Refresca la vista con el índice de la planificación vigente (se construye una sola vez)"""
+        if self.indice is None:
+            self.indice = IndiceIntervalos(self.procesos)
+        self.view.refresh(self.procesos, self.indice)
+
+    def _validar_cambio(self, idx: int, field: str, value: Any) -> Tuple[int, str, Any]:
+        """Valida y normaliza un cambio; lanza ValueError si no es aplicable"""
+        if not 0 <= idx < len(self.procesos):
+            raise ValueError(f"Índice de proceso inválido: {idx}")
+        if field == "nombre":
+            value = str(value).strip()
+            if not value:
+                raise ValueError("El nombre no puede estar vacío")
+        elif field == "tiempo_llegada":
+            value = int(value)
+            if value < 0:
+                raise ValueError("El tiempo de llegada no puede ser negativo")
+        elif field == "rafaga":
+            value = int(value)
+            if value <= 0:
+                raise ValueError("La ráfaga debe ser mayor que cero")
+        elif field == "prioridad":
+            value = int(value) if value not in ('', None) else None
+        elif field == "plazo":
+            value = int(value) if value not in ('', None) else None
+            if value is not None and value < 0:
+                raise ValueError("El plazo no puede ser negativo")
+        elif field == "secuencia":
+            value = secuencia_rafagas(value)
+        elif field == "algoritmo":
+            if value not in ALGORITMOS:
+                raise ValueError(f"Algoritmo desconocido: {value}")
+        else:
+            raise ValueError(f"Campo no editable: {field}")
+        return idx, field, value
+
+    def _validar_estado_resultante(self, validados: List[Tuple[int, str, Any]]) -> None:
+        """Verifica que cada fila editada quede en un estado planificable"""
+        resultantes = {}
+        for idx, field, value in validados:
+            p = self.procesos[idx]
+            estado = resultantes.setdefault(idx, {
+                "algoritmo": p.algoritmo, "prioridad": p.prioridad,
+                "tiempo_llegada": p.tiempo_llegada, "plazo": p.plazo,
+                "rafaga": None, "secuencia": None,  # Solo si el lote los cambia
+            })
+            if field == "rafaga" and value == p.rafaga:
+                continue
+            if field in estado:
+                estado[field] = value
+        for idx, estado in resultantes.items():
+            if estado["algoritmo"] in REQUIEREN_PRIORIDAD and estado["prioridad"] is None:
+                raise ValueError(
+                    f"{self.procesos[idx].nombre}: un proceso de {estado['algoritmo']} requiere prioridad"
+                )
+            if estado["plazo"] is not None and estado["plazo"] < estado["tiempo_llegada"]:
+                raise ValueError(f"{self.procesos[idx].nombre}: el plazo es anterior a la llegada")
+            # Como al importar: con ráfagas de E/S, la ráfaga es la suma de las de CPU
+            secuencia = estado["secuencia"]
+            if secuencia and estado["rafaga"] is not None and estado["rafaga"] != sum(secuencia[::2]):
+                raise ValueError(
+                    f"{self.procesos[idx].nombre}: la ráfaga ({estado['rafaga']}) no coincide con la suma "
+                    f"de las ráfagas de CPU ({sum(secuencia[::2])}); vacíe la secuencia para usar una sola ráfaga"
+                )
 
     def recalcular_durante_ejecucion(self) -> None:
         """Recalcula los procesos que aún no han terminado"""
-        # Resetear solo los procesos que no han comenzado o están en ejecución
+        anterior = self.indice  # Eventos del instante actual ya grabados
+        # Resetear solo los procesos que no han comenzado (salvo donde su plan ordena la cola)
         for proceso in self.procesos:
-            if proceso.tiempo_inicio > self.tiempo_actual_simulacion:
+            if proceso.tiempo_inicio > self.tiempo_actual_simulacion and proceso.algoritmo not in ORDEN_PREVIO:
                 # Proceso que aún no ha comenzado
-                proceso.tiempo_inicio = 0
-                proceso.tiempo_final = 0
-                proceso.tiempo_retorno = 0
-                proceso.tiempo_espera = 0
+                proceso.reiniciar_tiempos()
         
         # Recalcular algoritmos
         self.calcular_algoritmos_dinamico()
 
+        if self.grabador:
+            self.grabador.definir(self.procesos, self.tiempo_actual_simulacion)
+            self.grabador.replanificacion(self.tiempo_actual_simulacion, len(self.procesos))
+            self._registrar_eventos(self.tiempo_actual_simulacion, anterior)
+
     def calcular_algoritmos_dinamico(self) -> None:
         """Calcula los algoritmos considerando el tiempo actual de simulación"""
-        # Procesos FCFS pendientes (que no han terminado)
-        procesos_fcfs_pendientes = [
-            p for p in self.procesos 
-            if p.algoritmo == "FCFS" and 
-            (p.tiempo_final == 0 or p.tiempo_final > self.tiempo_actual_simulacion)
-        ]
-        
-        if procesos_fcfs_pendientes:
-            planificador_fcfs = FCFS()
-            planificador_fcfs.tiempo_inicial = self.tiempo_actual_simulacion
-
-            # Agregar referencias a los mismos objetos, no copias
-            for p in procesos_fcfs_pendientes:
-                planificador_fcfs.add_proceso(p)
-
-            resultado_fcfs = planificador_fcfs.run()
-            # Actualizar los procesos originales con los resultados
-            self.actualizar_procesos_desde_resultado(procesos_fcfs_pendientes, resultado_fcfs)
-            self.logger.info("Procesos FCFS calculados:")
-            for p in resultado_fcfs:
+        resultados = planificar(self.procesos, self.tiempo_actual_simulacion, self.cache, self.parametros)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            for algoritmo, resultado in resultados.items():
                 self.logger.info(
-                    f"{p.nombre} | Llegada: {p.tiempo_llegada} | Rafaga: {p.rafaga} | "
-                    f"Inicio: {p.tiempo_inicio} | Final: {p.tiempo_final} | "
-                    f"Retorno: {p.tiempo_retorno} | Espera: {p.tiempo_espera}"
+                    "Procesos %s calculados:\n%s",
+                    algoritmo,
+                    LineasDiferidas(
+                        "%s | Llegada: %d | Rafaga: %d | Inicio: %d | Final: %d | Retorno: %d | Espera: %d",
+                        [(p.nombre, p.tiempo_llegada, p.rafaga, p.tiempo_inicio, p.tiempo_final,
+                          p.tiempo_retorno, p.tiempo_espera) for p in resultado]
+                    ) if algoritmo not in REQUIEREN_PRIORIDAD else LineasDiferidas(
+                        "%s | Llegada: %d | Rafaga: %d | Prioridad: %s | Inicio: %d | Final: %d | "
+                        "Retorno: %d | Espera: %d",
+                        [(p.nombre, p.tiempo_llegada, p.rafaga, p.prioridad, p.tiempo_inicio,
+                          p.tiempo_final, p.tiempo_retorno, p.tiempo_espera) for p in resultado]
+                    )
                 )
 
-        # Procesos de Prioridades
-        procesos_prioridades = [
-            p for p in self.procesos 
-            if p.algoritmo == "Prioridades" and p.prioridad is not None
-        ]
-        
-        if procesos_prioridades:
-            planificador_prio = Prioridades()
-            planificador_prio.tiempo_inicial = self.tiempo_actual_simulacion
+        # Reordenar self.procesos para que los procesos de los demás algoritmos estén en el
+        # orden calculado y los de FCFS mantengan su orden original
+        # (en el lugar, para que quien tenga una referencia a la lista la vea actualizada)
+        self.procesos[:] = orden_resultante(self.procesos, resultados)
 
-            for p in procesos_prioridades:
-                planificador_prio.add_proceso(p)
-
-            resultado_prio = planificador_prio.run()
-            self.actualizar_procesos_desde_resultado(procesos_prioridades, resultado_prio)
-            self.logger.info("Procesos Prioridades calculados:")
-            for p in resultado_prio:
-                self.logger.info(
-                    f"{p.nombre} | Llegada: {p.tiempo_llegada} | Rafaga: {p.rafaga} | Prioridad: {p.prioridad} | "
-                    f"Inicio: {p.tiempo_inicio} | Final: {p.tiempo_final} | "
-                    f"Retorno: {p.tiempo_retorno} | Espera: {p.tiempo_espera}"
-                )
-            # Reordenar self.procesos para que los procesos de prioridades estén en el orden calculado
-            # y los de FCFS mantengan su orden original
-            nuevos_procesos = []
-            # Primero, los procesos FCFS en su orden original
-            for p in self.procesos:
-                if p.algoritmo == "FCFS":
-                    nuevos_procesos.append(p)
-            # Luego, los procesos de prioridades en el orden calculado por el algoritmo
-            for p in resultado_prio:
-                nuevos_procesos.append(p)
-            self.procesos = nuevos_procesos
-            self.view.refresh(self.procesos)
+        self.indice = IndiceIntervalos(self.procesos)
 
     def actualizar_procesos_desde_resultado(self, procesos_originales: List[Proceso], resultado: List[Proceso]) -> None:
         """Actualiza los procesos originales con los resultados calculados"""
@@ -185,21 +291,35 @@ class Controller:
             
             # Calcular inicialmente
             self.calcular_algoritmos_dinamico()
+            self._refrescar_vista()
+
+            # Grabar la traza de eventos de esta ejecución
+            from utils.traza import GrabadorTraza
+            self._cerrar_traza()
+            self.grabador = GrabadorTraza()
+            self.grabador.definir(self.procesos, 0)
+            self._registrar_eventos(0)
             
             # Iniciar thread de ejecución
-            self.thread_ejecucion = threading.Thread(target=self.ejecutar_simulacion)
-            self.thread_ejecucion.daemon = True
-            self.thread_ejecucion.start()
+            self._iniciar_hilo_simulacion()
             
             # Iniciar animación Gantt
             self.view.gantt.animar_dinamico(self.procesos, self.velocidad_simulacion)
 
-    def ejecutar_simulacion(self) -> None:
+    def _iniciar_hilo_simulacion(self) -> None:
+        """Lanza el hilo de simulación; un hilo de una ejecución anterior termina solo"""
+        self._generacion += 1
+        self.thread_ejecucion = threading.Thread(target=self.ejecutar_simulacion, args=(self._generacion,))
+        self.thread_ejecucion.daemon = True
+        self.thread_ejecucion.start()
+
+    def ejecutar_simulacion(self, generacion: int | None = None) -> None:
         """Ejecuta la simulación en tiempo real"""
-        while self.ejecutando:
+        while self.ejecutando and (generacion is None or generacion == self._generacion):
             if not self.pausar_ejecucion:
                 with self.lock:
                     self.tiempo_actual_simulacion += 1
+                    self._registrar_eventos(self.tiempo_actual_simulacion)
                     
                     # Verificar si todos los procesos han terminado
                     procesos_terminados = all(
@@ -209,6 +329,8 @@ class Controller:
                     
                     if procesos_terminados:
                         self.ejecutando = False
+                        self._cerrar_traza()
+                        self._guardar_en_historial()
                         self.root.after(0, lambda: self.view.update_control_buttons(False, True))
                         break
                     
@@ -220,25 +342,250 @@ class Controller:
             else:
                 time.sleep(0.1)
 
+    @property
+    def historial(self) -> "HistorialEjecuciones":
+        """Historial de ejecuciones (SQLite); se abre en el primer uso"""
+        if self._historial is None:
+            from utils.historial import HistorialEjecuciones
+            self._historial = HistorialEjecuciones()
+        return self._historial
+
+    def _guardar_en_historial(self) -> None:
+        """Persiste la ejecución terminada en el historial, en segundo plano"""
+        import copy
+        import sqlite3
+
+        procesos = [copy.copy(p) for p in self.procesos]  # Copias: la vista puede resetear los tiempos
+
+        def guardar() -> None:
+            try:
+                ejecucion_id = self.historial.guardar_ejecucion(procesos)
+                self.logger.info("Ejecución %d guardada en el historial (%d procesos)", ejecucion_id, len(procesos))
+            except sqlite3.Error as e:
+                self.logger.error("No se pudo guardar la ejecución en el historial: %s", e)
+
+        threading.Thread(target=guardar, daemon=True).start()
+
+    def consultar_historial(self, ultimas: int = 50) -> dict:
+        """Últimas ejecuciones y la comparación de p95 de espera por algoritmo"""
+        return {
+            "ejecuciones": self.historial.ultimas_ejecuciones(ultimas),
+            "espera_p95": self.historial.comparar("espera_p95", ultimas),
+            "espera_media": self.historial.comparar("espera_media", ultimas),
+        }
+
+    def guardar_estado(self, ruta: str) -> None:
+        """Guarda un checkpoint binario con el estado completo de la simulación"""
+        from utils.checkpoint import guardar_checkpoint
+
+        with self.lock:
+            tiempo = self.tiempo_actual_simulacion
+            estado = {
+                "tiempo": tiempo,
+                "velocidad": self.velocidad_simulacion,
+                "ejecutando": self.ejecutando,
+                "pausado": self.pausar_ejecucion,
+                "parametros": self.parametros.como_dict(),
+            }
+            guardar_checkpoint(ruta, self.procesos, estado)
+        self.logger.info("Checkpoint guardado en %s (t=%d, %d procesos)", ruta, tiempo, len(self.procesos))
+
+    def cargar_estado(self, ruta: str) -> None:
+        """Restaura un checkpoint y reanuda la simulación en el mismo punto"""
+        from utils.checkpoint import cargar_checkpoint
+        from utils.traza import GrabadorTraza
+
+        procesos, estado = cargar_checkpoint(ruta)
+        with self.lock:
+            self.reproduciendo = False
+            self._cerrar_traza()
+            self.procesos = procesos
+            self.indice = None
+            self.tiempo_actual_simulacion = estado["tiempo"]
+            self.velocidad_simulacion = estado["velocidad"]
+            self.ejecutando = estado["ejecutando"]
+            self.pausar_ejecucion = estado["pausado"]
+            self.parametros = ParametrosPlanificacion.desde_dict(estado.get("parametros", {}))
+
+            self.view.set_velocidad(self.velocidad_simulacion)
+            self._refrescar_vista()
+            self.view.mostrar_instante(self.tiempo_actual_simulacion)
+            self.view.set_estado_ejecucion(self.ejecutando, self.pausar_ejecucion)
+
+            if self.ejecutando:
+                self.grabador = GrabadorTraza()
+                self.grabador.definir(self.procesos, self.tiempo_actual_simulacion)
+                self._iniciar_hilo_simulacion()
+                self.view.gantt.animar_dinamico(self.procesos, self.velocidad_simulacion)
+                self.view.gantt.tiempo_actual_animacion = self.tiempo_actual_simulacion
+        self.logger.info("Checkpoint restaurado desde %s (t=%d)", ruta, self.tiempo_actual_simulacion)
+
+    def cargar_resultados(self, ruta: str) -> None:
+        """Muestra los resultados de un archivo binario exportado (sin recalcular)"""
+        from utils.resultados import importar_resultados
+
+        procesos = importar_resultados(ruta)
+        with self.lock:
+            self.ejecutando = False
+            self.reproduciendo = False
+            self.pausar_ejecucion = False
+            self._cerrar_traza()
+            self.procesos = procesos
+            self.indice = IndiceIntervalos(self.procesos)
+            self.tiempo_actual_simulacion = self.indice.tiempo_final_max
+            self._refrescar_vista()
+            self.view.mostrar_instante(self.tiempo_actual_simulacion)
+            self.view.set_estado_ejecucion(False, False)
+
+    def _registrar_eventos(self, tiempo: int, anterior: IndiceIntervalos | None = None) -> None:
+        """
+        Graba en la traza las llegadas, despachos (también las reanudaciones),
+        finalizaciones y expulsiones del instante dado.
+        Si se indica `anterior` (índice previo a una replanificación en ese mismo
+        instante), solo se graban los eventos que no estaban ya en él.
+        """
+        if not self.grabador:
+            return
+        for tipo, consulta in (
+            (LLEGADA, "llegan_en"), (DESPACHO, "inician_en"), (DESPACHO, "reanudan_en"),
+            (FIN, "finalizan_en"), (EXPULSION, "expulsados_en"),
+        ):
+            procesos = getattr(self.indice, consulta)(tiempo)
+            if anterior is not None:
+                grabados = {id(p) for p in getattr(anterior, consulta)(tiempo)}
+                procesos = [p for p in procesos if id(p) not in grabados]
+            self.grabador.registrar(tipo, procesos, tiempo)
+
+    def _registrar_intervalo(self, desde: int, hasta: int) -> None:
+        """Graba, en orden de tiempo, los eventos de (desde, hasta] que un salto adelante omitió"""
+        llegadas, despachos, finales = self.indice.eventos_entre(desde, hasta)
+        expulsiones, reanudaciones = self.indice.cortes_entre(desde, hasta)
+        eventos = sorted(
+            [(p.tiempo_llegada, LLEGADA, p) for p in llegadas]
+            + [(p.tiempo_inicio, DESPACHO, p) for p in despachos]
+            + [(t, DESPACHO, p) for t, p in reanudaciones]
+            + [(p.tiempo_final, FIN, p) for p in finales]
+            + [(t, EXPULSION, p) for t, p in expulsiones],
+            key=lambda e: (e[0], e[1])
+        )
+        for tiempo, tipo, p in eventos:
+            self.grabador.registrar(tipo, [p], tiempo)  # type: ignore[union-attr]
+
+    def _cerrar_traza(self) -> None:
+        if self.grabador:
+            self.grabador.cerrar()
+            self.logger.info("Traza guardada en %s (%d eventos)", self.grabador.ruta, self.grabador.eventos)
+            self.grabador = None
+
+    def reproducir_traza(self, ruta: str) -> None:
+        """
+        Reproduce una traza grabada: reconstruye la planificación a partir de los
+        eventos (sin ejecutar los planificadores) y la anima a la velocidad actual.
+        """
+        from utils.traza import ReproductorTraza
+
+        reproductor = ReproductorTraza(ruta)
+        try:
+            procesos, tiempo_final = reproductor.cargar()
+        finally:
+            reproductor.cerrar()
+
+        with self.lock:
+            self.ejecutando = False
+            self.pausar_ejecucion = False
+            self._cerrar_traza()
+            self.procesos = procesos
+            self.indice = None
+            self.tiempo_actual_simulacion = 0
+            self.reproduciendo = True
+            self._refrescar_vista()
+            self.view.mostrar_instante(0)
+            self.view.update_control_buttons(True, False)
+
+        hilo = threading.Thread(target=self._loop_reproduccion, args=(tiempo_final,))
+        hilo.daemon = True
+        hilo.start()
+
+    def _loop_reproduccion(self, tiempo_final: int) -> None:
+        """Avanza el reloj de la reproducción hasta el último evento de la traza"""
+        while self.reproduciendo and self.tiempo_actual_simulacion < tiempo_final:
+            if self.pausar_ejecucion:
+                time.sleep(0.1)
+                continue
+            with self.lock:
+                self.tiempo_actual_simulacion += 1
+                tiempo = self.tiempo_actual_simulacion
+            self.root.after(0, lambda t=tiempo: self.view.actualizar_tiempo_simulacion(t))
+            time.sleep(1.0 / self.velocidad_simulacion)
+        if self.reproduciendo:
+            self.reproduciendo = False
+            self.root.after(0, lambda: self.view.update_control_buttons(False, True))
+
+    def seek(self, tiempo: int) -> None:
+        """
+        Salta directamente al instante indicado de la planificación calculada.
+        No reproduce la simulación: la vista consulta el índice de intervalos y
+        dibuja ese frame. Si la simulación está en curso, continúa desde ahí.
+        """
+        with self.lock:
+            indice = self.view.get_indice()
+            if indice.tiempo_final_max == 0 and not self.ejecutando:
+                # Aún no hay planificación: calcularla desde el inicio
+                self.tiempo_actual_simulacion = 0
+                self.calcular_algoritmos_dinamico()
+                self._refrescar_vista()
+                indice = self.view.get_indice()
+
+            tiempo = max(0, min(int(tiempo), indice.tiempo_final_max))
+            if self.grabador:
+                # La traza es de solo avance: hacia atrás se rechaza, hacia adelante
+                # se graban los eventos saltados para que la reproducción sea fiel
+                if tiempo < self.tiempo_actual_simulacion:
+                    self.logger.warning("No se puede retroceder mientras se graba la traza")
+                    self.view.actualizar_tiempo_simulacion(self.tiempo_actual_simulacion)
+                    return
+                self._registrar_intervalo(self.tiempo_actual_simulacion, tiempo)
+            self.tiempo_actual_simulacion = tiempo
+            self.view.mostrar_instante(tiempo)
+
     def pausar_reanudar(self) -> None:
         """Pausa o reanuda la ejecución"""
-        if self.ejecutando:
+        if self.ejecutando or self.reproduciendo:
             self.pausar_ejecucion = not self.pausar_ejecucion
 
     def detener_ejecucion(self) -> None:
         """Detiene completamente la ejecución"""
         self.ejecutando = False
+        self.reproduciendo = False
         self.pausar_ejecucion = False
+        self._cerrar_traza()
         self.tiempo_actual_simulacion = 0
         
         # Resetear todos los procesos
         for proceso in self.procesos:
-            proceso.tiempo_inicio = 0
-            proceso.tiempo_final = 0
-            proceso.tiempo_retorno = 0
-            proceso.tiempo_espera = 0
+            proceso.reiniciar_tiempos()
         
-        self.view.refresh(self.procesos)
+        self.indice = None
+        self._refrescar_vista()
+
+    def cambiar_parametros(self, valores: dict) -> None:
+        """Aplica nuevos parámetros de planificación; lanza ValueError si no son válidos"""
+        parametros = ParametrosPlanificacion.desde_dict({**self.parametros.como_dict(), **valores})
+        with self.lock:
+            self.parametros = parametros
+            self._tras_cambios()
+        self.logger.info("Parámetros de planificación: %s", parametros.como_dict())
+
+    def comparar_envejecimiento(self) -> dict:
+        """
+        Espera máxima y p99 de los procesos de prioridades sin envejecimiento y
+        con la tasa configurada (o la de referencia, si está desactivado)
+        """
+        with self.lock:
+            procesos = list(self.procesos)
+            tasa = self.parametros.envejecimiento or ENVEJECIMIENTO_REFERENCIA
+        esperas = esperas_por_envejecimiento(procesos, (0.0, tasa), self.cache)
+        return {"tasa": tasa, "sin": esperas[0.0], "con": esperas[tasa]}
 
     def cambiar_velocidad(self, nueva_velocidad: float) -> None:
         """Cambia la velocidad de simulación"""
@@ -247,11 +594,14 @@ class Controller:
     def reiniciar_simulacion(self) -> None:
         """Reinicia la simulación y restaura los valores predeterminados"""
         self.ejecutando = False
+        self.reproduciendo = False
         self.pausar_ejecucion = False
+        self._cerrar_traza()
         self.tiempo_actual_simulacion = 0
         # Restaurar procesos por defecto
-        self.procesos = [Proceso(p.nombre, p.tiempo_llegada, p.rafaga, p.algoritmo, p.prioridad) for p in self.default_procesos]
-        self.view.refresh(self.procesos)
+        self.procesos = crear_procesos_por_defecto()
+        self.indice = None
+        self._refrescar_vista()
         if hasattr(self.view, "reset_simulation"):
             self.view.reset_simulation()
 
@@ -263,9 +613,7 @@ class Controller:
             rafaga = 3  # Valor por defecto para pruebas
             nuevo = Proceso(nuevo_nombre, tiempo_llegada, rafaga, "FCFS")
             self.procesos.append(nuevo)
-            if self.ejecutando:
-                self.recalcular_durante_ejecucion()
-            self.view.refresh(self.procesos)
+            self._tras_cambios()
 
     def add_proceso_prioridad(self) -> None:
         """Agregar proceso de Prioridad rápidamente"""
@@ -276,11 +624,21 @@ class Controller:
             prioridad = random.randint(1, 10)  # Prioridad completamente aleatoria
             nuevo = Proceso(nuevo_nombre, tiempo_llegada, rafaga, "Prioridades", prioridad)
             self.procesos.append(nuevo)
-            if self.ejecutando:
-                self.recalcular_durante_ejecucion()
-            self.view.refresh(self.procesos)
+            self._tras_cambios()
 
     def run(self) -> None:
         self.root.mainloop()
         # Asegurar que los threads se cierren al salir
-        self.ejecutando = False
\ No newline at end of file
+        self.ejecutando = False
+        self.reproduciendo = False
+        self._cerrar_traza()
+        self._guardar_sesion()
+
+    def _guardar_sesion(self) -> None:
+        """Guarda el workload y su planificación para el próximo arranque"""
+        with self.lock:
+            try:
+                if guardar_sesion(self.procesos):
+                    self.logger.info("Sesión guardada para el próximo arranque (%d procesos)", len(self.procesos))
+            except (OSError, ValueError) as e:
+                self.logger.error("No se pudo guardar la sesión: %s", e)
\ No newline at end of file
@@ -7,20 +7,176 @@ project_root: str = os.path.dirname(current_file_path)  # Carpeta FCFS
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-# Importar el controlador y el logger
-from controller.controller import Controller
-from utils.logger import setup_logger
+import argparse
+
+from utils.perfil import perfil, PRESUPUESTO_MS
+
+
+class _Ayuda(argparse.HelpFormatter):
+    """Completa los textos que dependen del modelo solo al mostrar la ayuda (el arranque no lo importa)"""
+
+    def _get_help_string(self, action: argparse.Action) -> str:
+        texto = super()._get_help_string(action) or ""
+        if "{multinucleo}" in texto:
+            from model.simulacion import ALGORITMOS, MULTINUCLEO
+            nombres = [a for a in ALGORITMOS if a in MULTINUCLEO]
+            texto = texto.replace("{multinucleo}", ", ".join(nombres[:-1]) + " y " + nombres[-1])
+        return texto
+
+
+def _argumentos() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Simulador de planificación de procesos", formatter_class=_Ayuda)
+    parser.add_argument(
+        "--profile-startup", nargs="?", const=PRESUPUESTO_MS, type=float, metavar="MS",
+        help="mide el arranque por componente, informa y sale (código 1 si supera el presupuesto)"
+    )
+    # Modo por lotes (sin Tk)
+    parser.add_argument("--gantt", metavar="SALIDA", help="renderiza el Gantt a SALIDA (.svg o .png) y sale")
+    parser.add_argument("--workload", metavar="ARCHIVO", help="workload CSV/JSON a planificar (modo por lotes)")
+    parser.add_argument("--resultados", metavar="ARCHIVO", help="resultados .fcb ya planificados (modo por lotes)")
+    parser.add_argument("--tiempo", type=int, help="instante a dibujar (por defecto, el final)")
+    parser.add_argument("--nucleos", type=int, default=1, metavar="N",
+                        help="CPUs de {multinucleo} al planificar el workload (por defecto, 1)")
+    parser.add_argument("--por-nucleo", action="store_true", help="dibuja un carril por núcleo en lugar de por proceso")
+    # Barrido de parámetros (sin Tk)
+    parser.add_argument("--barrido", nargs="+", metavar="WORKLOAD",
+                        help="planifica cada workload con cada algoritmo y combinación de parámetros y sale")
+    parser.add_argument("--algoritmos", metavar="LISTA", help="algoritmos del barrido, separados por coma (por defecto, todos)")
+    parser.add_argument("--quantums", default="4", metavar="LISTA", help="quantums de Round Robin del barrido")
+    parser.add_argument("--envejecimientos", default="0", metavar="LISTA", help="tasas de envejecimiento del barrido")
+    parser.add_argument("--lista-nucleos", default="1", metavar="LISTA", help="cantidades de núcleos del barrido")
+    parser.add_argument("--trabajadores", type=int, metavar="N", help="procesos del barrido (por defecto, uno por CPU)")
+    parser.add_argument("--salida", metavar="CSV", help="guarda la tabla del barrido en CSV")
+    # Replicaciones Monte Carlo (sin Tk; usan también --algoritmos y --nucleos)
+    parser.add_argument("--montecarlo", type=int, metavar="N",
+                        help="evalúa N workloads aleatorios del modelo de carga, informa y sale")
+    parser.add_argument("--procesos", type=int, default=100, metavar="N", help="procesos por replicación")
+    parser.add_argument("--llegada-media", type=float, default=5.0, metavar="T",
+                        help="separación media entre llegadas de las replicaciones")
+    parser.add_argument("--rafaga-media", type=float, default=4.0, metavar="T", help="ráfaga media de las replicaciones")
+    parser.add_argument("--semilla", type=int, help="semilla de las replicaciones (reproducibles)")
+    return parser.parse_args()
+
+
+def _modo_lotes(args: argparse.Namespace) -> int:
+    """Planifica/carga un workload y renderiza su Gantt fuera de pantalla, sin cargar Tk"""
+    from model.indice import IndiceIntervalos
+    from model.simulacion import (
+        ALGORITMOS, ParametrosPlanificacion, nucleos_por_algoritmo, orden_resultante, planificar,
+    )
+    from view.gantt_offscreen import renderizar_gantt
+
+    try:
+        parametros = ParametrosPlanificacion(nucleos=args.nucleos).validar()
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if args.resultados:
+        from utils.resultados import importar_resultados
+        procesos = importar_resultados(args.resultados)
+    elif args.workload:
+        from utils.importacion import leer_workload
+        procesos = leer_workload(args.workload, ALGORITMOS)
+        procesos = orden_resultante(procesos, planificar(procesos, parametros=parametros))
+    else:
+        print("--gantt requiere --workload o --resultados", file=sys.stderr)
+        return 2
+    nucleos = nucleos_por_algoritmo(parametros)
+    renderizar_gantt(args.gantt, procesos, args.tiempo, IndiceIntervalos(procesos), args.por_nucleo, nucleos)
+    print(f"Gantt de {len(procesos)} procesos guardado en {args.gantt}")
+    from utils.metricas import metricas_plazos, texto_plazos, texto_uso_cpu, uso_cpu
+    grupos: dict = {}
+    for p in procesos:
+        grupos.setdefault(p.algoritmo, []).append(p)
+    for algoritmo, grupo in grupos.items():
+        print(f"CPU {algoritmo}: {texto_uso_cpu(uso_cpu(grupo, nucleos.get(algoritmo, 1)))}")
+        plazos = metricas_plazos(grupo)
+        if plazos["con_plazo"]:
+            print(f"Plazos {algoritmo}: {texto_plazos(plazos)}")
+    return 0
+
+
+def _modo_barrido(args: argparse.Namespace) -> int:
+    """Barrido de workloads × algoritmos × parámetros en paralelo; imprime (y guarda) la tabla"""
+    from model.simulacion import ALGORITMOS, lista_enteros
+    from utils.barrido import barrer, ejecuciones, exportar_tabla, texto_tabla
+
+    try:
+        algoritmos = [a.strip() for a in args.algoritmos.split(",")] if args.algoritmos else ALGORITMOS
+        grilla = ejecuciones(
+            args.barrido, algoritmos, lista_enteros(args.quantums),
+            [float(v) for v in args.envejecimientos.split(",")], lista_enteros(args.lista_nucleos),
+        )
+        filas = barrer(grilla, args.trabajadores)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(texto_tabla(filas))
+    if args.salida:
+        exportar_tabla(args.salida, filas)
+        print(f"{len(filas)} ejecuciones guardadas en {args.salida}")
+    return 0
+
+
+def _modo_montecarlo(args: argparse.Namespace) -> int:
+    """Replicaciones Monte Carlo del modelo de carga: medias y p95 con intervalos de confianza"""
+    from model.simulacion import ALGORITMOS, ParametrosPlanificacion
+    from utils.montecarlo import ModeloCarga, replicar, texto_montecarlo
+
+    try:
+        algoritmos = [a.strip() for a in args.algoritmos.split(",")] if args.algoritmos else ALGORITMOS
+        modelo = ModeloCarga(args.procesos, args.llegada_media, args.rafaga_media)
+        resultado = replicar(modelo, args.montecarlo, algoritmos, ParametrosPlanificacion(nucleos=args.nucleos),
+                             args.semilla)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(f"{args.montecarlo} replicaciones de {args.procesos} procesos (media [IC 95 %]):")
+    print(texto_montecarlo(resultado))
+    return 0
+
 
 if __name__ == "__main__":
+    args = _argumentos()
+    if args.montecarlo is not None:
+        sys.exit(_modo_montecarlo(args))
+    if args.barrido:
+        sys.exit(_modo_barrido(args))
+    if args.gantt:
+        sys.exit(_modo_lotes(args))
+
+    presupuesto = args.profile_startup
+    if presupuesto is not None:
+        perfil.activar()
+
+    # Importar el logger y el controlador (tkinter, vista y gantt se cargan aquí)
+    with perfil.seccion("import logging"):
+        from utils.logger import setup_logger
+    with perfil.seccion("import tkinter"):
+        import tkinter  # noqa: F401
+    with perfil.seccion("import vista + gantt"):
+        import view.vista  # noqa: F401
+    with perfil.seccion("import controlador + modelo"):
+        from controller.controller import Controller
+
     # Configurar el logger
-    logger = setup_logger()
+    with perfil.seccion("setup_logger"):
+        logger = setup_logger()
     logger.info("Iniciando aplicación FCFS")
     
     try:
-        app = Controller()
+        with perfil.seccion("Controller()"):
+            app = Controller()
         logger.info("Controlador iniciado correctamente")
+        if presupuesto is not None:
+            # Medir hasta el primer dibujo de la ventana, informar y salir
+            with perfil.seccion("primer dibujo"):
+                app.root.update()
+            print(perfil.informe(presupuesto))
+            app.root.destroy()
+            sys.exit(0 if perfil.total_ms() <= presupuesto else 1)
         app.run()
         logger.info("Aplicación finalizada correctamente")
     except Exception as e:
-        logger.error(f"Error en la aplicación: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
+        logger.error("Error en la aplicación: %s", e)
+        sys.exit(1)
@@ -0,0 +1,59 @@
+import logging
+from typing import List
+from model.planificador import EntradaListo, Planificador, ejecutar_expulsivo, ejecutar_no_expulsivo
+from model.proceso import Proceso
+
+logger = logging.getLogger("fcfs.edf")
+
+SIN_PLAZO = float("inf")  # Los procesos sin plazo van detrás de todos los que tienen uno
+
+
+def clave_plazo(proceso: Proceso) -> float:
+    """Clave del heap de listos: el plazo absoluto (menor = más urgente)"""
+    return proceso.plazo if proceso.plazo is not None else SIN_PLAZO
+
+
+class EDF(Planificador):
+    """
+    Earliest-Deadline-First: se despacha, entre los procesos que ya llegaron,
+    el de plazo absoluto más cercano (a igual plazo, el que llegó antes). No
+    expulsivo sobre `nucleos` CPUs, o expulsivo sobre una: una llegada con
+    plazo estrictamente anterior al del proceso en CPU lo expulsa. Cola de
+    listos en un heap por plazo: O(n log n) en total.
+    """
+
+    def __init__(self, expulsivo: bool = False, nucleos: int = 1) -> None:
+        super().__init__()
+        self.tiempo_inicial: int = 0  # Para soportar ejecución dinámica
+        self.expulsivo = expulsivo
+        # Al replanificar, lo ya ejecutado se conserva (expulsivo: sus tramos; no expulsivo: termina)
+        self.conserva_progreso = True
+        self.nucleos = 1 if expulsivo else nucleos
+
+    def run(self) -> List[Proceso]:
+        """Implementa EDF con soporte para ejecución dinámica"""
+        procesos = list(self.lista_procesos)
+        if not procesos:
+            return []
+
+        if self.expulsivo:
+            def expulsa(actual: EntradaListo, nuevo: EntradaListo, inicio_tramo: int, tiempo: int) -> bool:
+                return nuevo[0] < actual[0]
+
+            retorno = ejecutar_expulsivo(
+                procesos, self.tiempo_inicial, lambda p, _, __: clave_plazo(p), expulsa
+            )
+        else:
+            # No expulsivo: los que ya estaban ejecutándose terminan su ráfaga
+            retorno = ejecutar_no_expulsivo(
+                procesos, self.tiempo_inicial, lambda p, _, __: clave_plazo(p), self.nucleos
+            )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in retorno:
+                logger.debug(
+                    "[EDF] Proceso %s: Plazo: %s | Tramos: %s | Final: %d | Tardanza: %d",
+                    p.nombre, p.plazo, p.tramos(), p.tiempo_final, p.tardanza
+                )
+        self.marcar_cambio()
+        return retorno
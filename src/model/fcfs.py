@@ -1,39 +1,60 @@
+import heapq
 from collections import deque
-from model.planificador import Planificador
+from model.planificador import Planificador, ejecutar_no_expulsivo
 from model.proceso import Proceso
 from typing import List
 
 class FCFS(Planificador):
 
-    def __init__(self) -> None:
+    def __init__(self, nucleos: int = 1) -> None:
         super().__init__()
         self.tiempo_inicial: int = 0  # Para soportar ejecución dinámica
+        self.nucleos = nucleos
 
     def add_proceso(self, proceso: Proceso) -> None:
         self.lista_procesos.append(proceso)
+        self.marcar_cambio()
 
     def run(self) -> List[Proceso]:
         """
         Implementa el algoritmo First-Come-First-Serve con soporte para ejecución dinámica.
         Los procesos se ejecutan en el orden en que fueron agregados, no por tiempo de llegada.
+        Con varios núcleos, cada proceso toma el que se libera primero (heap por instante libre).
+        Si algún proceso tiene ráfagas de E/S, entre los que ya llegaron o volvieron de
+        la E/S se despacha primero el que está antes en la lista.
         """
+        if any(p.secuencia for p in self.lista_procesos):
+            orden = {id(p): k for k, p in enumerate(self.lista_procesos)}
+            retorno = ejecutar_no_expulsivo(
+                list(self.lista_procesos), self.tiempo_inicial, lambda p, _, __: orden[id(p)], self.nucleos,
+                conserva_progreso=False,
+            )
+            self.marcar_cambio()
+            return retorno
+
         retorno: List[Proceso] = []
         tiempo_actual = max(self.tiempo_inicial, 0)
+        libres = [(tiempo_actual, nucleo) for nucleo in range(self.nucleos)]
 
         # NO ordenar, usar el orden de self.lista_procesos
         for proceso in self.lista_procesos:
+            libre, nucleo = heapq.heappop(libres)
             proceso.tiempo_inicio = max(
-                tiempo_actual, 
+                libre, 
                 proceso.tiempo_llegada, 
                 self.tiempo_inicial
             )
             proceso.tiempo_final = proceso.tiempo_inicio + proceso.rafaga
             proceso.tiempo_retorno = proceso.tiempo_final - proceso.tiempo_llegada
             proceso.tiempo_espera = proceso.tiempo_retorno - proceso.rafaga
+            proceso.segmentos = []
+            proceso.nucleo = nucleo
+            proceso.nucleos_tramos = []
 
-            tiempo_actual = proceso.tiempo_final
+            heapq.heappush(libres, (proceso.tiempo_final, nucleo))
             retorno.append(proceso)
 
+        self.marcar_cambio()
         return retorno
 
     def recalcular_tiempos(self, procesos: List[Proceso]) -> None:
@@ -46,7 +67,11 @@ class FCFS(Planificador):
             proceso.tiempo_final = proceso.tiempo_inicio + proceso.rafaga
             proceso.tiempo_retorno = proceso.tiempo_final - proceso.tiempo_llegada
             proceso.tiempo_espera = proceso.tiempo_retorno - proceso.rafaga
+            proceso.segmentos = []
+            proceso.nucleo = 0
+            proceso.nucleos_tramos = []
             tiempo_actual = proceso.tiempo_final
+        self.marcar_cambio()
 
     def get_procesos_activos(self, tiempo_actual: int) -> List[Proceso]:
         """Retorna los procesos que están activos en el tiempo dado"""
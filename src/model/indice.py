@@ -0,0 +1,142 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Tuple
+from model.proceso import Proceso
+
+
+class IndiceIntervalos:
+    """
+    Índice ordenado de los intervalos [inicio, final) de una planificación ya calculada.
+    Se construye una vez por planificación (O(n log n)) y responde consultas por
+    instante de tiempo con búsqueda binaria:
+
+    - en_ejecucion(t): O(C log n + k), con C = número de carriles (CPUs implícitas)
+    - pendientes(t):   O(log n + k)
+    - finalizados(t):  O(log n + k)
+
+    Los intervalos se reparten en carriles de intervalos disjuntos, de modo que en
+    cada carril a lo sumo un intervalo contiene a t. Un proceso expulsado aporta
+    un intervalo por tramo; sus expulsiones y reanudaciones se indexan aparte.
+    """
+
+    def __init__(self, procesos: Iterable[Proceso]) -> None:
+        procesos = list(procesos)
+        planificados: List[Proceso] = []
+        self.sin_planificar: List[Proceso] = []
+        for p in procesos:
+            if p.tiempo_final > 0:
+                planificados.append(p)
+            else:
+                self.sin_planificar.append(p)
+
+        self._por_inicio: List[Proceso] = sorted(planificados, key=lambda p: p.tiempo_inicio)
+        self._inicios: List[int] = [p.tiempo_inicio for p in self._por_inicio]
+        self._por_final: List[Proceso] = sorted(planificados, key=lambda p: p.tiempo_final)
+        self._finales: List[int] = [p.tiempo_final for p in self._por_final]
+        self._por_llegada: List[Proceso] = sorted(procesos, key=lambda p: p.tiempo_llegada)
+        self._llegadas: List[int] = [p.tiempo_llegada for p in self._por_llegada]
+
+        # Cortes de los procesos expulsados: fin de cada tramo salvo el último
+        # (expulsión) e inicio de cada tramo salvo el primero (reanudación)
+        cortes_fin: List[Tuple[int, int, Proceso]] = []
+        cortes_inicio: List[Tuple[int, int, Proceso]] = []
+        for n, p in enumerate(planificados):
+            tramos = p.segmentos
+            for j in range(1, len(tramos)):
+                cortes_fin.append((tramos[j - 1][1], n, p))
+                cortes_inicio.append((tramos[j][0], n, p))
+        cortes_fin.sort(key=lambda c: (c[0], c[1]))
+        cortes_inicio.sort(key=lambda c: (c[0], c[1]))
+        self._expulsiones: List[Proceso] = [c[2] for c in cortes_fin]
+        self._t_expulsiones: List[int] = [c[0] for c in cortes_fin]
+        self._reanudaciones: List[Proceso] = [c[2] for c in cortes_inicio]
+        self._t_reanudaciones: List[int] = [c[0] for c in cortes_inicio]
+
+        # Partición greedy en carriles: cada intervalo va al carril que quedó libre antes
+        intervalos: List[Tuple[int, int, Proceso]] = sorted(
+            (seg for p in planificados for seg in self._segmentos(p)),
+            key=lambda seg: seg[0]
+        )
+        self._carriles: List[Tuple[List[int], List[Tuple[int, int, Proceso]]]] = []
+        libres: List[Tuple[int, int]] = []  # (final del último intervalo, índice de carril)
+        for seg in intervalos:
+            inicio, final, _ = seg
+            if libres and libres[0][0] <= inicio:
+                _, carril = heapq.heappop(libres)
+            else:
+                carril = len(self._carriles)
+                self._carriles.append(([], []))
+            self._carriles[carril][0].append(inicio)
+            self._carriles[carril][1].append(seg)
+            heapq.heappush(libres, (final, carril))
+
+    @staticmethod
+    def _segmentos(p: Proceso) -> List[Tuple[int, int, Proceso]]:
+        return [(inicio, fin, p) for inicio, fin in p.tramos()]
+
+    def __len__(self) -> int:
+        return len(self._por_inicio) + len(self.sin_planificar)
+
+    @property
+    def tiempo_final_max(self) -> int:
+        return self._finales[-1] if self._finales else 0
+
+    def en_ejecucion(self, t: int) -> List[Proceso]:
+        """Procesos que se ejecutan en el instante t (inicio <= t < final)"""
+        activos: List[Proceso] = []
+        for inicios, segmentos in self._carriles:
+            i = bisect_right(inicios, t) - 1
+            if i >= 0 and t < segmentos[i][1]:
+                activos.append(segmentos[i][2])
+        return activos
+
+    def pendientes(self, t: int) -> List[Proceso]:
+        """Procesos que aún no han comenzado en t (o que no tienen planificación)"""
+        return self._por_inicio[bisect_right(self._inicios, t):] + self.sin_planificar
+
+    def finalizados(self, t: int) -> List[Proceso]:
+        """Procesos que terminaron en t o antes"""
+        return self._por_final[:bisect_right(self._finales, t)]
+
+    def llegan_en(self, t: int) -> List[Proceso]:
+        """Procesos cuya llegada es exactamente t"""
+        return self._por_llegada[bisect_left(self._llegadas, t):bisect_right(self._llegadas, t)]
+
+    def inician_en(self, t: int) -> List[Proceso]:
+        """Procesos despachados exactamente en t"""
+        return self._por_inicio[bisect_left(self._inicios, t):bisect_right(self._inicios, t)]
+
+    def finalizan_en(self, t: int) -> List[Proceso]:
+        """Procesos que terminan exactamente en t"""
+        return self._por_final[bisect_left(self._finales, t):bisect_right(self._finales, t)]
+
+    def eventos_entre(self, desde: int, hasta: int) -> Tuple[List[Proceso], List[Proceso], List[Proceso]]:
+        """(llegadas, despachos, finalizaciones) con instante en (desde, hasta], ordenados por tiempo"""
+        return (
+            self._por_llegada[bisect_right(self._llegadas, desde):bisect_right(self._llegadas, hasta)],
+            self._por_inicio[bisect_right(self._inicios, desde):bisect_right(self._inicios, hasta)],
+            self._por_final[bisect_right(self._finales, desde):bisect_right(self._finales, hasta)],
+        )
+
+    def expulsados_en(self, t: int) -> List[Proceso]:
+        """Procesos que dejan la CPU sin terminar exactamente en t"""
+        return self._expulsiones[bisect_left(self._t_expulsiones, t):bisect_right(self._t_expulsiones, t)]
+
+    def reanudan_en(self, t: int) -> List[Proceso]:
+        """Procesos expulsados que vuelven a la CPU exactamente en t"""
+        return self._reanudaciones[bisect_left(self._t_reanudaciones, t):bisect_right(self._t_reanudaciones, t)]
+
+    def cortes_entre(self, desde: int, hasta: int) -> Tuple[List[Tuple[int, Proceso]], List[Tuple[int, Proceso]]]:
+        """(expulsiones, reanudaciones) como pares (instante, proceso) en (desde, hasta]"""
+        a, b = bisect_right(self._t_expulsiones, desde), bisect_right(self._t_expulsiones, hasta)
+        c, d = bisect_right(self._t_reanudaciones, desde), bisect_right(self._t_reanudaciones, hasta)
+        return (
+            list(zip(self._t_expulsiones[a:b], self._expulsiones[a:b])),
+            list(zip(self._t_reanudaciones[c:d], self._reanudaciones[c:d])),
+        )
+
+    def contar_finalizados(self, t: int) -> int:
+        return bisect_right(self._finales, t)
+
+    def contar_pendientes(self, t: int) -> int:
+        return len(self._inicios) - bisect_right(self._inicios, t) + len(self.sin_planificar)
@@ -0,0 +1,294 @@
+import logging
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Sequence, Tuple
+from model.planificador import (
+    INFINITO, EntradaSalida, Planificador, agregar_tramo, cerrar_proceso, progreso_previo, proximo_despacho,
+)
+from model.proceso import Proceso
+
+logger = logging.getLogger("fcfs.mlfq")
+
+
+def repartir_por_nivel(ejecutado: int, duracion: int, quantums: Sequence[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Reparte `duracion` unidades de CPU entre niveles para un proceso que ya
+    ejecutó `ejecutado` desde su llegada o el último boost: cada nivel dura su
+    quantum y el último no tiene límite. Produce pares (nivel, unidades).
+    """
+    ultimo = len(quantums) - 1
+    nivel = 0
+    while nivel < ultimo and ejecutado >= quantums[nivel]:
+        ejecutado -= quantums[nivel]
+        nivel += 1
+    while duracion > 0:
+        parte = duracion if nivel == ultimo else min(duracion, quantums[nivel] - ejecutado)
+        yield nivel, parte
+        duracion -= parte
+        ejecutado = 0
+        nivel += 1
+
+
+def estado_en(tramos: Iterable[Tuple[int, int]], tiempo: int, quantums: Sequence[int],
+              periodo_boost: int) -> Tuple[int, int]:
+    """
+    Nivel y parte del turno ya usada en `tiempo` de un proceso con esos tramos
+    previos: se deducen de lo ejecutado desde el último boost, porque solo el
+    boost devuelve un proceso al nivel 0 y solo agotar el turno lo baja.
+    """
+    desde = tiempo - tiempo % periodo_boost if periodo_boost else 0
+    ejecutado = sum(max(0, min(fin, tiempo) - max(inicio, desde)) for inicio, fin in tramos)
+    ultimo = len(quantums) - 1
+    nivel = 0
+    while nivel < ultimo and ejecutado >= quantums[nivel]:
+        ejecutado -= quantums[nivel]
+        nivel += 1
+    return nivel, ejecutado % quantums[ultimo] if nivel == ultimo else ejecutado
+
+
+def ocupacion_por_nivel(procesos: Iterable[Proceso], quantums: Sequence[int],
+                        periodo_boost: int = 0) -> List[int]:
+    """Unidades de CPU ejecutadas en cada nivel, reconstruidas a partir de los tramos"""
+    ocupacion = [0] * len(quantums)
+    for p in procesos:
+        if p.tiempo_final <= 0:
+            continue
+        ejecutado, desde = 0, 0
+        for inicio, fin in p.tramos():
+            while inicio < fin:
+                # Partir en los boosts: cada uno reinicia lo ejecutado
+                corte = fin
+                if periodo_boost:
+                    boost = inicio - inicio % periodo_boost
+                    if boost > desde:
+                        ejecutado, desde = 0, boost
+                    corte = min(fin, boost + periodo_boost)
+                for nivel, unidades in repartir_por_nivel(ejecutado, corte - inicio, quantums):
+                    ocupacion[nivel] += unidades
+                ejecutado += corte - inicio
+                inicio = corte
+    return ocupacion
+
+
+class _ColaNivel:
+    """
+    Cola FIFO de un nivel formada por deques encadenados, para que el boost
+    pueda pasar niveles enteros al nivel 0 en O(1) en lugar de proceso a proceso
+    """
+
+    __slots__ = ("_partes",)
+
+    def __init__(self) -> None:
+        self._partes: Deque[Deque[int]] = deque([deque()])
+
+    def __bool__(self) -> bool:
+        return bool(self._partes[0])  # La primera parte solo está vacía si todas lo están
+
+    def append(self, k: int) -> None:
+        self._partes[-1].append(k)
+
+    def appendleft(self, k: int) -> None:
+        self._partes[0].appendleft(k)
+
+    def popleft(self) -> int:
+        primera = self._partes[0]
+        k = primera.popleft()
+        if not primera and len(self._partes) > 1:
+            self._partes.popleft()
+        return k
+
+    def absorber(self, otra: "_ColaNivel") -> None:
+        """Mueve todos los procesos de `otra` al final de esta cola"""
+        if not otra:
+            return
+        if not self:
+            self._partes.clear()
+        self._partes.extend(otra._partes)
+        otra._partes = deque([deque()])
+
+
+class MLFQ(Planificador):
+    """
+    Cola multinivel con retroalimentación: un deque FIFO por nivel (0 = mayor
+    prioridad) con su propio quantum. Los procesos llegan al nivel 0, bajan un
+    nivel al agotar el turno del suyo (el último es Round Robin) y una llegada
+    a un nivel superior expulsa al proceso en CPU, que vuelve al frente de su
+    cola conservando lo que usó del turno. Un proceso que se bloquea en E/S
+    vuelve a la cola de su nivel, también conservando lo usado (ceder la CPU
+    antes de agotar el turno no evita bajar). Cada `periodo_boost` unidades
+    todos los procesos suben al nivel 0. Toda operación de cola es O(1), también el
+    boost (O(niveles)): lo usado del turno se invalida con un contador de boosts.
+    """
+
+    def __init__(self, quantums: Sequence[int] = (2, 4, 8), periodo_boost: int = 0) -> None:
+        super().__init__()
+        self.tiempo_inicial: int = 0  # Para soportar ejecución dinámica
+        self.quantums = tuple(quantums)
+        self.periodo_boost = periodo_boost
+        self.expulsivo = True
+        self.conserva_progreso = True
+
+    def firma_parametros(self) -> str:
+        return f"|mlfq={','.join(map(str, self.quantums))}|boost={self.periodo_boost}"
+
+    def run(self) -> List[Proceso]:
+        """Implementa MLFQ con soporte para ejecución dinámica"""
+        procesos = list(self.lista_procesos)
+        if not procesos:
+            return []
+
+        quantums, periodo = self.quantums, self.periodo_boost
+        ultimo_nivel = len(quantums) - 1
+        tiempo_actual = max(self.tiempo_inicial, 0)
+        procesos.sort(key=lambda p: p.tiempo_llegada)
+        n = len(procesos)
+        tramos, restante = progreso_previo(procesos, tiempo_actual)
+        # Parte del turno del nivel actual ya consumida; vale solo si se fijó después del último boost
+        usado: List[int] = [0] * n
+        epoca_usado: List[int] = [0] * n
+        epoca = 0  # Cantidad de boosts
+        colas: List[_ColaNivel] = [_ColaNivel() for _ in quantums]
+        es = EntradaSalida(procesos, tramos, restante)
+        con_es = es.activa
+        nivel_es: List[int] = [0] * n  # Nivel al que vuelve cada bloqueado si no hubo boost
+
+        i = 0
+        if tiempo_actual > 0:
+            i = self._reconstruir_colas(procesos, tramos, restante, usado, colas, tiempo_actual, es, nivel_es)
+        proximo_boost = (tiempo_actual // periodo + 1) * periodo if periodo else INFINITO
+
+        # Los que ya se ejecutaron antes del instante conservan su orden de primer despacho
+        retorno: List[Proceso] = []
+        despachado = bytearray(n)
+        for _, k in sorted((tramos[k][0][0], k) for k in range(n) if tramos[k]):
+            despachado[k] = 1
+            retorno.append(procesos[k])
+
+        def encolar(hasta: int) -> None:
+            """
+            Encola, en orden de tiempo, las llegadas en el nivel 0 y los que terminaron su E/S
+            en su nivel (en el 0 si hubo un boost mientras estaban bloqueados)
+            """
+            nonlocal i
+            while True:
+                vuelta = es.proximo() if con_es else INFINITO
+                tope = min(hasta, vuelta)
+                while i < n and procesos[i].tiempo_llegada <= tope:
+                    colas[0].append(i)
+                    i += 1
+                if vuelta > hasta:
+                    return
+                for j, _ in es.desbloquear(int(vuelta)):
+                    colas[nivel_es[j] if epoca_usado[j] == epoca else 0].append(j)
+
+        while True:
+            if con_es:
+                encolar(tiempo_actual)
+            else:
+                while i < n and procesos[i].tiempo_llegada <= tiempo_actual:
+                    colas[0].append(i)
+                    i += 1
+
+            if tiempo_actual >= proximo_boost:
+                # Boost: todos los niveles pasan al final del 0, en orden de nivel
+                for cola in colas[1:]:
+                    colas[0].absorber(cola)
+                epoca += 1
+                proximo_boost = (tiempo_actual // periodo + 1) * periodo
+
+            actual = next((n_cola for n_cola, cola in enumerate(colas) if cola), -1)
+            if actual < 0:
+                if i == n and not es.cola:
+                    break
+                # Con procesos en E/S, un boost mientras tanto los devuelve al nivel 0
+                tiempo_actual = int(min(procesos[i].tiempo_llegada if i < n else INFINITO, es.proximo(),
+                                        proximo_boost if es.cola else INFINITO))
+                continue
+
+            k = colas[actual].popleft()
+            if epoca_usado[k] != epoca:
+                usado[k], epoca_usado[k] = 0, epoca
+            if not despachado[k]:
+                despachado[k] = 1
+                retorno.append(procesos[k])
+
+            # Corre hasta terminar la ráfaga, agotar el turno, una llegada o vuelta de E/S
+            # (si no está en el nivel 0) o un boost
+            fin_turno = tiempo_actual + quantums[actual] - usado[k]
+            llegada = procesos[i].tiempo_llegada if i < n and actual > 0 else INFINITO
+            rafaga = restante[k]
+            if con_es:
+                rafaga = es.cpu_hasta_bloqueo(k, rafaga)
+                if actual > 0:
+                    llegada = min(llegada, es.proximo())
+            fin = int(min(tiempo_actual + rafaga, fin_turno, llegada, proximo_boost))
+            agregar_tramo(tramos[k], tiempo_actual, fin)
+            restante[k] -= fin - tiempo_actual
+            usado[k] += fin - tiempo_actual
+            tiempo_actual = fin
+
+            if restante[k] <= 0:
+                cerrar_proceso(procesos[k], tramos[k])
+                continue
+            nivel = actual
+            if fin == fin_turno:
+                usado[k] = 0
+                nivel = min(actual + 1, ultimo_nivel)
+            if con_es and es.bloquear(k, restante[k], fin):
+                nivel_es[k] = nivel
+            elif fin == fin_turno:
+                # Los que llegan o vuelven de E/S en este instante se encolan antes que el degradado
+                encolar(tiempo_actual)
+                colas[nivel].append(k)
+            else:
+                colas[actual].appendleft(k)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in retorno:
+                logger.debug(
+                    "[MLFQ] Proceso %s: Rafaga: %d | Tramos: %s | Retorno: %d, Espera: %d, Respuesta: %d",
+                    p.nombre, p.rafaga, p.tramos(), p.tiempo_retorno, p.tiempo_espera, p.tiempo_respuesta
+                )
+        self.marcar_cambio()
+        return retorno
+
+    def _reconstruir_colas(
+        self,
+        procesos: List[Proceso],
+        tramos: List[List[Tuple[int, int]]],
+        restante: List[int],
+        usado: List[int],
+        colas: List[_ColaNivel],
+        tiempo: int,
+        es: EntradaSalida,
+        nivel_es: List[int],
+    ) -> int:
+        """
+        Al replanificar en plena ejecución, reconstruye las colas en `tiempo`:
+        el nivel de cada proceso se deduce de sus tramos previos y, dentro de
+        cada nivel, se conserva el orden de despacho de la planificación
+        anterior (el proceso en CPU primero). Los nuevos van al final del
+        nivel 0, por llegada; los bloqueados en E/S vuelven a su nivel
+        (`nivel_es`) al terminarla. Retorna el próximo proceso a encolar.
+        """
+        # Los que ya volvieron de su E/S esperan en su nivel como los demás
+        for _ in es.desbloquear(tiempo):
+            pass
+        i = 0
+        esperando: List[Tuple[int, float, int, int]] = []
+        while i < len(procesos) and procesos[i].tiempo_llegada <= tiempo:
+            p = procesos[i]
+            if restante[i] > 0:
+                nivel, usado[i] = estado_en(tramos[i], tiempo, self.quantums, self.periodo_boost)
+                if es.bloqueado(i):
+                    nivel_es[i] = nivel
+                elif p.tiempo_final > tiempo:
+                    # Planificado antes: su orden es el del próximo despacho previsto
+                    proximo = proximo_despacho(p, tiempo)
+                    esperando.append((nivel, proximo, 0, i))
+                else:
+                    esperando.append((nivel, INFINITO, p.tiempo_llegada, i))
+            i += 1
+        esperando.sort()
+        for n_cola, _, _, k in esperando:
+            colas[n_cola].append(k)
+        return i
@@ -1,26 +1,483 @@
+import heapq
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import List
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
 from model.proceso import Proceso
 
+INFINITO = float("inf")
+
+# Entrada de una cola de listos: (clave, llegada, posición, proceso); el heap
+# ordena por clave y desempata por llegada y por posición (orden estable)
+EntradaListo = Tuple[Any, int, int, Proceso]
+
+
+def tramos_previos(proceso: Proceso, tiempo: int) -> List[Tuple[int, int]]:
+    """Tramos que el proceso ya ejecutó antes de `tiempo` (al replanificar en plena ejecución)"""
+    if proceso.tiempo_final <= 0 or proceso.tiempo_inicio >= tiempo:
+        return []
+    return [(inicio, min(fin, tiempo)) for inicio, fin in proceso.tramos() if inicio < tiempo]
+
+
+def progreso_previo(procesos: Sequence[Proceso], tiempo: int,
+                    conserva: bool = True) -> Tuple[List[List[Tuple[int, int]]], List[int]]:
+    """
+    Tramos ya ejecutados antes de `tiempo` y CPU restante de cada proceso, al
+    replanificar en plena ejecución. Sin `conserva`, solo los de los procesos
+    con E/S (los demás se replanifican desde cero).
+    """
+    if tiempo <= 0:
+        return [[] for _ in procesos], [p.rafaga for p in procesos]
+    tramos = [tramos_previos(p, tiempo) if conserva or p.secuencia else [] for p in procesos]
+    restante = [
+        p.rafaga - sum(fin - inicio for inicio, fin in previos) if previos else p.rafaga
+        for p, previos in zip(procesos, tramos)
+    ]
+    return tramos, restante
+
+
+def proximo_despacho(proceso: Proceso, tiempo: int) -> int:
+    """Inicio del primer tramo planificado que termina después de `tiempo` (anterior si está en CPU), o -1"""
+    return next((inicio for inicio, fin in proceso.tramos() if fin > tiempo), -1)
+
+
+def en_cpu(procesos: Sequence[Proceso], tramos: List[List[Tuple[int, int]]], tiempo: int) -> int:
+    """
+    Posición del proceso que la planificación anterior tenía en CPU en
+    `tiempo` (su último tramo previo termina ahí y el planificado sigue), o -1
+    """
+    for k, (p, previos) in enumerate(zip(procesos, tramos)):
+        if previos and previos[-1][1] == tiempo and -1 < proximo_despacho(p, tiempo) < tiempo:
+            return k
+    return -1
+
+
+def encolado_antes(proceso: Proceso, previos: List[Tuple[int, int]]) -> int:
+    """Instante en que el proceso entró a la cola tras los tramos `previos`: llegada, expulsión o fin de E/S"""
+    if not previos:
+        return proceso.tiempo_llegada
+    fin = previos[-1][1]
+    restante = proceso.rafaga - sum(f - i for i, f in previos)
+    for restante_bloqueo, duracion in bloqueos_es(proceso):
+        if restante_bloqueo == restante:
+            return fin + duracion
+    return fin
+
+
+def agregar_tramo(tramos: List[Tuple[int, int]], inicio: int, fin: int) -> None:
+    """Agrega un tramo de ejecución, uniéndolo al anterior si son contiguos"""
+    if tramos and tramos[-1][1] == inicio:
+        tramos[-1] = (tramos[-1][0], fin)
+    else:
+        tramos.append((inicio, fin))
+
+
+def cerrar_proceso(proceso: Proceso, tramos: List[Tuple[int, int]]) -> None:
+    """Fija los tiempos del proceso a partir de sus tramos de ejecución"""
+    proceso.tiempo_inicio = tramos[0][0]
+    proceso.tiempo_final = tramos[-1][1]
+    proceso.tiempo_retorno = proceso.tiempo_final - proceso.tiempo_llegada
+    proceso.tiempo_espera = proceso.tiempo_retorno - proceso.rafaga - proceso.tiempo_es
+    proceso.segmentos = tramos if len(tramos) > 1 else []
+    proceso.nucleo = 0
+    proceso.nucleos_tramos = []
+
+
+def bloqueos_es(proceso: Proceso) -> List[Tuple[int, int]]:
+    """(CPU restante al bloquearse, duración de la E/S) de cada ráfaga de E/S del proceso, en orden"""
+    restante = proceso.rafaga
+    bloqueos: List[Tuple[int, int]] = []
+    for cpu, es in zip(proceso.secuencia[::2], proceso.secuencia[1::2]):
+        restante -= cpu
+        bloqueos.append((restante, es))
+    return bloqueos
+
+
+class EntradaSalida:
+    """
+    Ráfagas de E/S de los procesos de una planificación, por posición. Un
+    proceso que agota una ráfaga de CPU que no es la última se bloquea durante
+    la ráfaga de E/S siguiente: pasa a la cola de espera de E/S (heap por el
+    instante en que termina) y al terminarla vuelve a la cola de listos.
+
+    Al replanificar en plena ejecución, la ráfaga en curso de cada proceso se
+    deduce de lo que ya ejecutó: si agotó una ráfaga antes de tiempo_inicial,
+    está (o estuvo) en E/S desde el fin de su último tramo.
+    """
+
+    __slots__ = ("_bloqueos", "_siguiente", "_bloqueado", "cola", "activa")
+
+    def __init__(self, procesos: Sequence[Proceso], tramos: List[List[Tuple[int, int]]],
+                 restante: List[int]) -> None:
+        n = len(procesos)
+        self._bloqueado = bytearray(n)
+        self.cola: List[Tuple[int, int]] = []  # (fin de la E/S, posición)
+        # Sin E/S los núcleos se ahorran toda consulta: la ráfaga actual es todo lo que resta
+        self.activa = any(p.secuencia for p in procesos)
+        self._bloqueos: List[List[Tuple[int, int]]] = []
+        self._siguiente: List[int] = []  # Próxima ráfaga de E/S de cada proceso
+        if not self.activa:
+            return
+        self._bloqueos = [bloqueos_es(p) if p.secuencia else [] for p in procesos]
+        self._siguiente = [0] * n
+        for k, bloqueos in enumerate(self._bloqueos):
+            j = 0
+            while j < len(bloqueos) and bloqueos[j][0] > restante[k]:
+                j += 1
+            self._siguiente[k] = j
+            if tramos[k]:
+                self.bloquear(k, restante[k], tramos[k][-1][1])
+
+    def cpu_hasta_bloqueo(self, k: int, restante: int) -> int:
+        """CPU que le queda al proceso en su ráfaga actual"""
+        if not self.activa:
+            return restante
+        bloqueos, j = self._bloqueos[k], self._siguiente[k]
+        return restante - bloqueos[j][0] if j < len(bloqueos) else restante
+
+    def bloquear(self, k: int, restante: int, tiempo: int) -> bool:
+        """Si el proceso acaba de agotar una ráfaga que no es la última, lo bloquea en E/S"""
+        if not self.activa:
+            return False
+        bloqueos, j = self._bloqueos[k], self._siguiente[k]
+        if j >= len(bloqueos) or bloqueos[j][0] != restante:
+            return False
+        heapq.heappush(self.cola, (tiempo + bloqueos[j][1], k))
+        self._siguiente[k] = j + 1
+        self._bloqueado[k] = 1
+        return True
+
+    def bloqueado(self, k: int) -> bool:
+        return bool(self._bloqueado[k])
+
+    def proximo(self) -> float:
+        """Instante en que termina la próxima E/S (infinito si no hay ninguna pendiente)"""
+        return self.cola[0][0] if self.cola else INFINITO
+
+    def desbloquear(self, tiempo: int) -> Iterator[Tuple[int, int]]:
+        """Saca de la cola de E/S los que terminaron hasta `tiempo`: produce (posición, fin de la E/S)"""
+        cola = self.cola
+        while cola and cola[0][0] <= tiempo:
+            fin, k = heapq.heappop(cola)
+            self._bloqueado[k] = 0
+            yield k, fin
+
+
+def ejecutar_expulsivo(
+    procesos: List[Proceso],
+    tiempo_inicial: int,
+    clave: Callable[[Proceso, int, int], Any],
+    expulsa: Callable[[EntradaListo, EntradaListo, int, int], bool],
+) -> List[Proceso]:
+    """
+    Núcleo dirigido por eventos de los planificadores expulsivos de una CPU.
+
+    El proceso en CPU corre hasta terminar su ráfaga o hasta el próximo
+    evento (una llegada o el fin de una E/S); solo en esos eventos se consulta
+    `expulsa(actual, primero_listo, inicio_tramo, t)`. Cada evento y cada
+    expulsión cuesta una operación de heap: O(n log n) en total.
+    `clave(proceso, restante, encolado)` da la clave del heap al encolar
+    (restante es lo que le queda de la ráfaga de CPU actual; encolado, la
+    llegada o el instante en que vuelve a la cola).
+
+    Al replanificar en plena ejecución se conserva lo que cada proceso ya
+    ejecutó antes de tiempo_inicial, y la planificación anterior da el estado
+    de la cola: cada proceso en espera vuelve a encolarse en el instante en
+    que entró a ella (el de su expulsión, si ya ejecutó) y el que estaba en
+    CPU retoma su tramo con la clave con que fue despachado, así que las
+    claves que dependen de la espera (p. ej. el envejecimiento) no se
+    reinician. Ordena `procesos` por llegada y retorna los procesos en orden
+    de primer despacho.
+    """
+    tiempo_actual = max(tiempo_inicial, 0)
+    procesos.sort(key=lambda p: p.tiempo_llegada)
+    # Estado por posición en `procesos` (la posición viaja en las entradas del heap)
+    tramos, restante = progreso_previo(procesos, tiempo_actual)
+    es = EntradaSalida(procesos, tramos, restante)
+    con_es = es.activa
+    despachado = bytearray(len(procesos))
+    # Instante en que cada uno entró a la cola (los bloqueados en E/S vuelven al terminarla)
+    encolado = [previos[-1][1] if previos else p.tiempo_llegada for p, previos in zip(procesos, tramos)]
+
+    listos: List[EntradaListo] = []
+    retorno: List[Proceso] = []
+    actual: EntradaListo | None = None  # Entrada del heap del proceso en CPU
+    inicio_tramo = 0
+    i = 0
+    n = len(procesos)
+
+    reanudado = en_cpu(procesos, tramos, tiempo_actual)
+    if reanudado >= 0:
+        # Retoma el tramo en curso; los eventos desde tiempo_inicial (incluido) se
+        # atienden como si hubiera seguido en CPU
+        p = procesos[reanudado]
+        inicio_tramo = tramos[reanudado].pop()[0]
+        restante[reanudado] += tiempo_actual - inicio_tramo
+        rafaga = es.cpu_hasta_bloqueo(reanudado, restante[reanudado]) if con_es else restante[reanudado]
+        actual = (clave(p, rafaga, encolado_antes(p, tramos[reanudado])), p.tiempo_llegada, reanudado, p)
+        despachado[reanudado] = 1
+        retorno.append(p)
+        tiempo_actual -= 1
+
+    def encolar(tiempo: int) -> None:
+        """Encola las llegadas y los fines de E/S hasta `tiempo`"""
+        nonlocal i
+        if not con_es:
+            while i < n and procesos[i].tiempo_llegada <= tiempo:
+                p = procesos[i]
+                if i != reanudado:
+                    heapq.heappush(listos, (clave(p, restante[i], encolado[i]), p.tiempo_llegada, i, p))
+                i += 1
+            return
+        while i < n and procesos[i].tiempo_llegada <= tiempo:
+            p = procesos[i]
+            if not es.bloqueado(i) and i != reanudado:
+                heapq.heappush(listos, (clave(p, es.cpu_hasta_bloqueo(i, restante[i]), encolado[i]),
+                                        p.tiempo_llegada, i, p))
+            i += 1
+        for k, fin in es.desbloquear(tiempo):
+            p = procesos[k]
+            heapq.heappush(listos, (clave(p, es.cpu_hasta_bloqueo(k, restante[k]), fin), fin, k, p))
+
+    while True:
+        if i < n and procesos[i].tiempo_llegada <= tiempo_actual or con_es:
+            encolar(tiempo_actual)
+
+        if actual is None:
+            if not listos:
+                if i == n and not es.cola:
+                    break
+                tiempo_actual = int(min(procesos[i].tiempo_llegada if i < n else INFINITO, es.proximo()))
+                continue
+            actual = heapq.heappop(listos)
+            inicio_tramo = tiempo_actual
+            if not despachado[actual[2]]:
+                despachado[actual[2]] = 1
+                retorno.append(actual[3])
+
+        k, p = actual[2], actual[3]
+        fin = inicio_tramo + max(es.cpu_hasta_bloqueo(k, restante[k]) if con_es else restante[k], 0)
+        evento = procesos[i].tiempo_llegada if i < n else INFINITO
+        if con_es:
+            evento = min(evento, es.proximo())
+        if evento < fin:
+            # Un evento antes de terminar la ráfaga: encolar y ver si expulsa al actual
+            tiempo_actual = int(evento)
+            encolar(tiempo_actual)
+            if expulsa(actual, listos[0], inicio_tramo, tiempo_actual):
+                agregar_tramo(tramos[k], inicio_tramo, tiempo_actual)
+                restante[k] -= tiempo_actual - inicio_tramo
+                rafaga = es.cpu_hasta_bloqueo(k, restante[k]) if con_es else restante[k]
+                heapq.heappush(listos, (clave(p, rafaga, tiempo_actual), p.tiempo_llegada, k, p))
+                actual = None
+            continue
+
+        tiempo_actual = fin
+        agregar_tramo(tramos[k], inicio_tramo, fin)
+        restante[k] -= fin - inicio_tramo
+        if not (con_es and es.bloquear(k, restante[k], fin)):
+            cerrar_proceso(p, tramos[k])
+        actual = None
+
+    return retorno
+
+
+def ejecutar_no_expulsivo(
+    procesos: List[Proceso],
+    tiempo_inicial: int,
+    clave: Callable[[Proceso, int, int], Any],
+    nucleos: int = 1,
+    conserva_progreso: bool = True,
+) -> List[Proceso]:
+    """
+    Núcleo de los planificadores no expulsivos sobre `nucleos` CPUs con una
+    cola de listos global (heap por clave, llegada y posición). Los núcleos
+    están en un heap por el instante en que se liberan: el que se libera
+    primero toma al mejor de los que ya llegaron, así que cada despacho es
+    O(log n + log núcleos). `clave` es como en ejecutar_expulsivo.
+
+    Cada despacho corre la ráfaga de CPU actual completa. Un proceso que
+    vuelve de una E/S entra a la cola global como una llegada y lo toma el
+    primer núcleo libre: si cambia de núcleo, `nucleos_tramos` registra el de
+    cada tramo.
+
+    Con `conserva_progreso`, al replanificar en plena ejecución cada proceso
+    conserva lo que ya ejecutó antes de tiempo_inicial y el que estaba en CPU
+    termina su ráfaga en su núcleo; sin él, solo los procesos con E/S (de lo
+    ejecutado depende su ráfaga actual). Ordena `procesos` por llegada y
+    retorna los procesos en orden de primer despacho.
+    """
+    tiempo_inicial = max(tiempo_inicial, 0)
+    procesos.sort(key=lambda p: p.tiempo_llegada)
+    n = len(procesos)
+    tramos, restante = progreso_previo(procesos, tiempo_inicial, conserva_progreso)
+    es = EntradaSalida(procesos, tramos, restante)
+    con_es = es.activa
+    # Núcleo de cada tramo de los que hacen E/S (los previos, como en la planificación anterior)
+    nucleos_de = [p.nucleos_de_tramos()[:len(previos)]
+                  for p, previos in zip(procesos, tramos)] if con_es else []
+    libres = [(tiempo_inicial, nucleo) for nucleo in range(nucleos)]
+    listos: List[EntradaListo] = []
+
+    def despachar(k: int, tiempo: int, nucleo: int) -> int:
+        """Corre la ráfaga actual del proceso en el núcleo; retorna cuándo lo libera"""
+        p = procesos[k]
+        fin = tiempo + (es.cpu_hasta_bloqueo(k, restante[k]) if con_es else restante[k])
+        agregar_tramo(tramos[k], tiempo, fin)
+        restante[k] -= fin - tiempo
+        if con_es and len(nucleos_de[k]) < len(tramos[k]):
+            nucleos_de[k].append(nucleo)
+        if not (con_es and es.bloquear(k, restante[k], fin)):
+            cerrar_proceso(p, tramos[k])
+            p.nucleo = nucleo
+            if con_es and len(set(nucleos_de[k])) > 1:
+                p.nucleos_tramos = nucleos_de[k]
+        return fin
+
+    # Los que ya ejecutaron antes del instante conservan su orden de primer despacho;
+    # el que estaba en CPU (su último tramo llega al instante) termina su ráfaga
+    retorno: List[Proceso] = []
+    despachado = bytearray(n)
+    for _, k in sorted((tramos[k][0][0], k) for k in range(n) if tramos[k]):
+        despachado[k] = 1
+        retorno.append(procesos[k])
+        if restante[k] > 0 and not es.bloqueado(k) and tramos[k][-1][1] == tiempo_inicial:
+            nucleo = (nucleos_de[k][-1] if con_es and nucleos_de[k] else procesos[k].nucleo) % nucleos
+            libres[nucleo] = (max(libres[nucleo][0], despachar(k, tiempo_inicial, nucleo)), nucleo)
+    heapq.heapify(libres)
+
+    i = 0
+    reloj = tiempo_inicial  # Instante hasta el que ya se encolaron las llegadas
+    while libres:
+        libre, nucleo = heapq.heappop(libres)
+        # Un núcleo libre desde antes solo ve los procesos ya encolados en `reloj`
+        tiempo_actual = max(libre, reloj)
+        while True:
+            while i < n and procesos[i].tiempo_llegada <= tiempo_actual:
+                p = procesos[i]
+                if restante[i] > 0 and not despachado[i]:
+                    rafaga = es.cpu_hasta_bloqueo(i, restante[i]) if con_es else restante[i]
+                    heapq.heappush(listos, (clave(p, rafaga, p.tiempo_llegada), p.tiempo_llegada, i, p))
+                i += 1
+            if con_es:
+                for k, fin in es.desbloquear(tiempo_actual):
+                    p = procesos[k]
+                    heapq.heappush(listos, (clave(p, es.cpu_hasta_bloqueo(k, restante[k]), fin), fin, k, p))
+            if listos:
+                break
+            # Nada listo: salta a la próxima llegada; si antes termina una E/S lo vuelve
+            # a intentar entonces (otro núcleo puede tomar antes al que vuelve); sin eventos, se retira
+            llegada = procesos[i].tiempo_llegada if i < n else INFINITO
+            if llegada <= es.proximo():
+                if llegada == INFINITO:
+                    break
+                tiempo_actual = int(llegada)
+            else:
+                heapq.heappush(libres, (int(es.proximo()), nucleo))
+                break
+        if not listos:
+            continue
+
+        reloj = tiempo_actual
+        k = heapq.heappop(listos)[2]
+        if not despachado[k]:
+            despachado[k] = 1
+            retorno.append(procesos[k])
+        if con_es or tramos[k]:
+            fin = despachar(k, tiempo_actual, nucleo)
+        else:
+            # Sin E/S ni tramos previos corre de corrido: los tiempos se fijan directamente
+            p = procesos[k]
+            fin = tiempo_actual + restante[k]
+            restante[k] = 0
+            p.tiempo_inicio = tiempo_actual
+            p.tiempo_final = fin
+            p.tiempo_retorno = fin - p.tiempo_llegada
+            p.tiempo_espera = p.tiempo_retorno - p.rafaga
+            p.segmentos = []
+            p.nucleo = nucleo
+            p.nucleos_tramos = []
+        heapq.heappush(libres, (fin, nucleo))
+
+    return retorno
+
+
+class VistaProcesos(Sequence[Proceso]):
+    """
+    Vista de solo lectura, sin copias, sobre los procesos vivos de un planificador.
+    Expone el contador de versión del planificador para que los observadores
+    detecten cambios; la copia solo se hace al pedir snapshot() explícitamente.
+    """
+
+    __slots__ = ("_planificador",)
+
+    def __init__(self, planificador: "Planificador") -> None:
+        self._planificador = planificador
+
+    @property
+    def version(self) -> int:
+        return self._planificador.version
+
+    def __len__(self) -> int:
+        return len(self._planificador.lista_procesos)
+
+    def __iter__(self) -> Iterator[Proceso]:
+        return iter(self._planificador.lista_procesos)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        procesos = self._planificador.lista_procesos
+        if isinstance(index, slice):
+            inicio, fin, paso = index.indices(len(procesos))
+            if paso < 0:
+                return list(procesos)[index]
+            return list(islice(procesos, inicio, fin, paso))
+        return procesos[index]
+
+    def snapshot(self) -> List[Proceso]:
+        """Copia explícita de los procesos en su orden actual"""
+        return list(self._planificador.lista_procesos)
+
+
 class Planificador(ABC):
     def __init__(self) -> None:
         self.lista_procesos: deque[Proceso] = deque()
         self.observers = []
+        self.version: int = 0  # Se incrementa en cada cambio de lista_procesos
+        # Los planificadores expulsivos parten tramos; los que conservan progreso,
+        # al replanificar, respetan lo que cada proceso ya ejecutó antes de tiempo_inicial
+        self.expulsivo: bool = False
+        self.conserva_progreso: bool = False
+        # Núcleos de CPU: solo los planificadores no expulsivos reparten entre varios
+        self.nucleos: int = 1
+        self._vista = VistaProcesos(self)
+
+    def firma_parametros(self) -> str:
+        """Parámetros que afectan el resultado (parte de la clave de la caché)"""
+        return f"|cpu={self.nucleos}" if self.nucleos > 1 else ""
 
     def add_observer(self, observer) -> None:
         self.observers.append(observer)
 
     def notify_observers(self) -> None:
         for observer in self.observers:
-            observer.update_from_model(self.get_procesos())
+            observer.update_from_model(self._vista)
+
+    def marcar_cambio(self) -> None:
+        """Registra una modificación de los procesos (nueva versión)"""
+        self.version += 1
 
     def add_proceso(self, proceso: Proceso) -> None:
         self.lista_procesos.append(proceso)
+        self.marcar_cambio()
         self.notify_observers()
 
-    def get_procesos(self) -> List[Proceso]:
-        return list(self.lista_procesos)
+    def get_procesos(self) -> Sequence[Proceso]:
+        """Vista de solo lectura sobre los procesos (no copia)"""
+        return self._vista
+
+    def snapshot(self) -> List[Proceso]:
+        """Copia explícita de los procesos"""
+        return self._vista.snapshot()
 
     @abstractmethod
     def run(self) -> List[Proceso]:
@@ -30,10 +487,12 @@ class Planificador(ABC):
     def recalcular_tiempos(self, procesos: List[Proceso]) -> None:
         """Recalcula los tiempos de los procesos basado en el algoritmo específico"""
         self.lista_procesos = deque(iterable=procesos)
+        self.marcar_cambio()
         resultado: List[Proceso] = self.run()
         for i, p in enumerate(iterable=procesos):
             p.tiempo_inicio = resultado[i].tiempo_inicio
             p.tiempo_final = resultado[i].tiempo_final
             p.tiempo_retorno = resultado[i].tiempo_retorno
             p.tiempo_espera = resultado[i].tiempo_espera
+            p.segmentos = resultado[i].segmentos
         self.notify_observers()
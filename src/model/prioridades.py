@@ -1,11 +1,41 @@
+import logging
 from typing import List
-from model.planificador import Planificador
+from model.planificador import EntradaListo, Planificador, ejecutar_expulsivo, ejecutar_no_expulsivo
 from model.proceso import Proceso
 
+logger = logging.getLogger("fcfs.prioridades")
+
 class Prioridades(Planificador):
-    def __init__(self) -> None:
+    """
+    Planificación por prioridades (menor número = mayor prioridad), no expulsiva
+    o expulsiva, con envejecimiento opcional: la prioridad efectiva de un proceso
+    en espera mejora `envejecimiento` unidades por unidad de tiempo esperada,
+    lo que acota la inanición de los de baja prioridad.
+
+    Con envejecimiento, la prioridad efectiva en t de un proceso encolado en
+    t_enc es prioridad - tasa * (t - t_enc). Para comparar dos procesos en
+    espera el término tasa * t se cancela, así que basta ordenar el heap por la
+    clave fija prioridad + tasa * t_enc: no hay que recalcular ni reordenar
+    nada al avanzar el tiempo.
+    """
+
+    def __init__(self, expulsivo: bool = False, envejecimiento: float = 0.0, nucleos: int = 1) -> None:
         super().__init__()
         self.tiempo_inicial: int = 0  # Para soportar ejecución dinámica
+        self.expulsivo = expulsivo
+        self.conserva_progreso = expulsivo
+        self.envejecimiento = envejecimiento
+        self.nucleos = 1 if expulsivo else nucleos
+
+    def firma_parametros(self) -> str:
+        firma = super().firma_parametros()
+        return firma + f"|env={self.envejecimiento!r}" if self.envejecimiento else firma
+
+    def _clave(self, proceso: Proceso, encolado: int) -> float:
+        """Clave del heap de listos para un proceso encolado en el instante dado"""
+        if not self.envejecimiento:
+            return proceso.prioridad  # type: ignore[return-value]
+        return proceso.prioridad + self.envejecimiento * encolado  # type: ignore[operator]
 
     def run(self) -> List[Proceso]:
         """
@@ -20,59 +50,66 @@ class Prioridades(Planificador):
         if not procesos:
             return []
 
-        tiempo_actual = max(self.tiempo_inicial, 0)
-        retorno = []
-        procesos_pendientes = procesos.copy()
-
-        # Ordenar inicialmente por tiempo de llegada para procesamiento
-        procesos_pendientes.sort(key=lambda p: p.tiempo_llegada)
-
-        while procesos_pendientes:
-            # Encontrar procesos que ya han llegado
-            disponibles: List[Proceso] = [
-                p for p in procesos_pendientes 
-                if p.tiempo_llegada <= tiempo_actual
-            ]
-            
-            if not disponibles:
-                # Si no hay procesos disponibles, avanzar al siguiente tiempo de llegada
-                tiempo_actual = min(p.tiempo_llegada for p in procesos_pendientes)
-                continue
-
-            # Seleccionar el proceso con mayor prioridad (menor número = mayor prioridad)
-            siguiente = min(disponibles, key=lambda p: (p.prioridad, p.tiempo_llegada))
-            procesos_pendientes.remove(siguiente)
-
-            # Calcular tiempos
-            siguiente.tiempo_inicio = max(tiempo_actual, siguiente.tiempo_llegada, self.tiempo_inicial)
-            siguiente.tiempo_final = siguiente.tiempo_inicio + siguiente.rafaga
-            siguiente.tiempo_espera = siguiente.tiempo_inicio - siguiente.tiempo_llegada
-            siguiente.tiempo_retorno = siguiente.tiempo_final - siguiente.tiempo_llegada
-
-            retorno.append(siguiente)
-            tiempo_actual = siguiente.tiempo_final
-            
-            # Debug para seguimiento
-            print(f"[Prioridades] Proceso {siguiente.nombre} ejecutado:")
-            print(f"  Prioridad: {siguiente.prioridad}")
-            print(f"  Inicio: {siguiente.tiempo_inicio}, Final: {siguiente.tiempo_final}")
-            print(f"  Retorno: {siguiente.tiempo_retorno}, Espera: {siguiente.tiempo_espera}")
+        if self.expulsivo:
+            return self._run_expulsivo(procesos)
+
+        # Cola de listos en un heap por (clave, llegada, orden); con varios núcleos, cola global.
+        # Al replanificar se reprograma todo desde tiempo_inicial (salvo lo ya hecho con E/S)
+        retorno = ejecutar_no_expulsivo(
+            procesos, self.tiempo_inicial, lambda p, _, encolado: self._clave(p, encolado), self.nucleos,
+            conserva_progreso=False,
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in retorno:
+                logger.debug(
+                    "[Prioridades] Proceso %s ejecutado: Prioridad: %s | Núcleo: %d | Inicio: %d, "
+                    "Final: %d | Retorno: %d, Espera: %d",
+                    p.nombre, p.prioridad, p.nucleo, p.tiempo_inicio, p.tiempo_final,
+                    p.tiempo_retorno, p.tiempo_espera
+                )
 
+        self.marcar_cambio()
+        return retorno
+
+    def _run_expulsivo(self, procesos: List[Proceso]) -> List[Proceso]:
+        """
+        Prioridades expulsivas sobre el núcleo dirigido por eventos: en cada
+        llegada se compara la prioridad efectiva del primero en la cola con la
+        que tenía el proceso en CPU al ser despachado. Un proceso expulsado
+        vuelve a la cola como recién encolado (su espera empieza de nuevo).
+        """
+        tasa = self.envejecimiento
+
+        def expulsa(actual: EntradaListo, nuevo: EntradaListo, inicio_tramo: int, tiempo: int) -> bool:
+            return self.puede_ser_interrumpido(
+                actual[3], nuevo[3], actual[0] - tasa * inicio_tramo, nuevo[0] - tasa * tiempo
+            )
+
+        retorno = ejecutar_expulsivo(
+            procesos, self.tiempo_inicial, lambda p, _, encolado: self._clave(p, encolado), expulsa
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in retorno:
+                logger.debug(
+                    "[Prioridades expulsivo] Proceso %s: Prioridad: %s | Tramos: %s | "
+                    "Retorno: %d, Espera: %d, Respuesta: %d",
+                    p.nombre, p.prioridad, p.tramos(), p.tiempo_retorno, p.tiempo_espera,
+                    p.tiempo_respuesta
+                )
+        self.marcar_cambio()
         return retorno
 
     def recalcular_tiempos(self, procesos: List[Proceso], tiempo_actual: int = 0) -> None:
         """Recalcula los tiempos desde un punto específico en el tiempo"""
         self.tiempo_inicial = tiempo_actual
         self.lista_procesos.clear()
+        self.marcar_cambio()
         
         for proceso in procesos:
             if proceso.prioridad is not None:
                 # Resetear proceso si no ha comenzado o está en progreso
                 if proceso.tiempo_inicio >= tiempo_actual:
-                    proceso.tiempo_inicio = 0
-                    proceso.tiempo_final = 0
-                    proceso.tiempo_retorno = 0
-                    proceso.tiempo_espera = 0
+                    proceso.reiniciar_tiempos()
                 self.add_proceso(proceso)
         
         # Ejecutar algoritmo
@@ -86,22 +123,27 @@ class Prioridades(Planificador):
                     proceso_original.tiempo_final = proceso_resultado.tiempo_final
                     proceso_original.tiempo_retorno = proceso_resultado.tiempo_retorno
                     proceso_original.tiempo_espera = proceso_resultado.tiempo_espera
+                    proceso_original.segmentos = proceso_resultado.segmentos
                     break
 
     def get_proceso_actual(self, tiempo_actual: int) -> Proceso | None:
         """Retorna el proceso que debería estar ejecutándose en el tiempo dado"""
         for proceso in self.lista_procesos:
-            if proceso.tiempo_inicio <= tiempo_actual < proceso.tiempo_final:
+            if any(inicio <= tiempo_actual < fin for inicio, fin in proceso.tramos()):
                 return proceso
         return None
 
-    def puede_ser_interrumpido(self, proceso_actual: Proceso, nuevo_proceso: Proceso) -> bool:
+    def puede_ser_interrumpido(self, proceso_actual: Proceso, nuevo_proceso: Proceso,
+                               prioridad_actual: float | None = None,
+                               prioridad_nueva: float | None = None) -> bool:
         """
-        Determina si el proceso actual puede ser interrumpido por uno nuevo
-        En este caso, implementamos prioridades no expulsivas, pero se puede modificar
+        Determina si el proceso actual puede ser interrumpido por uno nuevo: solo
+        en modo expulsivo y si el nuevo tiene estrictamente mayor prioridad
+        (menor número); a igual prioridad el actual sigue en CPU. Con
+        envejecimiento se indican las prioridades efectivas de ambos.
         """
-        # Prioridades no expulsivas: el proceso actual no puede ser interrumpido
-        return False
-        
-        # Para prioridades expulsivas, descomentar la línea siguiente:
-        # return nuevo_proceso.prioridad < proceso_actual.prioridad
\ No newline at end of file
+        if prioridad_actual is None:
+            prioridad_actual = proceso_actual.prioridad
+        if prioridad_nueva is None:
+            prioridad_nueva = nuevo_proceso.prioridad
+        return self.expulsivo and prioridad_nueva < prioridad_actual  # type: ignore[operator]
@@ -1,5 +1,25 @@
+import re
+from typing import Any, List, Tuple
+
+
+def secuencia_rafagas(valor: Any) -> List[int]:
+    """
+    Valida una secuencia de ráfagas alternadas CPU, E/S, CPU, ..., CPU (texto
+    "5, 3, 4" o lista). Retorna [] para una sola ráfaga de CPU o un valor vacío.
+    """
+    if isinstance(valor, str):
+        valor = [v for v in re.split(r"[\s,;]+", valor.strip()) if v]
+    secuencia = [int(v) for v in valor or ()]
+    if any(v <= 0 for v in secuencia):
+        raise ValueError("Las ráfagas de CPU y E/S deben ser mayores que cero")
+    if secuencia and len(secuencia) % 2 == 0:
+        raise ValueError("La secuencia debe empezar y terminar con una ráfaga de CPU")
+    return secuencia if len(secuencia) > 1 else []
+
+
 class Proceso:
-    def __init__(self, nombre: str, tiempo_llegada: int, rafaga: int,algoritmo:str, prioridad: int | None = None) -> None:
+    def __init__(self, nombre: str, tiempo_llegada: int, rafaga: int,algoritmo:str, prioridad: int | None = None,
+                 plazo: int | None = None) -> None:
         """_summary_
 
         Args:
@@ -7,6 +27,7 @@ class Proceso:
             tiempo_llegada (int): Tiempo de llegada
             rafaga (int): Tiempo de duración (ráfaga)
             prioridad (int, opcional): Prioridad del proceso (menor valor = mayor prioridad)
+            plazo (int, opcional): Instante absoluto en que debería haber terminado (deadline)
         """
         self.nombre: str = nombre
         self.tiempo_llegada: int = tiempo_llegada # Tiempo de llegada
@@ -17,7 +38,84 @@ class Proceso:
         self.tiempo_espera : int= 0
         self.prioridad: int | None = prioridad  # Puede ser None si no aplica
         self.algoritmo: str = algoritmo
+        self.plazo: int | None = plazo  # None si el proceso no tiene plazo
+        # Tramos [inicio, fin) si el proceso fue expulsado; vacío si se ejecutó de corrido
+        self.segmentos: List[Tuple[int, int]] = []
+        self.nucleo: int = 0  # Núcleo (CPU) en que se ejecutó, si su algoritmo usa varios
+        # Núcleo de cada tramo si cambió de núcleo entre ráfagas de CPU (E/S); vacío si todos en `nucleo`
+        self.nucleos_tramos: List[int] = []
+        # Ráfagas alternadas CPU, E/S, ..., CPU; vacía si es una sola ráfaga de CPU.
+        # Con E/S, `rafaga` es la suma de las ráfagas de CPU
+        self.secuencia: List[int] = []
+
+    @property
+    def tiempo_respuesta(self) -> int:
+        """Tiempo desde la llegada hasta el primer despacho"""
+        return self.tiempo_inicio - self.tiempo_llegada
+
+    @property
+    def tardanza(self) -> int:
+        """Tiempo final menos plazo: positivo si lo incumplió, negativo (holgura) si no"""
+        return self.tiempo_final - self.plazo if self.plazo is not None else 0
+
+    @property
+    def tiempo_es(self) -> int:
+        """Tiempo total bloqueado en E/S"""
+        return sum(self.secuencia[1::2]) if self.secuencia else 0
+
+    def fijar_secuencia(self, secuencia: List[int]) -> None:
+        """Fija las ráfagas de CPU y E/S (ya validadas); la ráfaga pasa a ser el total de CPU"""
+        self.secuencia = list(secuencia) if len(secuencia) > 1 else []
+        if secuencia:
+            self.rafaga = sum(secuencia[::2])
+
+    def texto_secuencia(self) -> str:
+        """Secuencia como texto ("5, 3, 4"); vacío si es una sola ráfaga de CPU"""
+        return ", ".join(map(str, self.secuencia))
+
+    def tramos_es(self) -> List[Tuple[int, int]]:
+        """Intervalos [inicio, fin) bloqueado en E/S, deducidos de los tramos de CPU"""
+        if not self.secuencia or self.tiempo_final <= 0:
+            return []
+        limites = iter(zip(self.secuencia[:-1:2], self.secuencia[1::2]))
+        cpu, es = next(limites)
+        intervalos: List[Tuple[int, int]] = []
+        ejecutado = 0
+        for inicio, fin in self.tramos():
+            ejecutado += fin - inicio
+            if ejecutado == cpu:
+                intervalos.append((fin, fin + es))
+                siguiente = next(limites, None)
+                if siguiente is None:
+                    break
+                cpu, es = siguiente[0] + cpu, siguiente[1]
+        return intervalos
 
+    def tramos(self) -> List[Tuple[int, int]]:
+        """Intervalos de ejecución [inicio, fin), uno solo si no hubo expulsiones"""
+        return self.segmentos or [(self.tiempo_inicio, self.tiempo_final)]
 
+    def nucleos_de_tramos(self) -> List[int]:
+        """Núcleo en que corrió cada tramo de tramos()"""
+        return self.nucleos_tramos or [self.nucleo] * len(self.tramos())
 
+    def nucleo_en(self, tiempo: int) -> int:
+        """Núcleo del último tramo que empezó hasta `tiempo` (el del despacho en ese instante)"""
+        if not self.nucleos_tramos:
+            return self.nucleo
+        nucleo = self.nucleos_tramos[0]
+        for (inicio, _), n in zip(self.segmentos, self.nucleos_tramos):
+            if inicio > tiempo:
+                break
+            nucleo = n
+        return nucleo
 
+    def reiniciar_tiempos(self) -> None:
+        """Descarta la planificación calculada"""
+        self.tiempo_inicio = 0
+        self.tiempo_final = 0
+        self.tiempo_retorno = 0
+        self.tiempo_espera = 0
+        self.segmentos = []
+        self.nucleo = 0
+        self.nucleos_tramos = []
@@ -0,0 +1,204 @@
+import logging
+from collections import deque
+from typing import Deque, List, Tuple
+from model.planificador import (
+    INFINITO, EntradaSalida, Planificador, agregar_tramo, cerrar_proceso, progreso_previo, proximo_despacho,
+)
+from model.proceso import Proceso
+
+logger = logging.getLogger("fcfs.round_robin")
+
+
+class RoundRobin(Planificador):
+    """
+    Round Robin: cola FIFO de listos (deque) y turnos de `quantum` unidades. Al
+    agotar su turno el proceso vuelve al final de la cola, detrás de los que
+    llegaron durante el turno. Despachar un proceso distinto del último que
+    ocupó la CPU, sin que esta haya quedado ociosa, cuesta `cambio_contexto`
+    unidades sin ejecución. Un proceso que se bloquea en E/S pierde lo que le
+    quedaba del turno y al volver se encola al final. Cada turno es O(1) (más
+    O(log n) por E/S): O(n + turnos) en total.
+    """
+
+    def __init__(self, quantum: int = 4, cambio_contexto: int = 0) -> None:
+        super().__init__()
+        self.tiempo_inicial: int = 0  # Para soportar ejecución dinámica
+        self.quantum = quantum
+        self.cambio_contexto = cambio_contexto
+        self.expulsivo = True
+        self.conserva_progreso = True
+        self.cambios_contexto: int = 0  # Cambios cobrados en la última ejecución de run()
+
+    def firma_parametros(self) -> str:
+        return f"|q={self.quantum}|cc={self.cambio_contexto}"
+
+    def run(self) -> List[Proceso]:
+        """Implementa Round Robin con soporte para ejecución dinámica"""
+        procesos = list(self.lista_procesos)
+        if not procesos:
+            return []
+
+        quantum, costo = self.quantum, self.cambio_contexto
+        tiempo_actual = max(self.tiempo_inicial, 0)
+        procesos.sort(key=lambda p: p.tiempo_llegada)
+        n = len(procesos)
+        tramos, restante = progreso_previo(procesos, tiempo_actual)
+        es = EntradaSalida(procesos, tramos, restante)
+        con_es = es.activa
+
+        cola: Deque[int] = deque()
+        turno_restante = quantum  # Del turno del primer despacho (menor si se retoma uno en curso)
+        ultimo, fin_ultimo = -1, -1  # Último proceso que ocupó la CPU y cuándo la dejó
+        i = 0
+        if tiempo_actual > 0:
+            i, ultimo, fin_ultimo, turno_restante, tiempo_actual = self._reconstruir_cola(
+                procesos, tramos, restante, cola, tiempo_actual, es
+            )
+
+        # Los que ya se ejecutaron antes del instante conservan su orden de primer despacho
+        retorno: List[Proceso] = []
+        despachado = bytearray(n)
+        for _, k in sorted((tramos[k][0][0], k) for k in range(n) if tramos[k]):
+            despachado[k] = 1
+            retorno.append(procesos[k])
+        cambios = 0
+
+        def encolar(hasta: int) -> None:
+            """Encola, en orden de tiempo, las llegadas y los fines de E/S hasta `hasta`"""
+            nonlocal i
+            while True:
+                vuelta = es.proximo() if con_es else INFINITO
+                tope = min(hasta, vuelta)
+                while i < n and procesos[i].tiempo_llegada <= tope:
+                    cola.append(i)
+                    i += 1
+                if vuelta > hasta:
+                    return
+                cola.extend(k for k, _ in es.desbloquear(int(vuelta)))
+
+        while True:
+            if con_es:
+                encolar(tiempo_actual)
+            else:
+                while i < n and procesos[i].tiempo_llegada <= tiempo_actual:
+                    cola.append(i)
+                    i += 1
+
+            if not cola:
+                if i == n and not es.cola:
+                    break
+                tiempo_actual = int(min(procesos[i].tiempo_llegada if i < n else INFINITO, es.proximo()))
+                continue
+
+            k = cola.popleft()
+            inicio = tiempo_actual
+            if ultimo >= 0 and k != ultimo and tiempo_actual == fin_ultimo:
+                inicio += costo
+                cambios += 1
+            if not despachado[k]:
+                despachado[k] = 1
+                retorno.append(procesos[k])
+
+            # Sin nadie en cola ni eventos antes de terminar, corre la ráfaga entera sin partir turnos
+            rafaga = es.cpu_hasta_bloqueo(k, restante[k]) if con_es else restante[k]
+            evento = procesos[i].tiempo_llegada if i < n else INFINITO
+            if con_es:
+                evento = min(evento, es.proximo())
+            if not cola and evento >= inicio + rafaga:
+                duracion = rafaga
+            else:
+                duracion = min(turno_restante, rafaga)
+            turno_restante = quantum
+            fin = inicio + duracion
+            agregar_tramo(tramos[k], inicio, fin)
+            restante[k] -= duracion
+
+            # Los que llegaron o volvieron de E/S durante el turno van antes que el expulsado
+            if con_es:
+                encolar(fin)
+            else:
+                while i < n and procesos[i].tiempo_llegada <= fin:
+                    cola.append(i)
+                    i += 1
+            if restante[k] <= 0:
+                cerrar_proceso(procesos[k], tramos[k])
+            elif not (con_es and es.bloquear(k, restante[k], fin)):
+                cola.append(k)
+            ultimo, fin_ultimo, tiempo_actual = k, fin, fin
+
+        self.cambios_contexto = cambios
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in retorno:
+                logger.debug(
+                    "[Round Robin] Proceso %s: Rafaga: %d | Tramos: %s | Retorno: %d, Espera: %d, Respuesta: %d",
+                    p.nombre, p.rafaga, p.tramos(), p.tiempo_retorno, p.tiempo_espera, p.tiempo_respuesta
+                )
+        self.marcar_cambio()
+        return retorno
+
+    def _reconstruir_cola(
+        self,
+        procesos: List[Proceso],
+        tramos: List[List[Tuple[int, int]]],
+        restante: List[int],
+        cola: Deque[int],
+        tiempo: int,
+        es: EntradaSalida,
+    ) -> Tuple[int, int, int, int, int]:
+        """
+        Al replanificar en plena ejecución, reconstruye la cola de listos en
+        `tiempo` a partir de la planificación anterior: el proceso en CPU sigue
+        con lo que le queda de su turno y los demás conservan su orden de
+        despacho. Los nuevos van al final, por llegada; los bloqueados en E/S
+        se encolan al volver. Retorna (próximo a
+        encolar, último en CPU, fin de su tramo, turno restante, instante desde
+        el que seguir).
+        """
+        quantum = self.quantum
+        # Los que ya volvieron de su E/S esperan en la cola como los demás
+        for _ in es.desbloquear(tiempo):
+            pass
+        ultimo, fin_ultimo = -1, -1
+        for k, previos in enumerate(tramos):
+            if previos and previos[-1][1] > fin_ultimo:
+                ultimo, fin_ultimo = k, previos[-1][1]
+
+        en_curso = -1
+        turno_restante = quantum
+        if ultimo >= 0 and fin_ultimo == tiempo and restante[ultimo] > 0 and not es.bloqueado(ultimo):
+            # Los turnos unidos en un tramo duran exactamente un quantum cada uno
+            usado = (tiempo - tramos[ultimo][-1][0]) % quantum
+            if usado:
+                en_curso, turno_restante = ultimo, quantum - usado
+
+        i = 0
+        esperando: List[Tuple[float, int, int]] = []
+        final_de_turno = -1
+        while i < len(procesos) and procesos[i].tiempo_llegada <= tiempo:
+            p = procesos[i]
+            if i == en_curso or restante[i] <= 0 or es.bloqueado(i):
+                pass
+            elif i == ultimo and fin_ultimo == tiempo:
+                final_de_turno = i  # Su turno acaba justo ahora: va detrás de todos
+            elif p.tiempo_final > tiempo:
+                # Planificado antes: su orden es el del próximo despacho previsto
+                proximo = proximo_despacho(p, tiempo)
+                esperando.append((proximo, 0, i))
+            else:
+                esperando.append((float("inf"), p.tiempo_llegada, i))
+            i += 1
+        esperando.sort()
+
+        if en_curso >= 0:
+            cola.append(en_curso)
+        cola.extend(k for _, _, k in esperando)
+        if final_de_turno >= 0:
+            cola.append(final_de_turno)
+
+        # Si la CPU estaba en un cambio de contexto (el siguiente ya esperaba cuando
+        # se liberó), se retoma desde su inicio
+        desde = tiempo
+        if en_curso < 0 and ultimo >= 0 and fin_ultimo < tiempo < fin_ultimo + self.cambio_contexto \
+                and cola and cola[0] != ultimo and procesos[cola[0]].tiempo_llegada <= fin_ultimo:
+            desde = fin_ultimo
+        return i, ultimo, fin_ultimo, turno_restante, desde
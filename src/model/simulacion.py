@@ -0,0 +1,241 @@
+"""
+Planificación sin interfaz gráfica.
+
+Misma lógica que aplica el controlador en cada cálculo: cada algoritmo
+planifica su grupo de procesos de forma independiente a partir del instante
+indicado. Lo usan el controlador (con su caché) y los trabajos por lotes
+(renderizado fuera de pantalla, barridos de parámetros), que no cargan Tk.
+"""
+import copy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from model.edf import EDF
+from model.fcfs import FCFS
+from model.mlfq import MLFQ
+from model.planificador import Planificador
+from model.prioridades import Prioridades
+from model.proceso import Proceso
+from model.round_robin import RoundRobin
+from model.sjf import SJF, SRTF
+from utils.cache import ResultadoPlanificacion, ScheduleCache
+from utils.metricas import percentil
+
+
+class ParametrosPlanificacion:
+    """Parámetros configurables de los planificadores; cada algoritmo usa los suyos"""
+
+    __slots__ = ("envejecimiento", "quantum", "cambio_contexto", "quantums_mlfq", "boost_mlfq", "nucleos")
+
+    def __init__(self, envejecimiento: float = 0.0, quantum: int = 4, cambio_contexto: int = 0,
+                 quantums_mlfq: Sequence[int] = (2, 4, 8), boost_mlfq: int = 50, nucleos: int = 1) -> None:
+        self.envejecimiento = envejecimiento  # Mejora de prioridad por unidad de tiempo en espera
+        self.quantum = quantum  # Turno de Round Robin
+        self.cambio_contexto = cambio_contexto  # Unidades sin ejecución al cambiar de proceso (Round Robin)
+        self.quantums_mlfq = tuple(quantums_mlfq)  # Un quantum por nivel de MLFQ (la cantidad define los niveles)
+        self.boost_mlfq = boost_mlfq  # Período del boost de MLFQ (0 = sin boost)
+        self.nucleos = nucleos  # CPUs de cada algoritmo no expulsivo (FCFS, Prioridades, SJF, EDF)
+
+    def validar(self) -> "ParametrosPlanificacion":
+        if self.envejecimiento < 0:
+            raise ValueError("El envejecimiento no puede ser negativo")
+        if self.quantum < 1:
+            raise ValueError("El quantum debe ser al menos 1")
+        if self.cambio_contexto < 0:
+            raise ValueError("El costo del cambio de contexto no puede ser negativo")
+        if not self.quantums_mlfq or min(self.quantums_mlfq) < 1:
+            raise ValueError("MLFQ necesita al menos un nivel y quantums de al menos 1")
+        if self.boost_mlfq < 0:
+            raise ValueError("El período del boost no puede ser negativo")
+        if not 1 <= self.nucleos <= MAX_NUCLEOS:
+            raise ValueError(f"La cantidad de núcleos debe estar entre 1 y {MAX_NUCLEOS}")
+        return self
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {nombre: getattr(self, nombre) for nombre in self.__slots__}
+
+    @classmethod
+    def desde_dict(cls, datos: Dict[str, Any]) -> "ParametrosPlanificacion":
+        """Construye y valida; ignora claves desconocidas (p. ej. de versiones futuras)"""
+        valores = {}
+        for nombre, _, tipo in CAMPOS_PARAMETROS:
+            if nombre in datos:
+                try:
+                    valores[nombre] = tipo(datos[nombre])
+                except (TypeError, ValueError):
+                    raise ValueError(f"Valor inválido para {nombre}: {datos[nombre]!r}") from None
+        return cls(**valores).validar()
+
+
+def lista_enteros(valor: Any) -> Tuple[int, ...]:
+    """Convierte "2, 4, 8" (o una lista, p. ej. leída de un checkpoint) en una tupla de enteros"""
+    if isinstance(valor, str):
+        valor = [parte for parte in valor.strip("()[] ").split(",") if parte.strip()]
+    return tuple(int(v) for v in valor)
+
+
+# Campos editables de ParametrosPlanificacion: (atributo, etiqueta, tipo)
+CAMPOS_PARAMETROS = (
+    ("envejecimiento", "Envejecimiento (prioridad / unidad de espera)", float),
+    ("quantum", "Quantum de Round Robin", int),
+    ("cambio_contexto", "Costo del cambio de contexto (Round Robin)", int),
+    ("quantums_mlfq", "Quantums de MLFQ por nivel (p. ej. 2, 4, 8)", lista_enteros),
+    ("boost_mlfq", "Período del boost de MLFQ (0 = sin boost)", int),
+    ("nucleos", "Núcleos de CPU (FCFS, Prioridades, SJF y EDF)", int),
+)
+MAX_NUCLEOS = 256
+ENVEJECIMIENTO_REFERENCIA = 0.1  # Tasa con la que se compara si el envejecimiento está desactivado
+
+_FABRICAS: Dict[str, Callable[[ParametrosPlanificacion], Planificador]] = {
+    "FCFS": lambda par: FCFS(par.nucleos),
+    "Prioridades": lambda par: Prioridades(envejecimiento=par.envejecimiento, nucleos=par.nucleos),
+    "Prioridades expulsivo": lambda par: Prioridades(expulsivo=True, envejecimiento=par.envejecimiento),
+    "SJF": lambda par: SJF(par.nucleos),
+    "SRTF": lambda par: SRTF(),
+    "Round Robin": lambda par: RoundRobin(par.quantum, par.cambio_contexto),
+    "MLFQ": lambda par: MLFQ(par.quantums_mlfq, par.boost_mlfq),
+    "EDF": lambda par: EDF(nucleos=par.nucleos),
+    "EDF expulsivo": lambda par: EDF(expulsivo=True),
+}
+ALGORITMOS = tuple(_FABRICAS)
+REQUIEREN_PRIORIDAD = frozenset({"Prioridades", "Prioridades expulsivo"})
+# Al replanificar necesitan también los ya terminados (quién dejó la CPU y cuándo, p. ej.
+# para cobrar el cambio de contexto que sigue a una finalización)
+CON_HISTORIAL = frozenset({"Round Robin"})
+# Al replanificar reconstruyen su cola con el orden de la planificación anterior (el próximo
+# despacho previsto de cada proceso), así que sus procesos pendientes no se reinician antes
+ORDEN_PREVIO = frozenset({"Round Robin", "MLFQ"})
+# Los no expulsivos reparten sus procesos entre `nucleos` CPUs; los demás usan una
+MULTINUCLEO = frozenset({"FCFS", "Prioridades", "SJF", "EDF"})
+
+
+def nucleos_por_algoritmo(parametros: Optional[ParametrosPlanificacion] = None) -> Dict[str, int]:
+    """Cantidad de CPUs que planifica cada algoritmo con esos parámetros"""
+    nucleos = (parametros or ParametrosPlanificacion()).nucleos
+    return {algoritmo: nucleos if algoritmo in MULTINUCLEO else 1 for algoritmo in ALGORITMOS}
+
+
+def crear_planificador(algoritmo: str, parametros: Optional[ParametrosPlanificacion] = None) -> Planificador:
+    """Instancia el planificador del algoritmo indicado"""
+    try:
+        fabrica = _FABRICAS[algoritmo]
+    except KeyError:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}") from None
+    return fabrica(parametros or ParametrosPlanificacion())
+
+
+def planificar_algoritmo(
+    algoritmo: str,
+    procesos: List[Proceso],
+    tiempo_inicial: int = 0,
+    cache: Optional[ScheduleCache] = None,
+    parametros: Optional[ParametrosPlanificacion] = None,
+) -> List[Proceso]:
+    """
+    Ejecuta el planificador del algoritmo sobre los procesos, o reutiliza la
+    planificación en caché si el workload y los parámetros no cambiaron. Los
+    tiempos se escriben directamente en los objetos recibidos (no copias).
+    """
+    planificador = crear_planificador(algoritmo, parametros)
+    clave = None
+    if cache is not None:
+        # Si conserva progreso (siempre, con E/S), depende también de lo ya ejecutado antes del instante
+        clave = cache.clave(
+            algoritmo + planificador.firma_parametros(), tiempo_inicial, procesos,
+            progreso=planificador.conserva_progreso or any(p.secuencia for p in procesos)
+        )
+        entrada = cache.get(clave)
+        if entrada is not None:
+            return entrada.aplicar(procesos)
+
+    planificador.tiempo_inicial = tiempo_inicial  # type: ignore[attr-defined]
+    for p in procesos:
+        planificador.add_proceso(p)
+    resultado = planificador.run()
+
+    if cache is not None:
+        cache.put(clave, ResultadoPlanificacion.desde(procesos, resultado))  # type: ignore[arg-type]
+    return resultado
+
+
+def grupos_a_planificar(procesos: Sequence[Proceso], tiempo_actual: int = 0) -> Dict[str, List[Proceso]]:
+    """
+    Procesos que cada algoritmo debe (re)planificar en tiempo_actual: los de
+    Prioridades que tienen prioridad asignada, todos los de CON_HISTORIAL y, en
+    el resto, los que no han terminado (los que requieren prioridad, solo si la tienen).
+    """
+    grupos: Dict[str, List[Proceso]] = {algoritmo: [] for algoritmo in ALGORITMOS}
+    for p in procesos:
+        grupo = grupos.get(p.algoritmo)
+        if grupo is None:
+            continue
+        if p.algoritmo in REQUIEREN_PRIORIDAD and p.prioridad is None:
+            continue
+        if p.algoritmo == "Prioridades" or p.algoritmo in CON_HISTORIAL \
+                or p.tiempo_final == 0 or p.tiempo_final > tiempo_actual:
+            grupo.append(p)
+    return grupos
+
+
+def planificar(
+    procesos: Sequence[Proceso],
+    tiempo_actual: int = 0,
+    cache: Optional[ScheduleCache] = None,
+    parametros: Optional[ParametrosPlanificacion] = None,
+) -> Dict[str, List[Proceso]]:
+    """Planifica cada grupo no vacío; retorna el resultado de cada algoritmo en orden de despacho"""
+    return {
+        algoritmo: planificar_algoritmo(algoritmo, grupo, tiempo_actual, cache, parametros)
+        for algoritmo, grupo in grupos_a_planificar(procesos, tiempo_actual).items()
+        if grupo
+    }
+
+
+def esperas_por_envejecimiento(
+    procesos: Iterable[Proceso],
+    tasas: Iterable[float],
+    cache: Optional[ScheduleCache] = None,
+) -> Dict[float, Dict[str, float]]:
+    """
+    Espera máxima, p99 y media de los procesos de prioridades planificados desde
+    t=0 con cada tasa de envejecimiento. Se planifican copias: los procesos
+    recibidos no se modifican.
+    """
+    originales = [p for p in procesos if p.algoritmo in REQUIEREN_PRIORIDAD and p.prioridad is not None]
+    resultado: Dict[float, Dict[str, float]] = {}
+    for tasa in tasas:
+        copias = []
+        for p in originales:
+            c = copy.copy(p)
+            c.reiniciar_tiempos()
+            copias.append(c)
+        planificar(copias, 0, cache, ParametrosPlanificacion(envejecimiento=tasa))
+        esperas = sorted(c.tiempo_espera for c in copias)
+        n = len(esperas)
+        resultado[tasa] = {
+            "procesos": n,
+            "espera_max": float(esperas[-1]) if n else 0.0,
+            "espera_p99": percentil(esperas, 99),
+            "espera_media": sum(esperas) / n if n else 0.0,
+        }
+    return resultado
+
+
+def orden_resultante(procesos: Sequence[Proceso], resultados: Dict[str, List[Proceso]]) -> List[Proceso]:
+    """
+    Orden en que se muestran los procesos: los FCFS en su orden original y
+    luego los de cada otro algoritmo: primero los que no se replanificaron (ya
+    terminados) en su orden y después el resto en el orden calculado. Si solo
+    se planificó FCFS, el orden no cambia.
+    """
+    if all(algoritmo == "FCFS" for algoritmo in resultados):
+        return list(procesos)
+    nuevos_procesos = [p for p in procesos if p.algoritmo == "FCFS"]
+    for algoritmo in ALGORITMOS[1:]:
+        resultado = resultados.get(algoritmo, [])
+        planificados = {id(p) for p in resultado}
+        nuevos_procesos.extend(
+            p for p in procesos if p.algoritmo == algoritmo and id(p) not in planificados
+        )
+        nuevos_procesos.extend(resultado)
+    nuevos_procesos.extend(p for p in procesos if p.algoritmo not in ALGORITMOS)
+    return nuevos_procesos
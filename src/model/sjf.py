@@ -0,0 +1,78 @@
+import logging
+from typing import List
+from model.planificador import EntradaListo, Planificador, ejecutar_expulsivo, ejecutar_no_expulsivo
+from model.proceso import Proceso
+
+logger = logging.getLogger("fcfs.sjf")
+
+
+class SJF(Planificador):
+    """
+    Shortest-Job-First no expulsivo: al liberarse una CPU se despacha, entre los
+    procesos que ya llegaron, el de menor ráfaga de CPU siguiente (a igual
+    ráfaga, el que llegó antes). Cola de listos en un heap: O(n log n) en total.
+    """
+
+    def __init__(self, nucleos: int = 1) -> None:
+        super().__init__()
+        self.tiempo_inicial: int = 0  # Para soportar ejecución dinámica
+        # Al replanificar, el proceso que ya estaba en CPU termina su ráfaga
+        self.conserva_progreso = True
+        self.nucleos = nucleos
+
+    def run(self) -> List[Proceso]:
+        """Implementa SJF con soporte para ejecución dinámica"""
+        procesos = list(self.lista_procesos)
+        if not procesos:
+            return []
+
+        # No expulsivo: los que ya estaban ejecutándose terminan su ráfaga; con E/S, la clave
+        # es la ráfaga de CPU siguiente
+        retorno = ejecutar_no_expulsivo(
+            procesos, self.tiempo_inicial, lambda p, restante, _: restante, self.nucleos
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in retorno:
+                logger.debug(
+                    "[SJF] Proceso %s ejecutado: Rafaga: %d | Núcleo: %d | Inicio: %d, Final: %d | "
+                    "Retorno: %d, Espera: %d",
+                    p.nombre, p.rafaga, p.nucleo, p.tiempo_inicio, p.tiempo_final,
+                    p.tiempo_retorno, p.tiempo_espera
+                )
+
+        self.marcar_cambio()
+        return retorno
+
+
+class SRTF(SJF):
+    """
+    Shortest-Remaining-Time-First (SJF expulsivo): una llegada con ráfaga menor
+    que lo que le resta al proceso en CPU lo expulsa. A igual tiempo restante
+    el proceso en CPU continúa.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.expulsivo = True
+
+    def run(self) -> List[Proceso]:
+        """Implementa SRTF sobre el núcleo expulsivo dirigido por eventos"""
+        procesos = list(self.lista_procesos)
+        if not procesos:
+            return []
+
+        def expulsa(actual: EntradaListo, nuevo: EntradaListo, inicio_tramo: int, tiempo: int) -> bool:
+            # La clave es el tiempo restante al encolar; el del actual se descuenta de lo ya ejecutado
+            return nuevo[0] < actual[0] - (tiempo - inicio_tramo)
+
+        retorno = ejecutar_expulsivo(
+            procesos, self.tiempo_inicial, lambda p, restante, _: restante, expulsa
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in retorno:
+                logger.debug(
+                    "[SRTF] Proceso %s: Rafaga: %d | Tramos: %s | Retorno: %d, Espera: %d, Respuesta: %d",
+                    p.nombre, p.rafaga, p.tramos(), p.tiempo_retorno, p.tiempo_espera, p.tiempo_respuesta
+                )
+        self.marcar_cambio()
+        return retorno
@@ -0,0 +1,156 @@
+"""
+Barrido de parámetros por lotes, sin interfaz gráfica.
+
+Planifica cada workload con cada algoritmo y cada combinación de quantum,
+tasa de envejecimiento y cantidad de núcleos, y reúne las métricas resumen en
+una sola tabla (una fila por ejecución). Un parámetro solo se varía en los
+algoritmos que lo usan: FCFS no se repite por cada quantum.
+
+Las ejecuciones se reparten en lotes entre los procesos de un
+ProcessPoolExecutor del tamaño de la máquina. Cada lote lleva solo rutas y
+parámetros, agrupados por workload para que cada trabajador lo lea una vez;
+de vuelta viajan únicamente las métricas.
+"""
+import copy
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from model.proceso import Proceso
+from model.simulacion import (
+    ALGORITMOS, MULTINUCLEO, REQUIEREN_PRIORIDAD, ParametrosPlanificacion, planificar_algoritmo,
+)
+from utils.importacion import leer_workload
+from utils.metricas import metricas_plazos, resumen, uso_cpu
+
+# Algoritmos que usan cada parámetro barrido
+USA_QUANTUM = frozenset({"Round Robin"})
+USA_ENVEJECIMIENTO = REQUIEREN_PRIORIDAD
+LOTES_POR_TRABAJADOR = 4  # Lotes por trabajador: equilibra la carga sin multiplicar los envíos
+
+COLUMNAS = ("workload", "algoritmo", "quantum", "envejecimiento", "nucleos", "procesos",
+            "espera_media", "espera_p95", "espera_max", "retorno_media", "retorno_p95",
+            "respuesta_media", "utilizacion", "incumplidos")
+
+# Ejecución: (posición en la tabla, workload, algoritmo, quantum, envejecimiento, núcleos)
+Ejecucion = Tuple[int, str, str, Optional[int], Optional[float], Optional[int]]
+
+_workloads: Dict[str, List[Proceso]] = {}  # Workloads ya leídos por este proceso
+
+
+def trabajadores_disponibles() -> int:
+    """CPUs que puede usar este proceso (respeta la afinidad, p. ej. en contenedores)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def ejecuciones(
+    workloads: Sequence[str],
+    algoritmos: Sequence[str] = ALGORITMOS,
+    quantums: Sequence[int] = (4,),
+    envejecimientos: Sequence[float] = (0.0,),
+    nucleos: Sequence[int] = (1,),
+) -> List[Ejecucion]:
+    """Grilla de ejecuciones distintas; los parámetros que un algoritmo no usa quedan en None"""
+    # Valida los valores antes de repartir nada entre los trabajadores
+    for quantum in quantums:
+        ParametrosPlanificacion(quantum=quantum).validar()
+    for tasa in envejecimientos:
+        ParametrosPlanificacion(envejecimiento=tasa).validar()
+    for cantidad in nucleos:
+        ParametrosPlanificacion(nucleos=cantidad).validar()
+    grilla: List[Ejecucion] = []
+    for ruta in workloads:
+        for algoritmo in algoritmos:
+            if algoritmo not in ALGORITMOS:
+                raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+            for quantum in quantums if algoritmo in USA_QUANTUM else (None,):
+                for tasa in envejecimientos if algoritmo in USA_ENVEJECIMIENTO else (None,):
+                    for cantidad in nucleos if algoritmo in MULTINUCLEO else (None,):
+                        grilla.append((len(grilla), ruta, algoritmo, quantum, tasa, cantidad))
+    return grilla
+
+
+def _workload(ruta: str) -> List[Proceso]:
+    procesos = _workloads.get(ruta)
+    if procesos is None:
+        procesos = _workloads[ruta] = leer_workload(ruta, ALGORITMOS)
+    return procesos
+
+
+def ejecutar(ejecucion: Ejecucion) -> Dict[str, Any]:
+    """Planifica desde t=0 una copia del workload con todos sus procesos en el algoritmo indicado"""
+    _, ruta, algoritmo, quantum, tasa, cantidad = ejecucion
+    parametros = ParametrosPlanificacion(
+        envejecimiento=tasa or 0.0, quantum=quantum or 4, nucleos=cantidad or 1
+    ).validar()
+    procesos = []
+    for original in _workload(ruta):
+        if algoritmo in REQUIEREN_PRIORIDAD and original.prioridad is None:
+            continue
+        p = copy.copy(original)
+        p.secuencia = list(original.secuencia)
+        p.reiniciar_tiempos()
+        p.algoritmo = algoritmo
+        procesos.append(p)
+    if procesos:
+        planificar_algoritmo(algoritmo, procesos, 0, None, parametros)
+    fila: Dict[str, Any] = {
+        "workload": os.path.basename(ruta), "algoritmo": algoritmo,
+        "quantum": quantum, "envejecimiento": tasa, "nucleos": cantidad,
+    }
+    fila.update(resumen(procesos))
+    fila["utilizacion"] = uso_cpu(procesos, parametros.nucleos if algoritmo in MULTINUCLEO else 1)["utilizacion"]
+    fila["incumplidos"] = metricas_plazos(procesos)["incumplidos"]
+    return fila
+
+
+def _ejecutar_lote(lote: List[Ejecucion]) -> List[Tuple[int, Dict[str, Any]]]:
+    return [(ejecucion[0], ejecutar(ejecucion)) for ejecucion in lote]
+
+
+def lotes(grilla: Sequence[Ejecucion], trabajadores: int) -> List[List[Ejecucion]]:
+    """Parte la grilla (ya agrupada por workload) en unos LOTES_POR_TRABAJADOR lotes por trabajador"""
+    tam = max(1, -(-len(grilla) // (trabajadores * LOTES_POR_TRABAJADOR)))
+    return [list(grilla[i:i + tam]) for i in range(0, len(grilla), tam)]
+
+
+def barrer(grilla: Sequence[Ejecucion], trabajadores: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Ejecuta la grilla y retorna la tabla de resultados en el orden de la
+    grilla. Con un solo trabajador (o una sola ejecución) no crea procesos.
+    """
+    trabajadores = min(trabajadores or trabajadores_disponibles(), len(grilla)) or 1
+    filas: List[Optional[Dict[str, Any]]] = [None] * len(grilla)
+    if trabajadores == 1:
+        for posicion, fila in _ejecutar_lote(list(grilla)):
+            filas[posicion] = fila
+        return filas  # type: ignore[return-value]
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        futuros = [pool.submit(_ejecutar_lote, lote) for lote in lotes(grilla, trabajadores)]
+        for futuro in as_completed(futuros):
+            for posicion, fila in futuro.result():
+                filas[posicion] = fila
+    return filas  # type: ignore[return-value]
+
+
+def exportar_tabla(ruta: str, filas: Sequence[Dict[str, Any]]) -> None:
+    """Escribe la tabla del barrido en CSV (vacío donde el parámetro no aplica)"""
+    with open(ruta, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(COLUMNAS)
+        writer.writerows([["" if fila[c] is None else fila[c] for c in COLUMNAS] for fila in filas])
+
+
+def texto_tabla(filas: Sequence[Dict[str, Any]]) -> str:
+    """Tabla alineada para la consola"""
+    celdas = [list(COLUMNAS)] + [
+        ["-" if fila[c] is None else f"{fila[c]:.2f}" if isinstance(fila[c], float) else str(fila[c])
+         for c in COLUMNAS]
+        for fila in filas
+    ]
+    anchos = [max(len(fila[i]) for fila in celdas) for i in range(len(COLUMNAS))]
+    return "\n".join("  ".join(c.ljust(a) for c, a in zip(fila, anchos)).rstrip() for fila in celdas)
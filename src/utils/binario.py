@@ -0,0 +1,139 @@
+"""
+Contenedor binario columnar usado por los checkpoints y las exportaciones.
+
+Formato (little-endian):
+
+    magic      8 bytes   identifica el tipo de archivo (p. ej. b"FCFSCKP1")
+    tam_meta   u32       longitud de la cabecera JSON
+    meta       JSON      {"meta": {...}, "columnas": [{"nombre", "tipo", "largo", "offset"}]}
+    columnas   datos crudos de cada columna, alineados a 8 bytes
+
+Cada columna es un arreglo de ancho fijo con el typecode del módulo array
+("i" = int32, "q" = int64, "B" = uint8). Las cadenas se guardan como dos
+columnas: un blob UTF-8 ("B") y sus offsets ("q", n + 1 valores). Al leer, el
+archivo se mapea en memoria y cada columna se expone como memoryview sin copia.
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, List, Sequence, Tuple, Union
+
+_TAM_META = struct.Struct("<I")
+_ALINEACION = 8
+
+Columna = Union[array, bytes]
+
+
+def _alinear(n: int) -> int:
+    return n + (-n % _ALINEACION)
+
+
+def columna_texto(valores: Sequence[str]) -> Tuple[bytes, array]:
+    """Codifica una lista de cadenas como (blob UTF-8, offsets)"""
+    codificados = [v.encode("utf-8") for v in valores]
+    offsets = array('q', [0])
+    total = 0
+    for c in codificados:
+        total += len(c)
+        offsets.append(total)
+    return b"".join(codificados), offsets
+
+
+def leer_texto(blob: memoryview, offsets: memoryview) -> List[str]:
+    """Decodifica una columna de texto codificada con columna_texto()"""
+    datos = bytes(blob)
+    return [datos[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+
+def escribir_columnas(ruta: str, magic: bytes, meta: dict, columnas: Dict[str, Columna],
+                      progreso=None) -> int:
+    """
+    Escribe las columnas en un archivo. `progreso`, si se indica, recibe la
+    fracción escrita (0..1) después de cada columna. Retorna los bytes escritos.
+    """
+    if sys.byteorder != "little":
+        columnas = {k: _little_endian(v) for k, v in columnas.items()}
+
+    descriptores = []
+    offset = 0
+    for nombre, datos in columnas.items():
+        tipo = datos.typecode if isinstance(datos, array) else "B"
+        largo = len(datos)
+        descriptores.append({"nombre": nombre, "tipo": tipo, "largo": largo, "offset": offset})
+        offset = _alinear(offset + largo * (datos.itemsize if isinstance(datos, array) else 1))
+
+    cabecera = json.dumps({"meta": meta, "columnas": descriptores}).encode("utf-8")
+    inicio_datos = _alinear(len(magic) + _TAM_META.size + len(cabecera))
+
+    with open(ruta, "wb") as f:
+        f.write(magic)
+        f.write(_TAM_META.pack(len(cabecera)))
+        f.write(cabecera)
+        f.write(b"\0" * (inicio_datos - f.tell()))
+        total = len(columnas) or 1
+        for i, (desc, datos) in enumerate(zip(descriptores, columnas.values())):
+            crudo = datos.tobytes() if isinstance(datos, array) else bytes(datos)
+            f.write(crudo)
+            f.write(b"\0" * (-len(crudo) % _ALINEACION))
+            if progreso:
+                progreso((i + 1) / total)
+        return f.tell()
+
+
+def _little_endian(datos: Columna) -> Columna:
+    if isinstance(datos, array) and datos.itemsize > 1:
+        copia = array(datos.typecode, datos)
+        copia.byteswap()
+        return copia
+    return datos
+
+
+class ArchivoColumnar:
+    """Archivo columnar mapeado en memoria; las columnas son vistas sin copia"""
+
+    def __init__(self, ruta: str, magic: bytes) -> None:
+        with open(ruta, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._mmap[:len(magic)] != magic:
+                raise ValueError(f"{ruta} no tiene el formato esperado")
+            (tam_cabecera,) = _TAM_META.unpack_from(self._mmap, len(magic))
+            inicio = len(magic) + _TAM_META.size
+            cabecera = json.loads(self._mmap[inicio:inicio + tam_cabecera].decode("utf-8"))
+        except Exception:
+            self._mmap.close()
+            raise
+        self.meta: dict = cabecera["meta"]
+        self._inicio_datos = _alinear(inicio + tam_cabecera)
+        self._vista = memoryview(self._mmap)
+        self.columnas: Dict[str, memoryview] = {}
+        for desc in cabecera["columnas"]:
+            tam = array(desc["tipo"]).itemsize
+            ini = self._inicio_datos + desc["offset"]
+            crudo = self._vista[ini:ini + desc["largo"] * tam]
+            if sys.byteorder != "little" and tam > 1:
+                copia = array(desc["tipo"], crudo.tobytes())
+                copia.byteswap()
+                crudo = memoryview(copia)
+            self.columnas[desc["nombre"]] = crudo.cast(desc["tipo"])
+
+    def __getitem__(self, nombre: str) -> memoryview:
+        return self.columnas[nombre]
+
+    def __contains__(self, nombre: str) -> bool:
+        return nombre in self.columnas
+
+    def cerrar(self) -> None:
+        for col in self.columnas.values():
+            col.release()
+        self.columnas.clear()
+        self._vista.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "ArchivoColumnar":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
@@ -0,0 +1,200 @@
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+from model.planificador import proximo_despacho, tramos_previos
+from model.proceso import Proceso
+
+# Valor centinela para procesos sin prioridad o sin plazo dentro de la huella
+_SIN_VALOR = -(2 ** 63)
+
+
+class ResultadoPlanificacion:
+    """Resultado compacto de una planificación: orden de ejecución y tiempos calculados"""
+
+    __slots__ = ("orden", "tiempos", "tramos", "nucleos", "nucleos_tramos")
+
+    def __init__(self, orden: array, tiempos: array, tramos: Optional[array] = None,
+                 nucleos: Optional[array] = None, nucleos_tramos: Optional[array] = None) -> None:
+        self.orden: array = orden      # índices de entrada en el orden devuelto por run()
+        self.tiempos: array = tiempos  # inicio, final, retorno, espera por proceso (alineado con orden)
+        # Solo si hubo expulsiones: por proceso, cantidad de tramos y sus pares inicio, fin
+        self.tramos: Optional[array] = tramos
+        # Solo si se usó más de un núcleo: núcleo de cada proceso (alineado con orden)
+        self.nucleos: Optional[array] = nucleos
+        # Solo si algún proceso cambió de núcleo: por proceso, cantidad y núcleo de cada tramo
+        self.nucleos_tramos: Optional[array] = nucleos_tramos
+
+    @classmethod
+    def desde(cls, procesos: Sequence[Proceso], resultado: Sequence[Proceso]) -> "ResultadoPlanificacion":
+        posiciones = {id(p): i for i, p in enumerate(procesos)}
+        orden = array('q', (posiciones[id(p)] for p in resultado))
+        tiempos = array('q')
+        for p in resultado:
+            tiempos.extend((p.tiempo_inicio, p.tiempo_final, p.tiempo_retorno, p.tiempo_espera))
+        tramos = None
+        if any(p.segmentos for p in resultado):
+            tramos = array('q')
+            for p in resultado:
+                tramos.append(len(p.segmentos))
+                for inicio, fin in p.segmentos:
+                    tramos.extend((inicio, fin))
+        nucleos = None
+        if any(p.nucleo for p in resultado):
+            nucleos = array('H', (p.nucleo for p in resultado))
+        nucleos_tramos = None
+        if any(p.nucleos_tramos for p in resultado):
+            nucleos_tramos = array('H')
+            for p in resultado:
+                nucleos_tramos.append(len(p.nucleos_tramos))
+                nucleos_tramos.extend(p.nucleos_tramos)
+        return cls(orden, tiempos, tramos, nucleos, nucleos_tramos)
+
+    def aplicar(self, procesos: Sequence[Proceso]) -> List[Proceso]:
+        """Escribe los tiempos en los procesos recibidos y retorna el orden resultante"""
+        resultado: List[Proceso] = []
+        tiempos = self.tiempos
+        tramos = self.tramos
+        nucleos = self.nucleos
+        nucleos_tramos = self.nucleos_tramos
+        j = m = 0
+        for i, idx in enumerate(self.orden):
+            p = procesos[idx]
+            base = 4 * i
+            p.tiempo_inicio = tiempos[base]
+            p.tiempo_final = tiempos[base + 1]
+            p.tiempo_retorno = tiempos[base + 2]
+            p.tiempo_espera = tiempos[base + 3]
+            if tramos is None:
+                p.segmentos = []
+            else:
+                n = tramos[j]
+                p.segmentos = [(tramos[k], tramos[k + 1]) for k in range(j + 1, j + 1 + 2 * n, 2)]
+                j += 1 + 2 * n
+            p.nucleo = nucleos[i] if nucleos is not None else 0
+            if nucleos_tramos is None:
+                p.nucleos_tramos = []
+            else:
+                n = nucleos_tramos[m]
+                p.nucleos_tramos = nucleos_tramos[m + 1:m + 1 + n].tolist()
+                m += 1 + n
+            resultado.append(p)
+        return resultado
+
+    def tamano_bytes(self) -> int:
+        """Memoria aproximada ocupada por la entrada"""
+        return (
+            len(self.orden) * self.orden.itemsize
+            + len(self.tiempos) * self.tiempos.itemsize
+            + (len(self.tramos) * self.tramos.itemsize if self.tramos is not None else 0)
+            + (len(self.nucleos) * self.nucleos.itemsize if self.nucleos is not None else 0)
+            + (len(self.nucleos_tramos) * self.nucleos_tramos.itemsize if self.nucleos_tramos is not None else 0)
+            + 200
+        )
+
+
+class ScheduleCache:
+    """
+    Caché LRU de planificaciones calculadas, indexada por la huella del workload.
+    Expulsa las entradas menos usadas cuando se supera el número máximo de
+    entradas o la memoria máxima configurada.
+    """
+
+    def __init__(self, max_entradas: int = 128, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._entradas: "OrderedDict[bytes, ResultadoPlanificacion]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expulsiones = 0
+
+    @staticmethod
+    def clave(algoritmo: str, tiempo_inicial: int, procesos: Sequence[Proceso], progreso: bool = False) -> bytes:
+        """
+        Huella de contenido: algoritmo, tiempo inicial y llegadas/ráfagas/prioridades/plazos
+        (y las secuencias de ráfagas de CPU y E/S, si hay) en orden. Con `progreso`, incluye además los tramos ya ejecutados antes del
+        tiempo inicial (y el núcleo de cada uno) y el próximo despacho previsto
+        de cada proceso, de los que depende un planificador que conserva el progreso.
+        """
+        valores = array('q')
+        for p in procesos:
+            valores.extend((
+                p.tiempo_llegada,
+                p.rafaga,
+                p.prioridad if p.prioridad is not None else _SIN_VALOR,
+                p.plazo if p.plazo is not None else _SIN_VALOR,
+            ))
+        h = hashlib.blake2b(digest_size=16)
+        h.update(algoritmo.encode("utf-8"))
+        h.update(b"\0")
+        h.update(str(tiempo_inicial).encode("ascii"))
+        h.update(b"\0")
+        h.update(valores.tobytes())
+        if any(p.secuencia for p in procesos):
+            secuencias = array('q')
+            for p in procesos:
+                secuencias.append(len(p.secuencia))
+                secuencias.extend(p.secuencia)
+            h.update(b"\1")
+            h.update(secuencias.tobytes())
+        if progreso:
+            previos = array('q')
+            for p in procesos:
+                tramos = tramos_previos(p, tiempo_inicial)
+                previos.append(len(tramos))
+                for (inicio, fin), nucleo in zip(tramos, p.nucleos_de_tramos()):
+                    previos.extend((inicio, fin, nucleo))
+                # Y el próximo despacho previsto (antes del instante si estaba en CPU):
+                # de él salen el orden de la cola y quién retoma su tramo
+                previos.append(proximo_despacho(p, tiempo_inicial) if tiempo_inicial > 0 else _SIN_VALOR)
+            h.update(previos.tobytes())
+        return h.digest()
+
+    def get(self, clave: bytes) -> Optional[ResultadoPlanificacion]:
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self.misses += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.hits += 1
+            return entrada
+
+    def put(self, clave: bytes, entrada: ResultadoPlanificacion) -> None:
+        tamano = entrada.tamano_bytes()
+        if tamano > self.max_bytes:
+            return  # No cabe ni sola: no se almacena
+        with self._lock:
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior.tamano_bytes()
+            self._entradas[clave] = entrada
+            self._bytes += tamano
+            while self._entradas and (
+                len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes
+            ):
+                _, expulsada = self._entradas.popitem(last=False)
+                self._bytes -= expulsada.tamano_bytes()
+                self.expulsiones += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def estadisticas(self) -> dict:
+        """Contadores para la ventana de estadísticas"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "tasa_aciertos": self.hits / total if total else 0.0,
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+                "expulsiones": self.expulsiones,
+            }
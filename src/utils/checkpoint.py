@@ -0,0 +1,145 @@
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+from model.proceso import Proceso
+from utils.binario import ArchivoColumnar, columna_texto, escribir_columnas, leer_texto
+
+MAGIC = b"FCFSCKP1"
+VERSION = 2
+VERSIONES_LEGIBLES = (1, 2)  # La 1 usaba columnas int32 y guardaba colas de pendientes
+
+
+def columnas_procesos(procesos: Sequence[Proceso]) -> Tuple[Dict[str, object], List[str]]:
+    """Convierte los procesos en columnas binarias; retorna (columnas, tabla de algoritmos)"""
+    algoritmos: List[str] = []
+    codigos: Dict[str, int] = {}
+    for p in procesos:
+        if p.algoritmo not in codigos:
+            codigos[p.algoritmo] = len(algoritmos)
+            algoritmos.append(p.algoritmo)
+
+    nombres, offsets = columna_texto([p.nombre for p in procesos])
+    # Tramos de los procesos expulsados: pares inicio, fin aplanados y, como en
+    # las columnas de texto, n + 1 offsets (en pares) para delimitar los de cada uno
+    tramos = array('q')
+    tramos_offsets = array('q', [0])
+    # Ráfagas alternadas CPU, E/S, ..., CPU de los procesos con E/S, también con n + 1 offsets
+    secuencias = array('q')
+    secuencias_offsets = array('q', [0])
+    # Núcleo de cada tramo, alineado con `tramos` (difieren si el proceso cambió de núcleo)
+    nucleos_tramos = array('H')
+    try:
+        for p in procesos:
+            for inicio, fin in p.segmentos:
+                tramos.extend((inicio, fin))
+            nucleos_tramos.extend(p.nucleos_tramos or [p.nucleo] * len(p.segmentos))
+            tramos_offsets.append(len(tramos) // 2)
+            secuencias.extend(p.secuencia)
+            secuencias_offsets.append(len(secuencias))
+    except OverflowError:
+        raise ValueError("Hay tiempos o prioridades fuera del rango de 64 bits") from None
+    try:
+        columnas = {
+            "nombre": nombres,
+            "nombre_offsets": offsets,
+            "tiempo_llegada": array('q', [p.tiempo_llegada for p in procesos]),
+            "rafaga": array('q', [p.rafaga for p in procesos]),
+            "prioridad": array('q', [p.prioridad if p.prioridad is not None else 0 for p in procesos]),
+            "tiene_prioridad": array('B', [p.prioridad is not None for p in procesos]),
+            "plazo": array('q', [p.plazo if p.plazo is not None else 0 for p in procesos]),
+            "tiene_plazo": array('B', [p.plazo is not None for p in procesos]),
+            "algoritmo": array('B', [codigos[p.algoritmo] for p in procesos]),
+            "tiempo_inicio": array('q', [p.tiempo_inicio for p in procesos]),
+            "tiempo_final": array('q', [p.tiempo_final for p in procesos]),
+            "tiempo_retorno": array('q', [p.tiempo_retorno for p in procesos]),
+            "tiempo_espera": array('q', [p.tiempo_espera for p in procesos]),
+            "tramos": tramos,
+            "tramos_offsets": tramos_offsets,
+            "nucleo": array('H', [p.nucleo for p in procesos]),
+            "nucleos_tramos": nucleos_tramos,
+            "secuencia": secuencias,
+            "secuencia_offsets": secuencias_offsets,
+        }
+    except OverflowError:
+        raise ValueError("Hay tiempos o prioridades fuera del rango de 64 bits") from None
+    return columnas, algoritmos
+
+
+def procesos_desde_columnas(archivo: ArchivoColumnar, algoritmos: List[str]) -> List[Proceso]:
+    """Reconstruye los procesos a partir de las columnas de un archivo"""
+    nombres = leer_texto(archivo["nombre"], archivo["nombre_offsets"])
+    prioridades = [
+        prio if tiene else None
+        for prio, tiene in zip(archivo["prioridad"].tolist(), archivo["tiene_prioridad"].tolist())
+    ]
+    algoritmo = [algoritmos[c] for c in archivo["algoritmo"].tolist()]
+    procesos = list(map(
+        Proceso, nombres, archivo["tiempo_llegada"].tolist(), archivo["rafaga"].tolist(),
+        algoritmo, prioridades
+    ))
+    for p, ti, tf, tr, te in zip(
+        procesos,
+        archivo["tiempo_inicio"].tolist(),
+        archivo["tiempo_final"].tolist(),
+        archivo["tiempo_retorno"].tolist(),
+        archivo["tiempo_espera"].tolist(),
+    ):
+        p.tiempo_inicio = ti
+        p.tiempo_final = tf
+        p.tiempo_retorno = tr
+        p.tiempo_espera = te
+    if "tramos" in archivo:  # Ausentes en archivos anteriores a los planificadores expulsivos
+        tramos = archivo["tramos"].tolist()
+        limites = archivo["tramos_offsets"].tolist()
+        for i, p in enumerate(procesos):
+            a, b = limites[i], limites[i + 1]
+            if a != b:
+                p.segmentos = [(tramos[2 * k], tramos[2 * k + 1]) for k in range(a, b)]
+    if "nucleo" in archivo:  # Ausente en archivos anteriores a la simulación con varios núcleos
+        for p, nucleo in zip(procesos, archivo["nucleo"].tolist()):
+            p.nucleo = nucleo
+    if "nucleos_tramos" in archivo:  # Ausente en archivos anteriores al cambio de núcleo tras una E/S
+        nucleos_tramos = archivo["nucleos_tramos"].tolist()
+        limites = archivo["tramos_offsets"].tolist()
+        for i, p in enumerate(procesos):
+            propios = nucleos_tramos[limites[i]:limites[i + 1]]
+            if len(set(propios)) > 1:
+                p.nucleos_tramos = propios
+    if "plazo" in archivo:  # Ausentes en archivos anteriores a los plazos (EDF)
+        for p, plazo, tiene in zip(procesos, archivo["plazo"].tolist(), archivo["tiene_plazo"].tolist()):
+            if tiene:
+                p.plazo = plazo
+    if "secuencia" in archivo:  # Ausentes en archivos anteriores a las ráfagas de E/S
+        secuencias = archivo["secuencia"].tolist()
+        limites = archivo["secuencia_offsets"].tolist()
+        for i, p in enumerate(procesos):
+            a, b = limites[i], limites[i + 1]
+            if a != b:
+                p.secuencia = secuencias[a:b]
+    return procesos
+
+
+def guardar_checkpoint(ruta: str, procesos: Sequence[Proceso], estado: dict) -> int:
+    """
+    Guarda el estado completo de una simulación: procesos con su planificación,
+    en el orden de despacho de self.procesos, y el estado escalar del controlador
+    (tiempo, velocidad, ...). Las colas de pendientes no se guardan: se derivan
+    del orden de los procesos y de sus tiempos respecto del instante guardado.
+    """
+    columnas, algoritmos = columnas_procesos(procesos)
+    meta = {
+        "version": VERSION,
+        "algoritmos": algoritmos,
+        "estado": estado,
+    }
+    return escribir_columnas(ruta, MAGIC, meta, columnas)
+
+
+def cargar_checkpoint(ruta: str) -> Tuple[List[Proceso], dict]:
+    """Carga un checkpoint; retorna (procesos, estado)"""
+    with ArchivoColumnar(ruta, MAGIC) as archivo:
+        meta = archivo.meta
+        if meta.get("version") not in VERSIONES_LEGIBLES:
+            raise ValueError(f"Versión de checkpoint no soportada: {meta.get('version')}")
+        procesos = procesos_desde_columnas(archivo, meta["algoritmos"])
+        return procesos, meta["estado"]
@@ -0,0 +1,180 @@
+"""
+Historial de ejecuciones en SQLite.
+
+Cada ejecución guarda su workload y resultados por proceso (tabla resultados)
+y un resumen por algoritmo (tabla metricas) calculado al escribir, de modo que
+las comparaciones entre ejecuciones ("p95 de espera de FCFS vs Prioridades en
+las últimas 50") son lecturas indexadas y no recorren los resultados.
+
+Las escrituras usan executemany dentro de una única transacción.
+"""
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from model.proceso import Proceso
+from utils.metricas import resumen_por_algoritmo
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS ejecuciones (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fecha TEXT NOT NULL,
+    descripcion TEXT NOT NULL DEFAULT '',
+    procesos INTEGER NOT NULL,
+    tiempo_total INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resultados (
+    ejecucion_id INTEGER NOT NULL REFERENCES ejecuciones(id) ON DELETE CASCADE,
+    proceso TEXT NOT NULL,
+    algoritmo TEXT NOT NULL,
+    tiempo_llegada INTEGER NOT NULL,
+    rafaga INTEGER NOT NULL,
+    prioridad INTEGER,
+    tiempo_inicio INTEGER NOT NULL,
+    tiempo_final INTEGER NOT NULL,
+    tiempo_retorno INTEGER NOT NULL,
+    tiempo_espera INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metricas (
+    ejecucion_id INTEGER NOT NULL REFERENCES ejecuciones(id) ON DELETE CASCADE,
+    algoritmo TEXT NOT NULL,
+    procesos INTEGER NOT NULL,
+    espera_media REAL NOT NULL,
+    espera_p95 REAL NOT NULL,
+    espera_max REAL NOT NULL,
+    retorno_media REAL NOT NULL,
+    retorno_p95 REAL NOT NULL,
+    PRIMARY KEY (ejecucion_id, algoritmo)
+);
+CREATE INDEX IF NOT EXISTS idx_resultados_ejecucion ON resultados(ejecucion_id);
+CREATE INDEX IF NOT EXISTS idx_resultados_algoritmo ON resultados(algoritmo, ejecucion_id);
+CREATE INDEX IF NOT EXISTS idx_resultados_proceso ON resultados(proceso, ejecucion_id);
+CREATE INDEX IF NOT EXISTS idx_metricas_algoritmo ON metricas(algoritmo, ejecucion_id);
+"""
+
+METRICAS = ("espera_media", "espera_p95", "espera_max", "retorno_media", "retorno_p95")
+
+
+def ruta_por_defecto() -> str:
+    """Base de datos del historial (junto a logs/ y trazas/)"""
+    ruta = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'historial')
+    os.makedirs(ruta, exist_ok=True)
+    return os.path.join(ruta, 'ejecuciones.db')
+
+
+class HistorialEjecuciones:
+    """
+    Acceso al historial. Cada operación abre su propia conexión, así que se
+    puede usar desde cualquier hilo (p. ej. el de simulación).
+    """
+
+    def __init__(self, ruta: Optional[str] = None) -> None:
+        self.ruta = ruta or ruta_por_defecto()
+        with self._conectar() as conexion:
+            conexion.executescript(ESQUEMA)
+
+    def _conectar(self) -> sqlite3.Connection:
+        conexion = sqlite3.connect(self.ruta)
+        conexion.execute("PRAGMA foreign_keys = ON")
+        return conexion
+
+    def guardar_ejecucion(self, procesos: Sequence[Proceso], descripcion: str = "") -> int:
+        """Guarda una ejecución completa en una sola transacción; retorna su id"""
+        filas = [
+            (p.nombre, p.algoritmo, p.tiempo_llegada, p.rafaga, p.prioridad,
+             p.tiempo_inicio, p.tiempo_final, p.tiempo_retorno, p.tiempo_espera)
+            for p in procesos
+        ]
+        resumenes = resumen_por_algoritmo(procesos)
+        tiempo_total = max((p.tiempo_final for p in procesos), default=0)
+
+        conexion = self._conectar()
+        try:
+            with conexion:  # Transacción: commit al salir, rollback si hay error
+                cursor = conexion.execute(
+                    "INSERT INTO ejecuciones (fecha, descripcion, procesos, tiempo_total) VALUES (?, ?, ?, ?)",
+                    (datetime.now().isoformat(timespec="seconds"), descripcion, len(filas), tiempo_total)
+                )
+                ejecucion_id = cursor.lastrowid
+                conexion.executemany(
+                    "INSERT INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(ejecucion_id,) + fila for fila in filas]
+                )
+                conexion.executemany(
+                    "INSERT INTO metricas VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (ejecucion_id, algoritmo, r["procesos"]) + tuple(r[m] for m in METRICAS)
+                        for algoritmo, r in resumenes.items()
+                    ]
+                )
+        finally:
+            conexion.close()
+        return ejecucion_id  # type: ignore[return-value]
+
+    def ultimas_ejecuciones(self, limite: int = 50) -> List[Tuple]:
+        """(id, fecha, descripcion, procesos, tiempo_total) de las últimas ejecuciones"""
+        conexion = self._conectar()
+        try:
+            return conexion.execute(
+                "SELECT id, fecha, descripcion, procesos, tiempo_total FROM ejecuciones "
+                "ORDER BY id DESC LIMIT ?", (limite,)
+            ).fetchall()
+        finally:
+            conexion.close()
+
+    def comparar(self, metrica: str = "espera_p95", ultimas: int = 50,
+                 algoritmos: Optional[Sequence[str]] = None) -> Dict[str, List[Tuple[int, float]]]:
+        """
+        Serie (ejecucion_id, valor) de una métrica por algoritmo en las últimas
+        ejecuciones, p. ej. comparar("espera_p95", 50, ["FCFS", "Prioridades"]).
+        """
+        if metrica not in METRICAS:
+            raise ValueError(f"Métrica desconocida: {metrica}")
+        consulta = (
+            f"SELECT m.algoritmo, m.ejecucion_id, m.{metrica} FROM metricas m "
+            "WHERE m.ejecucion_id IN (SELECT id FROM ejecuciones ORDER BY id DESC LIMIT ?)"
+        )
+        parametros: list = [ultimas]
+        if algoritmos:
+            consulta += f" AND m.algoritmo IN ({', '.join('?' * len(algoritmos))})"
+            parametros.extend(algoritmos)
+        consulta += " ORDER BY m.ejecucion_id"
+
+        series: Dict[str, List[Tuple[int, float]]] = {}
+        conexion = self._conectar()
+        try:
+            for algoritmo, ejecucion_id, valor in conexion.execute(consulta, parametros):
+                series.setdefault(algoritmo, []).append((ejecucion_id, valor))
+        finally:
+            conexion.close()
+        return series
+
+    def resultados(self, ejecucion_id: int) -> List[Proceso]:
+        """Reconstruye los procesos de una ejecución guardada"""
+        conexion = self._conectar()
+        try:
+            filas = conexion.execute(
+                "SELECT proceso, tiempo_llegada, rafaga, algoritmo, prioridad, tiempo_inicio, "
+                "tiempo_final, tiempo_retorno, tiempo_espera FROM resultados WHERE ejecucion_id = ? "
+                "ORDER BY rowid", (ejecucion_id,)
+            ).fetchall()
+        finally:
+            conexion.close()
+        procesos = []
+        for nombre, llegada, rafaga, algoritmo, prioridad, ti, tf, tr, te in filas:
+            p = Proceso(nombre, llegada, rafaga, algoritmo, prioridad)
+            p.tiempo_inicio, p.tiempo_final, p.tiempo_retorno, p.tiempo_espera = ti, tf, tr, te
+            procesos.append(p)
+        return procesos
+
+    def historial_proceso(self, nombre: str, ultimas: int = 50) -> List[Tuple]:
+        """(ejecucion_id, algoritmo, tiempo_espera, tiempo_retorno) de un proceso en las últimas ejecuciones"""
+        conexion = self._conectar()
+        try:
+            return conexion.execute(
+                "SELECT ejecucion_id, algoritmo, tiempo_espera, tiempo_retorno FROM resultados "
+                "WHERE proceso = ? ORDER BY ejecucion_id DESC LIMIT ?", (nombre, ultimas)
+            ).fetchall()
+        finally:
+            conexion.close()
@@ -0,0 +1,131 @@
+"""
+Importación masiva de workloads desde CSV o JSON.
+
+CSV: primera fila con encabezados. Se aceptan los nombres de columna de la
+exportación ("Proceso", "Tiempo Llegada", "Ráfaga", "Prioridad", "Algoritmo",
+"Plazo", "Secuencia") o los nombres de los atributos (nombre, tiempo_llegada,
+rafaga, prioridad, algoritmo, plazo, secuencia). JSON: lista de objetos con
+esos mismos campos.
+
+La secuencia ("5, 3, 4" o, en JSON, una lista) alterna ráfagas de CPU y de
+E/S y empieza y termina con una de CPU; si está, la ráfaga puede omitirse
+(es la suma de las de CPU) y, si se indica, debe coincidir con esa suma.
+
+Los registros se validan y convierten por bloques; cualquier error se informa
+con ValueError indicando el registro.
+"""
+import csv
+import json
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from model.proceso import Proceso, secuencia_rafagas
+from model.simulacion import REQUIEREN_PRIORIDAD
+
+TAM_BLOQUE = 10000
+
+_ALIAS = {
+    "proceso": "nombre",
+    "nombre": "nombre",
+    "tiempo llegada": "tiempo_llegada",
+    "tiempo_llegada": "tiempo_llegada",
+    "llegada": "tiempo_llegada",
+    "ráfaga": "rafaga",
+    "rafaga": "rafaga",
+    "prioridad": "prioridad",
+    "algoritmo": "algoritmo",
+    "plazo": "plazo",
+    "deadline": "plazo",
+    "secuencia": "secuencia",
+    "rafagas": "secuencia",
+    "ráfagas": "secuencia",
+}
+
+
+def _normalizar(registro: Dict[str, Any]) -> Dict[str, Any]:
+    return {_ALIAS.get(str(k).strip().lower(), k): v for k, v in registro.items()}
+
+
+def _convertir_bloque(
+    registros: Sequence[Dict[str, Any]],
+    desde: int,
+    algoritmos_validos: Sequence[str],
+    algoritmo_defecto: str,
+) -> List[Proceso]:
+    procesos: List[Proceso] = []
+    for n, registro in enumerate(registros, start=desde):
+        if not isinstance(registro, dict):
+            raise ValueError(f"Registro {n}: se esperaba un objeto, no {type(registro).__name__}")
+        r = _normalizar(registro)
+        try:
+            nombre = str(r.get("nombre") or f"P{n}").strip()
+            llegada = int(r.get("tiempo_llegada") or 0)
+            secuencia = secuencia_rafagas(r.get("secuencia"))
+            rafaga = int(r["rafaga"]) if r.get("rafaga") not in (None, "") or not secuencia \
+                else sum(secuencia[::2])
+            prioridad_raw = r.get("prioridad")
+            prioridad = int(prioridad_raw) if prioridad_raw not in (None, "") else None
+            algoritmo = str(r.get("algoritmo") or algoritmo_defecto).strip()
+            plazo_raw = r.get("plazo")
+            plazo = int(plazo_raw) if plazo_raw not in (None, "") else None
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Registro {n}: valor inválido ({e})") from None
+        if llegada < 0 or rafaga <= 0:
+            raise ValueError(f"Registro {n}: llegada negativa o ráfaga no positiva")
+        if algoritmo not in algoritmos_validos:
+            raise ValueError(f"Registro {n}: algoritmo desconocido '{algoritmo}'")
+        if algoritmo in REQUIEREN_PRIORIDAD and prioridad is None:
+            raise ValueError(f"Registro {n}: un proceso de {algoritmo} requiere prioridad")
+        if plazo is not None and plazo < llegada:
+            raise ValueError(f"Registro {n}: el plazo es anterior a la llegada")
+        if secuencia and rafaga != sum(secuencia[::2]):
+            raise ValueError(f"Registro {n}: la ráfaga no es la suma de las ráfagas de CPU de la secuencia")
+        proceso = Proceso(nombre, llegada, rafaga, algoritmo, prioridad, plazo)
+        proceso.secuencia = secuencia
+        procesos.append(proceso)
+    return procesos
+
+
+def _registros(ruta: str) -> Iterator[Dict[str, Any]]:
+    if ruta.lower().endswith(".json"):
+        with open(ruta, encoding="utf-8") as f:
+            datos = json.load(f)
+        if isinstance(datos, dict):
+            datos = datos.get("procesos", [])
+        if not isinstance(datos, list):
+            raise ValueError("El JSON debe ser una lista de procesos")
+        yield from datos
+    else:
+        with open(ruta, newline="", encoding="utf-8-sig") as f:
+            try:
+                yield from csv.DictReader(f)
+            except csv.Error as e:
+                raise ValueError(f"CSV inválido: {e}") from None
+
+
+def _por_bloques(registros: Iterable[Dict[str, Any]], tam: int) -> Iterator[List[Dict[str, Any]]]:
+    it = iter(registros)
+    while True:
+        bloque = list(islice(it, tam))
+        if not bloque:
+            return
+        yield bloque
+
+
+def leer_workload(
+    ruta: str,
+    algoritmos_validos: Sequence[str],
+    algoritmo_defecto: str = "FCFS",
+    progreso: Optional[Callable[[int], None]] = None,
+    tam_bloque: int = TAM_BLOQUE,
+) -> List[Proceso]:
+    """
+    Lee y valida un workload CSV/JSON por bloques. `progreso`, si se indica,
+    recibe la cantidad de procesos leídos hasta el momento.
+    """
+    procesos: List[Proceso] = []
+    for bloque in _por_bloques(_registros(ruta), tam_bloque):
+        procesos.extend(_convertir_bloque(bloque, len(procesos) + 1, algoritmos_validos, algoritmo_defecto))
+        if progreso:
+            progreso(len(procesos))
+    return procesos
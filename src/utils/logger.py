@@ -1,23 +1,98 @@
+import atexit
 import logging
 import os
-from datetime import datetime
-
-def setup_logger():
-    # Crear directorio de logs si no existe
-    log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-
-    # Configurar el nombre del archivo de log con la fecha actual
-    log_file = os.path.join(log_dir, f'fcfs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-    
-    # Configurar el logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
-    
-    return logging.getLogger(__name__)
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Iterable, Optional, Tuple
+
+LOGGER_NAME = "fcfs"
+
+_listener: Optional[QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+class _QueueHandlerDiferido(QueueHandler):
+    """
+    QueueHandler que no formatea en el hilo que registra el mensaje.
+    El formateo (msg % args) ocurre en el hilo del QueueListener; por eso los
+    argumentos deben ser valores inmutables o instantáneas (no objetos vivos).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class LineasDiferidas:
+    """
+    Argumento de log que se convierte en texto de forma perezosa, en el hilo
+    escritor: una línea por fila aplicando el formato %-style indicado.
+    """
+
+    __slots__ = ("formato", "filas")
+
+    def __init__(self, formato: str, filas: Iterable[Tuple]) -> None:
+        self.formato = formato
+        self.filas = tuple(filas)
+
+    def __str__(self) -> str:
+        formato = self.formato
+        return "\n".join(formato % fila for fila in self.filas)
+
+
+def setup_logger(
+    nivel: int = logging.INFO,
+    max_bytes: int = 5 * 1024 * 1024,
+    backups: int = 5,
+) -> logging.Logger:
+    """
+    Configura el logging de la aplicación una sola vez (llamadas posteriores
+    devuelven el mismo logger). La escritura a archivo y consola la hace un
+    QueueListener en segundo plano, con rotación por tamaño del archivo.
+    """
+    global _listener
+    logger = logging.getLogger(LOGGER_NAME)
+
+    with _setup_lock:
+        if _listener is not None:
+            return logger
+
+        # Crear directorio de logs si no existe
+        log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+        os.makedirs(log_dir, exist_ok=True)
+        log_file = os.path.join(log_dir, 'fcfs.log')
+
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backups, encoding='utf-8'
+        )
+        stream_handler = logging.StreamHandler()
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+
+        cola: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _listener = QueueListener(cola, file_handler, stream_handler, respect_handler_level=True)
+        _listener.start()
+
+        logger.addHandler(_QueueHandlerDiferido(cola))
+        logger.setLevel(nivel)
+        logger.propagate = False
+        atexit.register(shutdown_logger)
+
+    return logger
+
+
+def shutdown_logger() -> None:
+    """Vacía la cola pendiente y detiene el hilo escritor"""
+    global _listener
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        logger = logging.getLogger(LOGGER_NAME)
+        for handler in list(logger.handlers):
+            if isinstance(handler, _QueueHandlerDiferido):
+                logger.removeHandler(handler)
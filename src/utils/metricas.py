@@ -0,0 +1,169 @@
+"""
+Métricas resumen de una planificación (promedios y percentiles por algoritmo).
+"""
+import math
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from model.proceso import Proceso
+
+
+def percentil(ordenados: Sequence[float], q: float) -> float:
+    """Percentil q (0..100) por rango más cercano; `ordenados` debe venir ordenado"""
+    if not ordenados:
+        return 0.0
+    rango = max(1, math.ceil(q / 100 * len(ordenados)))
+    return float(ordenados[rango - 1])
+
+
+def resumen(procesos: Iterable[Proceso]) -> Dict[str, float]:
+    """Promedios, p95 y máximos de espera y retorno de los procesos planificados"""
+    planificados = [p for p in procesos if p.tiempo_final > 0]
+    esperas = sorted(p.tiempo_espera for p in planificados)
+    retornos = sorted(p.tiempo_retorno for p in planificados)
+    n = len(planificados)
+    return {
+        "procesos": n,
+        "espera_media": sum(esperas) / n if n else 0.0,
+        "espera_p95": percentil(esperas, 95),
+        "espera_max": float(esperas[-1]) if n else 0.0,
+        "retorno_media": sum(retornos) / n if n else 0.0,
+        "retorno_p95": percentil(retornos, 95),
+        "respuesta_media": sum(p.tiempo_respuesta for p in planificados) / n if n else 0.0,
+    }
+
+
+def metricas_plazos(procesos: Iterable[Proceso]) -> Dict[str, float]:
+    """
+    Cumplimiento de plazos de los procesos planificados que tienen uno:
+    incumplidos, distribución de la tardanza (final - plazo; negativa si
+    terminó antes) y holgura (plazo - final) de los que lo cumplieron.
+    """
+    tardanzas = sorted(p.tardanza for p in procesos if p.plazo is not None and p.tiempo_final > 0)
+    n = len(tardanzas)
+    holguras = [-t for t in tardanzas if t <= 0]
+    incumplidos = n - len(holguras)
+    return {
+        "con_plazo": n,
+        "incumplidos": incumplidos,
+        "tasa_incumplidos": incumplidos / n if n else 0.0,
+        "tardanza_media": sum(tardanzas) / n if n else 0.0,
+        "tardanza_p50": percentil(tardanzas, 50),
+        "tardanza_p95": percentil(tardanzas, 95),
+        "tardanza_max": float(tardanzas[-1]) if n else 0.0,
+        "holgura_min": float(min(holguras)) if holguras else 0.0,
+        "holgura_media": sum(holguras) / len(holguras) if holguras else 0.0,
+    }
+
+
+def texto_plazos(metricas: Dict[str, float]) -> str:
+    """Resumen de una línea de metricas_plazos()"""
+    return (
+        f"{metricas['incumplidos']}/{metricas['con_plazo']} incumplidos "
+        f"({metricas['tasa_incumplidos']:.0%}), tardanza media {metricas['tardanza_media']:.2f}, "
+        f"p50 {metricas['tardanza_p50']:.0f}, p95 {metricas['tardanza_p95']:.0f}, "
+        f"máx {metricas['tardanza_max']:.0f}; holgura mín {metricas['holgura_min']:.0f}, "
+        f"media {metricas['holgura_media']:.2f}"
+    )
+
+
+def cambios_de_contexto(procesos: Iterable[Proceso], costo: int = 0) -> int:
+    """
+    Cambios de contexto de una planificación de una CPU: despachos de un proceso
+    distinto del anterior sin que la CPU haya quedado ociosa entre ambos (el
+    siguiente tramo empieza `costo` unidades después). Un primer despacho tras
+    una llegada posterior al fin del tramo anterior es CPU ociosa, no un cambio.
+    """
+    tramos = [
+        (inicio, fin, n_tramo, p)
+        for p in procesos if p.tiempo_final > 0
+        for n_tramo, (inicio, fin) in enumerate(p.tramos())
+    ]
+    tramos.sort(key=lambda t: t[0])
+    cambios = 0
+    for (_, fin_anterior, _, anterior), (inicio, _, n_tramo, p) in zip(tramos, tramos[1:]):
+        if p is anterior or inicio != fin_anterior + costo:
+            continue
+        if n_tramo == 0 and p.tiempo_llegada > fin_anterior:
+            continue
+        cambios += 1
+    return cambios
+
+
+def utilizacion_por_nucleo(procesos: Iterable[Proceso], nucleos: int = 1) -> List[float]:
+    """
+    Fracción del tiempo que cada núcleo de un algoritmo estuvo ocupado, entre la
+    primera llegada y el último fin de sus procesos planificados. Incluye los
+    núcleos ociosos hasta `nucleos`.
+    """
+    planificados = [p for p in procesos if p.tiempo_final > 0]
+    cantidad = max([nucleos] + [n + 1 for p in planificados for n in p.nucleos_de_tramos()])
+    ocupado = [0] * cantidad
+    for p in planificados:
+        for (inicio, fin), nucleo in zip(p.tramos(), p.nucleos_de_tramos()):
+            ocupado[nucleo] += fin - inicio
+    if not planificados:
+        return [0.0] * cantidad
+    lapso = max(p.tiempo_final for p in planificados) - min(p.tiempo_llegada for p in planificados)
+    return [o / lapso if lapso > 0 else 0.0 for o in ocupado]
+
+
+def _union(intervalos: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Unión de intervalos [inicio, fin) como lista ordenada de intervalos disjuntos"""
+    union: List[Tuple[int, int]] = []
+    for inicio, fin in sorted(intervalos):
+        if union and inicio <= union[-1][1]:
+            if fin > union[-1][1]:
+                union[-1] = (union[-1][0], fin)
+        else:
+            union.append((inicio, fin))
+    return union
+
+
+def uso_cpu(procesos: Iterable[Proceso], nucleos: int = 1) -> Dict[str, float]:
+    """
+    Uso de la CPU de un algoritmo entre la primera llegada y el último fin de sus
+    procesos planificados: tiempo ocupado y ocioso (sumando sus núcleos),
+    utilización, tiempo total bloqueado en E/S y cuánto de él transcurrió con la
+    CPU ocupada por otros (el solapamiento de E/S y CPU que aprovecha la planificación).
+    """
+    planificados = [p for p in procesos if p.tiempo_final > 0]
+    if not planificados:
+        return {"ocupado": 0.0, "ocioso": 0.0, "utilizacion": 0.0, "es": 0.0, "es_solapada": 0.0}
+    cantidad = max([nucleos] + [n + 1 for p in planificados for n in p.nucleos_de_tramos()])
+    lapso = max(p.tiempo_final for p in planificados) - min(p.tiempo_llegada for p in planificados)
+    ocupado = sum(fin - inicio for p in planificados for inicio, fin in p.tramos())
+    es = _union(intervalo for p in planificados for intervalo in p.tramos_es())
+    cpu = _union(intervalo for p in planificados for intervalo in p.tramos())
+    solapada = 0
+    j = 0
+    for inicio, fin in es:
+        while j < len(cpu) and cpu[j][1] <= inicio:
+            j += 1
+        k = j
+        while k < len(cpu) and cpu[k][0] < fin:
+            solapada += min(fin, cpu[k][1]) - max(inicio, cpu[k][0])
+            k += 1
+    capacidad = lapso * cantidad
+    return {
+        "ocupado": float(ocupado),
+        "ocioso": float(capacidad - ocupado),
+        "utilizacion": ocupado / capacidad if capacidad > 0 else 0.0,
+        "es": float(sum(p.tiempo_es for p in planificados)),
+        "es_solapada": float(solapada),
+    }
+
+
+def texto_uso_cpu(uso: Dict[str, float]) -> str:
+    """Resumen de una línea de uso_cpu()"""
+    texto = f"utilización {uso['utilizacion']:.0%} (ocupada {uso['ocupado']:.0f}, ociosa {uso['ocioso']:.0f})"
+    if uso["es"]:
+        texto += f"; E/S {uso['es']:.0f}, con CPU ocupada {uso['es_solapada']:.0f}"
+    return texto
+
+
+def resumen_por_algoritmo(procesos: Iterable[Proceso]) -> Dict[str, Dict[str, float]]:
+    """resumen() de cada algoritmo presente en los procesos"""
+    grupos: Dict[str, List[Proceso]] = {}
+    for p in procesos:
+        grupos.setdefault(p.algoritmo, []).append(p)
+    return {algoritmo: resumen(grupo) for algoritmo, grupo in grupos.items()}
@@ -0,0 +1,190 @@
+"""
+Replicaciones Monte Carlo de un modelo de carga.
+
+Genera miles de workloads aleatorios del mismo modelo (separación entre
+llegadas y ráfagas exponenciales redondeadas, ráfagas de al menos 1 unidad,
+prioridades uniformes y plazos a `factor_plazo` ráfagas de la llegada) y
+estima para cada algoritmo la espera y el retorno medios y su p95 (dentro de
+cada replicación), con intervalos de confianza del 95 % entre replicaciones.
+Todos los algoritmos se evalúan sobre las mismas replicaciones.
+
+FCFS de una CPU se evalúa por bloques de replicaciones como matrices de
+NumPy, una fila por replicación: con S la suma acumulada de las ráfagas, el
+fin del proceso i es S_i + max_{j<=i}(llegada_j - S_{j-1}), un máximo
+acumulado por filas. El resto de los algoritmos (y FCFS con varios núcleos)
+ejecutan su planificador replicación por replicación. numpy es opcional: se
+importa al replicar y, si no está instalado, todo pasa por los planificadores.
+"""
+import math
+import random
+from statistics import NormalDist, fmean, stdev
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from model.proceso import Proceso
+from model.simulacion import ALGORITMOS, ParametrosPlanificacion, planificar_algoritmo
+from utils.metricas import percentil
+
+ESTADISTICAS = ("espera_media", "espera_p95", "retorno_media", "retorno_p95")
+CONFIANZA = 0.95
+ELEMENTOS_POR_BLOQUE = 1 << 20  # Procesos por bloque de matrices (acota la memoria)
+
+# Estimación: (media entre replicaciones, extremo inferior, extremo superior del intervalo)
+Intervalo = Tuple[float, float, float]
+
+
+class ModeloCarga:
+    """Distribuciones de las que se generan los workloads de cada replicación"""
+
+    __slots__ = ("procesos", "llegada_media", "rafaga_media", "prioridades", "factor_plazo")
+
+    def __init__(self, procesos: int = 100, llegada_media: float = 5.0, rafaga_media: float = 4.0,
+                 prioridades: int = 10, factor_plazo: int = 3) -> None:
+        self.procesos = procesos  # Procesos por replicación
+        self.llegada_media = llegada_media  # Separación media entre llegadas consecutivas
+        self.rafaga_media = rafaga_media
+        self.prioridades = prioridades  # Prioridades posibles: 0..prioridades-1
+        self.factor_plazo = factor_plazo  # Plazo = llegada + factor_plazo × ráfaga
+
+    def validar(self) -> "ModeloCarga":
+        if self.procesos < 1:
+            raise ValueError("Cada replicación necesita al menos un proceso")
+        if self.llegada_media < 0:
+            raise ValueError("La separación media entre llegadas no puede ser negativa")
+        if self.rafaga_media < 1:
+            raise ValueError("La ráfaga media debe ser al menos 1")
+        if self.prioridades < 1:
+            raise ValueError("Debe haber al menos una prioridad")
+        if self.factor_plazo < 1:
+            raise ValueError("El factor del plazo debe ser al menos 1")
+        return self
+
+
+# Bloque de replicaciones: matrices (llegadas, ráfagas, prioridades, plazos), una fila por replicación
+Bloque = Tuple[Any, Any, Any, Any]
+
+
+def _bloques_numpy(np: Any, modelo: ModeloCarga, replicaciones: int, semilla: Optional[int]):
+    rng = np.random.default_rng(semilla)
+    filas = max(1, ELEMENTOS_POR_BLOQUE // modelo.procesos)
+    for inicio in range(0, replicaciones, filas):
+        forma = (min(filas, replicaciones - inicio), modelo.procesos)
+        llegadas = np.cumsum(np.rint(rng.exponential(modelo.llegada_media, forma)), axis=1).astype(np.int64)
+        rafagas = np.maximum(np.rint(rng.exponential(modelo.rafaga_media, forma)), 1).astype(np.int64)
+        prioridades = rng.integers(0, modelo.prioridades, forma)
+        yield llegadas, rafagas, prioridades, llegadas + modelo.factor_plazo * rafagas
+
+
+def _bloques_python(modelo: ModeloCarga, replicaciones: int, semilla: Optional[int]):
+    rng = random.Random(semilla)
+    for _ in range(replicaciones):
+        llegadas, rafagas, prioridades, plazos = [], [], [], []
+        llegada = 0
+        for _ in range(modelo.procesos):
+            llegada += round(rng.expovariate(1 / modelo.llegada_media)) if modelo.llegada_media else 0
+            rafaga = max(round(rng.expovariate(1 / modelo.rafaga_media)), 1)
+            llegadas.append(llegada)
+            rafagas.append(rafaga)
+            prioridades.append(rng.randrange(modelo.prioridades))
+            plazos.append(llegada + modelo.factor_plazo * rafaga)
+        yield [llegadas], [rafagas], [prioridades], [plazos]
+
+
+def _fcfs_numpy(np: Any, llegadas: Any, rafagas: Any) -> Tuple[Any, Any]:
+    """Esperas y retornos de FCFS de una CPU para todas las filas a la vez"""
+    acumulada = np.cumsum(rafagas, axis=1)
+    finales = acumulada + np.maximum.accumulate(llegadas - (acumulada - rafagas), axis=1)
+    retornos = finales - llegadas
+    return retornos - rafagas, retornos
+
+
+def _estadisticas_numpy(np: Any, esperas: Any, retornos: Any) -> List[Any]:
+    """ESTADISTICAS de cada fila; el p95 por rango más cercano, como metricas.percentil"""
+    k = max(1, math.ceil(0.95 * esperas.shape[1])) - 1
+    return [
+        esperas.mean(axis=1), np.partition(esperas, k, axis=1)[:, k],
+        retornos.mean(axis=1), np.partition(retornos, k, axis=1)[:, k],
+    ]
+
+
+def _planificar_replicacion(algoritmo: str, fila: Sequence[Sequence[int]],
+                            parametros: ParametrosPlanificacion) -> List[float]:
+    """ESTADISTICAS de una replicación ejecutando el planificador del algoritmo"""
+    procesos = [
+        Proceso(f"P{j + 1}", llegada, rafaga, algoritmo, prioridad, plazo)
+        for j, (llegada, rafaga, prioridad, plazo) in enumerate(zip(*fila))
+    ]
+    planificar_algoritmo(algoritmo, procesos, 0, None, parametros)
+    esperas = sorted(p.tiempo_espera for p in procesos)
+    retornos = sorted(p.tiempo_retorno for p in procesos)
+    return [fmean(esperas), percentil(esperas, 95), fmean(retornos), percentil(retornos, 95)]
+
+
+def intervalo(valores: Sequence[float]) -> Intervalo:
+    """Media e intervalo de confianza normal (CONFIANZA) de la media"""
+    media = fmean(valores)
+    if len(valores) < 2:
+        return media, media, media
+    margen = NormalDist().inv_cdf((1 + CONFIANZA) / 2) * stdev(valores, media) / math.sqrt(len(valores))
+    return media, media - margen, media + margen
+
+
+def replicar(
+    modelo: ModeloCarga,
+    replicaciones: int,
+    algoritmos: Sequence[str] = ALGORITMOS,
+    parametros: Optional[ParametrosPlanificacion] = None,
+    semilla: Optional[int] = None,
+    vectorizar: bool = True,
+) -> Dict[str, Dict[str, Intervalo]]:
+    """
+    Evalúa `replicaciones` workloads del modelo con cada algoritmo y retorna,
+    por algoritmo, el Intervalo de cada una de las ESTADISTICAS. Con
+    vectorizar=False (o sin numpy) no se usan matrices.
+    """
+    modelo.validar()
+    parametros = (parametros or ParametrosPlanificacion()).validar()
+    if replicaciones < 1:
+        raise ValueError("Se necesita al menos una replicación")
+    for algoritmo in algoritmos:
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+    np = None
+    if vectorizar:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+    bloques = (_bloques_numpy(np, modelo, replicaciones, semilla) if np is not None
+               else _bloques_python(modelo, replicaciones, semilla))
+    # FCFS con varios núcleos reparte entre CPUs: sin recurrencia vectorial
+    vectorial = {"FCFS"} if np is not None and parametros.nucleos == 1 else set()
+
+    # Por algoritmo, los valores de cada estadística en todas las replicaciones
+    valores: Dict[str, List[List[float]]] = {a: [[] for _ in ESTADISTICAS] for a in algoritmos}
+    for bloque in bloques:
+        filas = None
+        for algoritmo in algoritmos:
+            if algoritmo in vectorial:
+                columnas = _estadisticas_numpy(np, *_fcfs_numpy(np, bloque[0], bloque[1]))
+                for destino, columna in zip(valores[algoritmo], columnas):
+                    destino.extend(columna.tolist())
+                continue
+            if filas is None:
+                filas = list(zip(*(m.tolist() if np is not None else m for m in bloque)))
+            for fila in filas:
+                for destino, valor in zip(valores[algoritmo], _planificar_replicacion(algoritmo, fila, parametros)):
+                    destino.append(valor)
+    return {
+        algoritmo: {nombre: intervalo(v) for nombre, v in zip(ESTADISTICAS, valores[algoritmo])}
+        for algoritmo in algoritmos
+    }
+
+
+def texto_montecarlo(resultado: Dict[str, Dict[str, Intervalo]]) -> str:
+    """Una línea por algoritmo: cada estadística como media [inferior, superior]"""
+    lineas = []
+    for algoritmo, estimaciones in resultado.items():
+        partes = [f"{nombre} {media:.2f} [{inf:.2f}, {sup:.2f}]"
+                  for nombre, (media, inf, sup) in estimaciones.items()]
+        lineas.append(f"{algoritmo}: " + ", ".join(partes))
+    return "\n".join(lineas)
@@ -0,0 +1,54 @@
+"""
+Medición del tiempo de arranque por componente (opción --profile-startup).
+
+Las secciones se anidan; cuando el perfil no está activo, seccion() no mide
+nada y su costo es despreciable, así que puede quedar en el código de arranque.
+"""
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+PRESUPUESTO_MS = 500.0  # Presupuesto de arranque en frío, hasta el primer dibujo
+
+
+class PerfilArranque:
+    def __init__(self) -> None:
+        self.activo = False
+        self._inicio = time.perf_counter()
+        self._nivel = 0
+        self._secciones: List[list] = []  # [nivel, nombre, ms] en orden de inicio
+
+    def activar(self) -> None:
+        self.activo = True
+        self._inicio = time.perf_counter()
+
+    @contextmanager
+    def seccion(self, nombre: str) -> Iterator[None]:
+        if not self.activo:
+            yield
+            return
+        registro = [self._nivel, nombre, 0.0]
+        self._secciones.append(registro)
+        self._nivel += 1
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            registro[2] = (time.perf_counter() - inicio) * 1000
+            self._nivel -= 1
+
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self._inicio) * 1000
+
+    def informe(self, presupuesto_ms: float = PRESUPUESTO_MS) -> str:
+        """Tabla de tiempos por sección y total frente al presupuesto"""
+        lineas = ["Arranque (ms):"]
+        for nivel, nombre, ms in self._secciones:
+            lineas.append(f"{'  ' * nivel}{nombre:<{44 - 2 * nivel}} {ms:8.1f}")
+        total = self.total_ms()
+        estado = "OK" if total <= presupuesto_ms else "EXCEDIDO"
+        lineas.append(f"{'Total':<44} {total:8.1f}  (presupuesto {presupuesto_ms:.0f}: {estado})")
+        return "\n".join(lineas)
+
+
+perfil = PerfilArranque()
@@ -0,0 +1,88 @@
+"""
+Exportación e importación de resultados de una simulación.
+
+- CSV: una fila por proceso; al final, el tiempo de respuesta, los tramos
+  "inicio-fin" de los procesos expulsados (vacío si se ejecutaron de corrido),
+  el núcleo en que se ejecutó cada proceso (el de cada tramo, si cambió de
+  núcleo tras una E/S), su plazo (vacío si no tiene) y
+  su secuencia de ráfagas CPU, E/S, ..., CPU (vacía si no hace E/S).
+- Binario columnar (.fcb): contenedor de utils.binario con magic b"FCFSRES1",
+  columnas int64 de tiempos, algoritmo codificado como uint8 (tabla en la
+  cabecera) y nombres como blob UTF-8 + offsets. Se importa mapeando el
+  archivo en memoria, sin reparsear texto.
+"""
+import csv
+from typing import Callable, List, Optional, Sequence
+
+from model.proceso import Proceso
+from utils.binario import ArchivoColumnar, escribir_columnas
+from utils.checkpoint import columnas_procesos, procesos_desde_columnas
+
+MAGIC = b"FCFSRES1"
+EXTENSION_BINARIA = ".fcb"
+ENCABEZADOS_CSV = ["Proceso", "Tiempo Llegada", "Ráfaga", "Prioridad", "Algoritmo",
+                   "Tiempo Inicio", "Tiempo Final", "Tiempo Retorno", "Tiempo Espera",
+                   "Tiempo Respuesta", "Tramos", "Núcleo", "Plazo", "Secuencia"]
+_FILAS_POR_BLOQUE = 10000
+
+Progreso = Optional[Callable[[float], None]]
+
+
+def exportar_csv(ruta: str, procesos: Sequence[Proceso], progreso: Progreso = None) -> None:
+    """Escribe los resultados en CSV por bloques, informando el avance"""
+    total = len(procesos) or 1
+    with open(ruta, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(ENCABEZADOS_CSV)
+        for inicio in range(0, len(procesos), _FILAS_POR_BLOQUE):
+            writer.writerows(
+                [
+                    proceso.nombre,
+                    proceso.tiempo_llegada,
+                    proceso.rafaga,
+                    proceso.prioridad if proceso.prioridad is not None else "",
+                    proceso.algoritmo,
+                    proceso.tiempo_inicio,
+                    proceso.tiempo_final,
+                    proceso.tiempo_retorno,
+                    proceso.tiempo_espera,
+                    proceso.tiempo_respuesta if proceso.tiempo_final > 0 else 0,
+                    " ".join(f"{inicio}-{fin}" for inicio, fin in proceso.segmentos),
+                    " ".join(map(str, proceso.nucleos_tramos)) or proceso.nucleo,
+                    proceso.plazo if proceso.plazo is not None else "",
+                    proceso.texto_secuencia(),
+                ]
+                for proceso in procesos[inicio:inicio + _FILAS_POR_BLOQUE]
+            )
+            if progreso:
+                progreso(min(inicio + _FILAS_POR_BLOQUE, total) / total)
+
+
+def exportar_binario(ruta: str, procesos: Sequence[Proceso], progreso: Progreso = None) -> None:
+    """Escribe los resultados en el formato columnar binario"""
+    columnas, algoritmos = columnas_procesos(procesos)
+    if progreso:
+        progreso(0.5)  # La conversión a columnas es la mitad del trabajo
+    escribir_columnas(
+        ruta, MAGIC, {"algoritmos": algoritmos, "procesos": len(procesos)}, columnas,
+        progreso=(lambda f: progreso(0.5 + f / 2)) if progreso else None
+    )
+
+
+def exportar_resultados(ruta: str, procesos: Sequence[Proceso], progreso: Progreso = None) -> None:
+    """Exporta en binario si la extensión es .fcb, en CSV en cualquier otro caso"""
+    if ruta.lower().endswith(EXTENSION_BINARIA):
+        exportar_binario(ruta, procesos, progreso)
+    else:
+        exportar_csv(ruta, procesos, progreso)
+
+
+def abrir_resultados(ruta: str) -> ArchivoColumnar:
+    """Mapea en memoria un archivo de resultados binario (columnas sin copia)"""
+    return ArchivoColumnar(ruta, MAGIC)
+
+
+def importar_resultados(ruta: str) -> List[Proceso]:
+    """Carga los procesos y sus tiempos desde un archivo de resultados binario"""
+    with abrir_resultados(ruta) as archivo:
+        return procesos_desde_columnas(archivo, archivo.meta["algoritmos"])
@@ -0,0 +1,78 @@
+"""
+Caché de arranque: el workload de la última sesión junto con su planificación.
+
+Se guarda al cerrar la aplicación en el contenedor columnar de utils.binario
+(magic b"FCFSWRM1") y se mapea en memoria al iniciar, de modo que un workload
+grande reaparece ya planificado sin recalcular. La cabecera lleva una huella
+blake2b del contenido de todas las columnas: si el archivo no coincide con su
+huella (truncado, editado, de otra versión) se descarta. Al guardar, si la
+huella del workload actual es la misma que la del archivo, no se reescribe.
+"""
+import hashlib
+import os
+from typing import Dict, List, Optional, Sequence
+
+from model.proceso import Proceso
+from utils.binario import ArchivoColumnar, Columna, escribir_columnas
+from utils.checkpoint import columnas_procesos, procesos_desde_columnas
+
+MAGIC = b"FCFSWRM1"
+VERSION = 1
+
+
+def ruta_por_defecto() -> str:
+    """Archivo de la caché de arranque (junto a logs/ y trazas/)"""
+    ruta = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache')
+    os.makedirs(ruta, exist_ok=True)
+    return os.path.join(ruta, 'ultima_sesion.fcw')
+
+
+def _huella(algoritmos: List[str], columnas: Dict[str, Columna]) -> str:
+    """Huella del contenido: tabla de algoritmos y bytes de cada columna, en orden de nombre"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{VERSION}\0{chr(0).join(algoritmos)}".encode("utf-8"))
+    for nombre in sorted(columnas):
+        h.update(nombre.encode("utf-8") + b"\0")
+        h.update(columnas[nombre])
+    return h.hexdigest()
+
+
+def _huella_guardada(ruta: str) -> Optional[str]:
+    try:
+        with ArchivoColumnar(ruta, MAGIC) as archivo:
+            return archivo.meta.get("huella")
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def guardar_sesion(procesos: Sequence[Proceso], ruta: Optional[str] = None) -> bool:
+    """
+    Guarda el workload y su planificación; retorna False si no hizo falta
+    escribir porque el archivo ya tenía el mismo contenido.
+    """
+    ruta = ruta or ruta_por_defecto()
+    columnas, algoritmos = columnas_procesos(procesos)
+    huella = _huella(algoritmos, columnas)
+    if _huella_guardada(ruta) == huella:
+        return False
+    temporal = ruta + ".tmp"
+    escribir_columnas(temporal, MAGIC, {"version": VERSION, "algoritmos": algoritmos, "huella": huella}, columnas)
+    os.replace(temporal, ruta)  # Reemplazo atómico: nunca queda un archivo a medio escribir
+    return True
+
+
+def cargar_sesion(ruta: Optional[str] = None) -> Optional[List[Proceso]]:
+    """Procesos de la última sesión con sus tiempos, o None si no hay caché válida"""
+    ruta = ruta or ruta_por_defecto()
+    if not os.path.exists(ruta):
+        return None
+    try:
+        with ArchivoColumnar(ruta, MAGIC) as archivo:
+            meta = archivo.meta
+            if meta.get("version") != VERSION:
+                return None
+            if _huella(meta["algoritmos"], archivo.columnas) != meta.get("huella"):
+                return None
+            return procesos_desde_columnas(archivo, meta["algoritmos"])
+    except (OSError, ValueError, KeyError):
+        return None
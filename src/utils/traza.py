@@ -0,0 +1,222 @@
+"""
+Traza binaria de eventos de planificación.
+
+Formato (little-endian):
+
+    Cabecera: b"FCFSTRC1" (8 bytes)
+    Registros de ancho fijo, 16 bytes cada uno (struct "<B3xIiI"):
+        tipo     u8   LLEGADA, DESPACHO, FIN, REPLANIFICACION, DEFINICION o EXPULSION
+        proceso  u32  identificador del proceso dentro de la traza
+        delta    i32  tiempo del evento menos el tiempo del registro anterior
+        dato     u32  dato del evento (ver abajo)
+
+Un registro DEFINICION declara (o redefine) un proceso. Su campo dato es la
+longitud de la carga útil, que sigue inmediatamente en bloques de 16 bytes:
+"<iiiB" (llegada, ráfaga, prioridad, tiene_prioridad) + nombre UTF-8 + b"\\0" +
+algoritmo UTF-8 y, si el proceso tiene plazo, b"\\0" + "<i" (plazo); si hace
+E/S, en su lugar, b"\\0" + "<iBxH" (plazo, tiene_plazo, n) + n × "<i" (ráfagas
+CPU, E/S, ..., CPU); todo rellenado con ceros. En REPLANIFICACION
+el dato es el número de procesos replanificados y en DESPACHO, el núcleo que
+toma el proceso. Un proceso expulsado o bloqueado en E/S registra EXPULSION al
+dejar la CPU y un nuevo DESPACHO al reanudarse. El archivo solo se escribe por
+el final (append-only).
+"""
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from model.proceso import Proceso
+
+MAGIC = b"FCFSTRC1"
+REGISTRO = struct.Struct("<B3xIiI")
+CARGA_DEFINICION = struct.Struct("<iiiB")
+CARGA_PLAZO = struct.Struct("<i")
+CARGA_EXTENSION = struct.Struct("<iBxH")
+TAM_REGISTRO = REGISTRO.size
+
+LLEGADA = 1
+DESPACHO = 2
+FIN = 3
+REPLANIFICACION = 4
+DEFINICION = 5
+EXPULSION = 6
+
+NOMBRES_EVENTO = {
+    LLEGADA: "llegada",
+    DESPACHO: "despacho",
+    FIN: "fin",
+    REPLANIFICACION: "replanificación",
+    DEFINICION: "definición",
+    EXPULSION: "expulsión",
+}
+
+
+def directorio_trazas() -> str:
+    """Directorio por defecto de las trazas (junto a logs/)"""
+    ruta = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'trazas')
+    os.makedirs(ruta, exist_ok=True)
+    return ruta
+
+
+class GrabadorTraza:
+    """Escritor append-only de eventos de planificación (seguro entre hilos)"""
+
+    def __init__(self, ruta: Optional[str] = None) -> None:
+        if ruta is None:
+            ruta = os.path.join(
+                directorio_trazas(), f'traza_{datetime.now().strftime("%Y%m%d_%H%M%S")}.trc'
+            )
+        self.ruta = ruta
+        self._archivo = open(ruta, "wb", buffering=64 * 1024)
+        self._archivo.write(MAGIC)
+        self._lock = threading.Lock()
+        self._ultimo_tiempo = 0
+        self._ids: Dict[int, int] = {}
+        self._definidos: Dict[int, tuple] = {}  # Última definición escrita por proceso
+        self.eventos = 0
+
+    def _escribir(self, tipo: int, proceso: int, tiempo: int, dato: int = 0) -> None:
+        self._archivo.write(REGISTRO.pack(tipo, proceso, tiempo - self._ultimo_tiempo, dato))
+        self._ultimo_tiempo = tiempo
+        self.eventos += 1
+
+    def _id(self, proceso: Proceso) -> int:
+        return self._ids[id(proceso)]
+
+    def definir(self, procesos: List[Proceso], tiempo: int) -> None:
+        """Declara los procesos nuevos o modificados (los que no cambiaron se omiten)"""
+        with self._lock:
+            for p in procesos:
+                firma = (p.nombre, p.tiempo_llegada, p.rafaga, p.prioridad, p.algoritmo, p.plazo,
+                         tuple(p.secuencia))
+                if self._definidos.get(id(p)) == firma:
+                    continue
+                self._definidos[id(p)] = firma
+                pid = self._ids.setdefault(id(p), len(self._ids))
+                carga = CARGA_DEFINICION.pack(
+                    p.tiempo_llegada,
+                    p.rafaga,
+                    p.prioridad if p.prioridad is not None else 0,
+                    p.prioridad is not None,
+                ) + p.nombre.encode("utf-8") + b"\0" + p.algoritmo.encode("utf-8")
+                if p.secuencia:
+                    carga += b"\0" + CARGA_EXTENSION.pack(
+                        p.plazo if p.plazo is not None else 0, p.plazo is not None, len(p.secuencia)
+                    ) + struct.pack(f"<{len(p.secuencia)}i", *p.secuencia)
+                elif p.plazo is not None:
+                    carga += b"\0" + CARGA_PLAZO.pack(p.plazo)
+                self._escribir(DEFINICION, pid, tiempo, len(carga))
+                relleno = -len(carga) % TAM_REGISTRO
+                self._archivo.write(carga + b"\0" * relleno)
+
+    def registrar(self, tipo: int, procesos: List[Proceso], tiempo: int) -> None:
+        """Registra un evento para cada proceso indicado (deben estar definidos)"""
+        if not procesos:
+            return
+        with self._lock:
+            for p in procesos:
+                self._escribir(tipo, self._id(p), tiempo, p.nucleo_en(tiempo) if tipo == DESPACHO else 0)
+
+    def replanificacion(self, tiempo: int, cantidad: int) -> None:
+        with self._lock:
+            self._escribir(REPLANIFICACION, 0, tiempo, cantidad)
+
+    def cerrar(self) -> None:
+        with self._lock:
+            if not self._archivo.closed:
+                self._archivo.close()
+
+
+class ReproductorTraza:
+    """
+    Lector de trazas mapeado en memoria. Reconstruye los procesos y sus tiempos
+    a partir de los eventos, sin volver a ejecutar los planificadores.
+    """
+
+    def __init__(self, ruta: str) -> None:
+        self.ruta = ruta
+        with open(ruta, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{ruta} no es una traza válida")
+
+    def eventos(self):
+        """Itera (tipo, proceso, tiempo, dato, carga) decodificando los tiempos delta"""
+        datos = self._mmap
+        offset = len(MAGIC)
+        fin = len(datos) - (len(datos) - offset) % TAM_REGISTRO
+        tiempo = 0
+        while offset < fin:
+            tipo, proceso, delta, dato = REGISTRO.unpack_from(datos, offset)
+            offset += TAM_REGISTRO
+            tiempo += delta
+            carga = b""
+            if tipo == DEFINICION:
+                tam = dato + (-dato % TAM_REGISTRO)
+                carga = datos[offset:offset + dato]
+                offset += tam
+            yield tipo, proceso, tiempo, dato, carga
+
+    def cargar(self) -> Tuple[List[Proceso], int]:
+        """Reconstruye los procesos con los tiempos registrados y el último instante de la traza"""
+        procesos: Dict[int, Proceso] = {}
+        tramos: Dict[int, List[list]] = {}  # Tramos [inicio, fin] por proceso (fin None: abierto)
+        nucleos: Dict[int, List[int]] = {}  # Núcleo de cada tramo
+        ultimo = 0
+        for tipo, pid, tiempo, dato, carga in self.eventos():
+            ultimo = max(ultimo, tiempo)
+            if tipo == DEFINICION:
+                llegada, rafaga, prioridad, tiene_prioridad = CARGA_DEFINICION.unpack_from(carga)
+                nombre, _, resto = bytes(carga[CARGA_DEFINICION.size:]).partition(b"\0")
+                algoritmo, _, extension = resto.partition(b"\0")
+                p = procesos.get(pid)
+                if p is None:
+                    p = procesos[pid] = Proceso(nombre.decode("utf-8"), llegada, rafaga,
+                                                algoritmo.decode("utf-8"))
+                p.nombre = nombre.decode("utf-8")
+                p.algoritmo = algoritmo.decode("utf-8")
+                p.tiempo_llegada = llegada
+                p.rafaga = rafaga
+                p.prioridad = prioridad if tiene_prioridad else None
+                p.plazo = None
+                p.secuencia = []
+                if len(extension) == CARGA_PLAZO.size:
+                    p.plazo = CARGA_PLAZO.unpack(extension)[0]
+                elif len(extension) >= CARGA_EXTENSION.size:
+                    plazo, tiene_plazo, n = CARGA_EXTENSION.unpack_from(extension)
+                    p.plazo = plazo if tiene_plazo else None
+                    p.secuencia = list(struct.unpack_from(f"<{n}i", extension, CARGA_EXTENSION.size))
+            elif tipo == DESPACHO:
+                propios = tramos.setdefault(pid, [])
+                de_tramos = nucleos.setdefault(pid, [])
+                if propios and propios[-1][1] is None:
+                    propios[-1][0] = tiempo  # Redespacho tras una replanificación: reemplaza el tramo abierto
+                    de_tramos[-1] = dato
+                else:
+                    propios.append([tiempo, None])
+                    de_tramos.append(dato)
+                if len(propios) == 1:
+                    procesos[pid].tiempo_inicio = tiempo
+                procesos[pid].nucleo = dato
+            elif tipo in (EXPULSION, FIN):
+                if tramos.get(pid):
+                    tramos[pid][-1][1] = tiempo
+                if tipo == FIN:
+                    procesos[pid].tiempo_final = tiempo
+
+        for pid, p in procesos.items():
+            if p.tiempo_final > 0:
+                p.tiempo_retorno = p.tiempo_final - p.tiempo_llegada
+                p.tiempo_espera = p.tiempo_retorno - p.rafaga - p.tiempo_es
+                if len(tramos.get(pid, ())) > 1:
+                    p.segmentos = [(inicio, fin) for inicio, fin in tramos[pid]]
+                    if len(set(nucleos[pid])) > 1:
+                        p.nucleos_tramos = nucleos[pid]
+        return list(procesos.values()), ultimo
+
+    def cerrar(self) -> None:
+        self._mmap.close()
@@ -1,8 +1,21 @@
 import tkinter as tk
 from typing import List, Dict, Optional
 from model.proceso import Proceso
+from model.indice import IndiceIntervalos
+from view.gantt_layout import (
+    ALTO_BARRA, COLOR_GRILLA, COLOR_TIEMPO_ACTUAL, COLORES_ESTADO, FONDO_BARRA, PASO_FILA, X0, Y0,
+    calcular_disposicion, estados_tramos, filas_gantt,
+)
 import threading
 
+# Límites del dibujo en el canvas: con listas enormes solo se dibujan las primeras
+# filas y la escala/marcas del eje se ajustan para acotar la cantidad de items
+# (para diagramas completos, ver view.gantt_offscreen)
+GANTT_MAX_FILAS = 200
+GANTT_MAX_ANCHO = 30000  # px
+GANTT_MAX_MARCAS = 200
+GANTT_MAX_BARRAS_CARRIL = 500  # Procesos dibujados por carril en la vista por núcleo
+
 class GanttChart(tk.Frame):
     def __init__(self, master, procesos: List[Proceso]) -> None:
         super().__init__(master)
@@ -24,6 +37,11 @@ class GanttChart(tk.Frame):
         self.velocidad_animacion = 1.0
         self.animation_thread = None
         self.detener_animacion = False
+        self.indice: Optional[IndiceIntervalos] = None
+        self._indice_de: Optional[List[Proceso]] = None
+        # Vista por núcleo: un carril por CPU de cada algoritmo en lugar de una fila por proceso
+        self.por_nucleo = False
+        self.nucleos: Dict[str, int] = {}
         
         self.draw_gantt(procesos)
 
@@ -35,6 +53,23 @@ class GanttChart(tk.Frame):
         self.canvas.bind("<Shift-Button-4>", self._on_shift_mousewheel_linux_left)
         self.canvas.bind("<Shift-Button-5>", self._on_shift_mousewheel_linux_right)
 
+    def set_indice(self, procesos: List[Proceso], indice: IndiceIntervalos) -> None:
+        """Asocia el índice de intervalos ya construido para la lista de procesos"""
+        self._indice_de = procesos
+        self.indice = indice
+
+    def get_indice(self) -> IndiceIntervalos:
+        """Índice de la planificación dibujada (se construye si no fue provisto)"""
+        if self.indice is None or self._indice_de is not self.procesos:
+            self.set_indice(self.procesos, IndiceIntervalos(self.procesos))
+        return self.indice  # type: ignore[return-value]
+
+    def set_por_nucleo(self, por_nucleo: bool, nucleos: Optional[Dict[str, int]] = None) -> None:
+        """Alterna entre una fila por proceso y un carril por núcleo, y redibuja"""
+        self.por_nucleo = por_nucleo
+        self.nucleos = nucleos or {}
+        self.draw_gantt(self.procesos, self.tiempo_actual_animacion)
+
     def draw_gantt(self, procesos: List[Proceso], tiempo_actual: int = 0) -> None:
         """Dibuja el diagrama de Gantt con progreso en tiempo real"""
         self.procesos = procesos  # <-- Asegura que la lista esté actualizada
@@ -43,124 +78,110 @@ class GanttChart(tk.Frame):
             return
 
         # Mostrar todos los procesos con ráfaga > 0
-        procesos_con_tiempo = [p for p in procesos if p.rafaga > 0]
-        if not procesos_con_tiempo:
+        disp = calcular_disposicion(procesos, tiempo_actual, GANTT_MAX_ANCHO, GANTT_MAX_MARCAS)
+        if disp is None:
             return
 
-        min_ti = min((p.tiempo_inicio for p in procesos_con_tiempo), default=0)
-        max_tf = max((p.tiempo_final for p in procesos_con_tiempo), default=0)
-        max_tf = max(max_tf, tiempo_actual + 5)
-        total_time = max_tf - min_ti
-
-        x0 = 80
-        y0 = 40
-        height = 30
-        scale = 40  # Escala ajustable
+        filas = filas_gantt(procesos, self.por_nucleo, self.nucleos)
+        omitidos = max(0, len(filas) - GANTT_MAX_FILAS)
+        n_filas = len(filas) - omitidos
+        alto_filas = n_filas * PASO_FILA
 
         # Ajustar el tamaño del canvas dinámicamente según la cantidad de procesos
-        canvas_width = x0 + int(total_time * scale) + 100
-        canvas_height = y0 + len(procesos) * 50 + 100
+        canvas_width = disp.ancho()
+        canvas_height = Y0 + alto_filas + 100
         self.canvas.config(width=canvas_width, height=canvas_height)
         self.canvas.config(scrollregion=(0, 0, canvas_width, canvas_height))
 
         # Dibujar línea de tiempo actual
         if tiempo_actual >= 0:
-            x_actual = x0 + scale * (tiempo_actual - min_ti)
+            x_actual = disp.x(tiempo_actual)
             self.canvas.create_line(
-                x_actual, y0 - 30, x_actual, y0 + len(procesos) * 50,
-                fill="red", width=3, tags="tiempo_actual"
+                x_actual, Y0 - 30, x_actual, Y0 + alto_filas,
+                fill=COLOR_TIEMPO_ACTUAL, width=3, tags="tiempo_actual"
             )
             self.canvas.create_text(
-                x_actual, y0 - 35, text=f"T={tiempo_actual}",
-                font=("Arial", 10, "bold"), fill="red"
+                x_actual, Y0 - 35, text=f"T={tiempo_actual}",
+                font=("Arial", 10, "bold"), fill=COLOR_TIEMPO_ACTUAL
             )
 
-        # Dibujar procesos
-        for idx, p in enumerate(procesos):
-            y = y0 + idx * 50
-
-            if p.rafaga > 0:
-                x_inicio = x0 + scale * (p.tiempo_inicio - min_ti)
-                x_fin = x0 + scale * (p.tiempo_final - min_ti)
-
-                # Fondo de la barra (gris claro)
-                self.canvas.create_rectangle(
-                    x_inicio, y, x_fin, y + height,
-                    fill="#e8e8e8", outline="#cccccc", width=1
-                )
-
-                # Barra de progreso (según el estado)
-                if p.tiempo_final > 0 and tiempo_actual >= p.tiempo_final:
-                    # Proceso completado
-                    color_fill = "#4CAF50"  # Verde
-                    color_outline = "#2E7D32"
+        # Procesos en ejecución según el índice de intervalos
+        ejecutando = {id(p) for p in self.get_indice().en_ejecucion(tiempo_actual)}
+
+        # Dibujar filas (un proceso, o todos los de un núcleo en la vista por núcleo)
+        for idx in range(n_filas):
+            etiqueta, info, de_la_fila = filas[idx]
+            y = Y0 + idx * PASO_FILA
+
+            for p in de_la_fila[:GANTT_MAX_BARRAS_CARRIL]:
+                if p.rafaga <= 0:
+                    continue
+                # Un rectángulo por tramo de ejecución (varios si el proceso fue expulsado)
+                for n_tramo, (inicio, final, estado) in enumerate(estados_tramos(p, tiempo_actual, ejecutando)):
+                    x_inicio = disp.x(inicio)
+                    x_fin = disp.x(final)
+
+                    # Fondo de la barra (gris claro)
                     self.canvas.create_rectangle(
-                        x_inicio, y, x_fin, y + height,
-                        fill=color_fill, outline=color_outline, width=2
+                        x_inicio, y, x_fin, y + ALTO_BARRA,
+                        fill=FONDO_BARRA[0], outline=FONDO_BARRA[1], width=1
                     )
-                elif p.tiempo_inicio > 0 and tiempo_actual >= p.tiempo_inicio and tiempo_actual < p.tiempo_final:
-                    # Proceso en ejecución
-                    progreso = min(tiempo_actual, p.tiempo_final)
-                    x_progreso = x0 + scale * (progreso - min_ti)
-                    color_fill = "#2196F3"  # Azul
-                    color_outline = "#1565C0"
-                    self.canvas.create_rectangle(
-                        x_inicio, y, x_progreso, y + height,
-                        fill=color_fill, outline=color_outline, width=2
+
+                    # Barra de progreso (según el estado: completado, en ejecución o listo)
+                    if estado is not None:
+                        nombre_estado, fin = estado
+                        color_fill, color_outline = COLORES_ESTADO[nombre_estado]
+                        self.canvas.create_rectangle(
+                            x_inicio, y, disp.x(fin), y + ALTO_BARRA,
+                            fill=color_fill, outline=color_outline, width=2
+                        )
+
+                    # Texto del proceso (en el primer tramo; en cada tramo en la vista por núcleo)
+                    if n_tramo == 0 or self.por_nucleo:
+                        text_x = x_inicio + (x_fin - x_inicio) / 2
+                        self.canvas.create_text(
+                            text_x, y + ALTO_BARRA/2, text=p.nombre,
+                            font=("Arial", 10, "bold"), fill="white"
+                        )
+
+                    # Etiquetas de tiempo
+                    self.canvas.create_text(
+                        x_inicio, y + ALTO_BARRA + 10, text=str(inicio),
+                        font=("Arial", 8), anchor="n"
                     )
-                elif p.tiempo_llegada <= tiempo_actual:
-                    # Proceso listo pero no iniciado
-                    color_fill = "#FFC107"  # Amarillo
-                    color_outline = "#F57C00"
-                    self.canvas.create_rectangle(
-                        x_inicio, y, x_fin, y + height,
-                        fill=color_fill, outline=color_outline, width=2
+                    self.canvas.create_text(
+                        x_fin, y + ALTO_BARRA + 10, text=str(final),
+                        font=("Arial", 8), anchor="n"
                     )
 
-                # Texto del proceso
-                text_x = x_inicio + (x_fin - x_inicio) / 2
-                self.canvas.create_text(
-                    text_x, y + height/2, text=p.nombre,
-                    font=("Arial", 10, "bold"), fill="white"
-                )
-
-                # Etiquetas de tiempo
-                self.canvas.create_text(
-                    x_inicio, y + height + 10, text=str(p.tiempo_inicio),
-                    font=("Arial", 8), anchor="n"
-                )
-                self.canvas.create_text(
-                    x_fin, y + height + 10, text=str(p.tiempo_final),
-                    font=("Arial", 8), anchor="n"
-                )
-
-            # Nombre del proceso (siempre visible)
+            # Nombre del proceso o del núcleo (siempre visible)
             self.canvas.create_text(
-                x0 - 50, y + height/2, text=p.nombre,
+                X0 - 50, y + ALTO_BARRA/2, text=etiqueta,
                 font=("Arial", 11, "bold"), anchor="w"
             )
 
             # Información adicional
-            info_text = f"Llegada: {p.tiempo_llegada}"
-            if p.prioridad is not None:
-                info_text += f", Prioridad: {p.prioridad}"
-            if p.tiempo_espera > 0:
-                info_text += f", Espera: {p.tiempo_espera}"
-
             self.canvas.create_text(
-                x0 - 50, y + height + 20, text=info_text,
+                X0 - 50, y + ALTO_BARRA + 20, text=info,
                 font=("Arial", 8), anchor="w", fill="gray"
             )
 
+        if omitidos:
+            self.canvas.create_text(
+                X0 - 50, Y0 + alto_filas + 10,
+                text=f"... y {omitidos} {'carriles' if self.por_nucleo else 'procesos'} más (no dibujados)",
+                font=("Arial", 10, "italic"), anchor="w", fill="gray"
+            )
+
         # Eje de tiempo
-        for t in range(int(min_ti), int(max_tf) + 1):
-            xt = x0 + (t - min_ti) * scale
+        for t in disp.marcas():
+            xt = disp.x(t)
             self.canvas.create_line(
-                xt, y0 - 20, xt, y0 + len(procesos) * 50,
-                fill="#dddddd", dash=(1, 2)
+                xt, Y0 - 20, xt, Y0 + alto_filas,
+                fill=COLOR_GRILLA, dash=(1, 2)
             )
             self.canvas.create_text(
-                xt, y0 - 25, text=str(t),
+                xt, Y0 - 25, text=str(t),
                 font=("Arial", 9)
             )
 
@@ -182,10 +203,9 @@ class GanttChart(tk.Frame):
         import time
         while self.animando and not self.detener_animacion:
             # Recalcular el tiempo final máximo en cada ciclo para incluir procesos nuevos
-            procesos_con_final = [p for p in self.procesos if p.tiempo_final > 0]
-            if not procesos_con_final:
+            tiempo_final_max = self.get_indice().tiempo_final_max
+            if tiempo_final_max == 0:
                 break
-            tiempo_final_max = max(p.tiempo_final for p in procesos_con_final)
 
             # Actualizar en el hilo principal de tkinter
             self.after(0, self._actualizar_frame)
@@ -197,9 +217,8 @@ class GanttChart(tk.Frame):
                 break
 
         # Asegura que el último frame se dibuje exactamente en el tiempo final máximo
-        procesos_con_final = [p for p in self.procesos if p.tiempo_final > 0]
-        if procesos_con_final:
-            tiempo_final_max = max(p.tiempo_final for p in procesos_con_final)
+        tiempo_final_max = self.get_indice().tiempo_final_max
+        if tiempo_final_max > 0:
             self.tiempo_actual_animacion = tiempo_final_max
             self.after(0, self._actualizar_frame)
 
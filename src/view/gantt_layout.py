@@ -0,0 +1,195 @@
+"""
+Reglas de disposición del diagrama de Gantt, sin dependencias de Tk.
+
+Las usan tanto GanttChart.draw_gantt (canvas de Tk) como los renderizadores
+fuera de pantalla de view.gantt_offscreen, para que ambos dibujen lo mismo.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from model.proceso import Proceso
+from utils.metricas import utilizacion_por_nucleo
+
+X0 = 80            # Margen izquierdo (nombres de los procesos)
+Y0 = 40            # Margen superior (eje de tiempo)
+ALTO_BARRA = 30
+PASO_FILA = 50     # Distancia vertical entre filas
+ESCALA = 40        # Píxeles por unidad de tiempo (antes de acotar el ancho)
+
+FONDO_BARRA = ("#e8e8e8", "#cccccc")
+COLORES_ESTADO = {
+    "completado": ("#4CAF50", "#2E7D32"),  # Verde
+    "ejecutando": ("#2196F3", "#1565C0"),  # Azul
+    "listo": ("#FFC107", "#F57C00"),       # Amarillo
+}
+COLOR_TIEMPO_ACTUAL = "red"
+COLOR_GRILLA = "#dddddd"
+MAX_TRAMOS_TEXTO = 6  # Tramos listados en la tabla antes de abreviar
+
+
+class Disposicion:
+    """Escala horizontal y rango de tiempo de un diagrama"""
+
+    __slots__ = ("min_ti", "max_tf", "total_time", "scale", "paso_marcas")
+
+    def __init__(self, min_ti: int, max_tf: int, scale: float, paso_marcas: int) -> None:
+        self.min_ti = min_ti
+        self.max_tf = max_tf
+        self.total_time = max_tf - min_ti
+        self.scale = scale
+        self.paso_marcas = paso_marcas
+
+    def x(self, t: float) -> float:
+        return X0 + self.scale * (t - self.min_ti)
+
+    def ancho(self) -> int:
+        return X0 + int(self.total_time * self.scale) + 100
+
+    def marcas(self) -> range:
+        return range(int(self.min_ti), int(self.max_tf) + 1, self.paso_marcas)
+
+
+def calcular_disposicion(procesos: Iterable[Proceso], tiempo_actual: int,
+                         ancho_max: float, max_marcas: int) -> Optional[Disposicion]:
+    """Disposición para los procesos con ráfaga > 0, o None si no hay ninguno"""
+    con_tiempo = [p for p in procesos if p.rafaga > 0]
+    if not con_tiempo:
+        return None
+    min_ti = min(p.tiempo_inicio for p in con_tiempo)
+    max_tf = max(max(p.tiempo_final for p in con_tiempo), tiempo_actual + 5)
+    total_time = max_tf - min_ti
+    scale = min(ESCALA, ancho_max / max(total_time, 1))
+    paso = max(1, -(-total_time // max_marcas))
+    return Disposicion(min_ti, max_tf, scale, paso)
+
+
+def estado_barra(p: Proceso, tiempo_actual: int, ejecutando: Set[int]) -> Optional[Tuple[str, int]]:
+    """
+    Estado del proceso en tiempo_actual y hasta qué instante se pinta su barra:
+    ("completado" | "ejecutando" | "listo", fin), o None si aún no llegó.
+    """
+    if p.tiempo_final > 0 and tiempo_actual >= p.tiempo_final:
+        return "completado", p.tiempo_final
+    if id(p) in ejecutando:
+        return "ejecutando", min(tiempo_actual, p.tiempo_final)
+    if p.tiempo_llegada <= tiempo_actual:
+        return "listo", p.tiempo_final
+    return None
+
+
+def estados_tramos(p: Proceso, tiempo_actual: int,
+                   ejecutando: Set[int]) -> List[Tuple[int, int, Optional[Tuple[str, int]]]]:
+    """
+    (inicio, fin, estado) de cada tramo de ejecución del proceso, con el estado
+    como en estado_barra(). Un proceso sin expulsiones tiene un único tramo.
+    """
+    if not p.segmentos:
+        return [(p.tiempo_inicio, p.tiempo_final, estado_barra(p, tiempo_actual, ejecutando))]
+    tramos: List[Tuple[int, int, Optional[Tuple[str, int]]]] = []
+    for inicio, fin in p.segmentos:
+        if tiempo_actual >= fin:
+            estado: Optional[Tuple[str, int]] = ("completado", fin)
+        elif inicio <= tiempo_actual:
+            estado = ("ejecutando", tiempo_actual)
+        elif p.tiempo_llegada <= tiempo_actual:
+            estado = ("listo", fin)
+        else:
+            estado = None
+        tramos.append((inicio, fin, estado))
+    return tramos
+
+
+def texto_tramos(p: Proceso) -> str:
+    """Tramos de un proceso expulsado ("0-2, 5-8"); vacío si se ejecutó de corrido"""
+    if not p.segmentos:
+        return ""
+    texto = ", ".join(f"{inicio}-{fin}" for inicio, fin in p.segmentos[:MAX_TRAMOS_TEXTO])
+    if len(p.segmentos) > MAX_TRAMOS_TEXTO:
+        texto += f", … ({len(p.segmentos)} tramos)"
+    return texto
+
+
+def texto_info(p: Proceso) -> str:
+    """Línea de información bajo el nombre del proceso"""
+    info_text = f"Llegada: {p.tiempo_llegada}"
+    if p.prioridad is not None:
+        info_text += f", Prioridad: {p.prioridad}"
+    if p.plazo is not None:
+        info_text += f", Plazo: {p.plazo}"
+    if p.secuencia:
+        info_text += f", E/S: {p.tiempo_es}"
+    if p.tiempo_espera > 0:
+        info_text += f", Espera: {p.tiempo_espera}"
+    if p.segmentos:
+        info_text += f", Respuesta: {p.tiempo_respuesta}, Tramos: {len(p.segmentos)}"
+    return info_text
+
+
+# Fila del diagrama: (etiqueta, línea de información, procesos dibujados en ella)
+Fila = Tuple[str, str, Sequence[Proceso]]
+
+
+class FilasPorProceso(Sequence[Fila]):
+    """Una fila por proceso, construida al pedirla (sin copias de la lista)"""
+
+    __slots__ = ("_procesos",)
+
+    def __init__(self, procesos: Sequence[Proceso]) -> None:
+        self._procesos = procesos
+
+    def __len__(self) -> int:
+        return len(self._procesos)
+
+    def __getitem__(self, idx):  # type: ignore[override]
+        p = self._procesos[idx]
+        return p.nombre, texto_info(p), (p,)
+
+
+class TramosEnNucleo:
+    """
+    Parte de un proceso que cambió de núcleo entre ráfagas: se dibuja como el
+    proceso, pero solo con sus tramos en un núcleo (vista por núcleo)
+    """
+
+    __slots__ = ("_proceso", "segmentos")
+
+    def __init__(self, proceso: Proceso, segmentos: List[Tuple[int, int]]) -> None:
+        self._proceso = proceso
+        self.segmentos = segmentos
+
+    def __getattr__(self, nombre: str):
+        return getattr(self._proceso, nombre)
+
+
+def filas_por_nucleo(procesos: Iterable[Proceso], nucleos: Optional[Dict[str, int]] = None) -> List[Fila]:
+    """
+    Un carril por núcleo de cada algoritmo (cada algoritmo planifica sus propias
+    CPUs), con los procesos que se ejecutaron en él y su utilización. Un proceso
+    que cambió de núcleo aparece en cada uno con los tramos que corrió allí.
+    `nucleos` indica cuántos núcleos mostrar por algoritmo (también los ociosos).
+    """
+    por_algoritmo: Dict[str, Dict[int, list]] = {}
+    todos_por_algoritmo: Dict[str, List[Proceso]] = {}
+    for p in procesos:
+        carriles = por_algoritmo.setdefault(p.algoritmo, {})
+        todos_por_algoritmo.setdefault(p.algoritmo, []).append(p)
+        if not p.nucleos_tramos:
+            carriles.setdefault(p.nucleo, []).append(p)
+            continue
+        partes: Dict[int, List[Tuple[int, int]]] = {}
+        for tramo, nucleo in zip(p.segmentos, p.nucleos_tramos):
+            partes.setdefault(nucleo, []).append(tramo)
+        for nucleo, segmentos in partes.items():
+            carriles.setdefault(nucleo, []).append(TramosEnNucleo(p, segmentos))
+    filas: List[Fila] = []
+    for algoritmo, carriles in por_algoritmo.items():
+        todos = todos_por_algoritmo[algoritmo]
+        usos = utilizacion_por_nucleo(todos, (nucleos or {}).get(algoritmo, 1))
+        for nucleo, uso in enumerate(usos):
+            filas.append((f"{algoritmo} · CPU {nucleo}", f"Uso: {uso:.0%}", carriles.get(nucleo, [])))
+    return filas
+
+
+def filas_gantt(procesos: Sequence[Proceso], por_nucleo: bool = False,
+                nucleos: Optional[Dict[str, int]] = None) -> Sequence[Fila]:
+    """Filas a dibujar: una por proceso o, con `por_nucleo`, una por núcleo"""
+    return filas_por_nucleo(procesos, nucleos) if por_nucleo else FilasPorProceso(procesos)
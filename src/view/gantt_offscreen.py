@@ -0,0 +1,244 @@
+"""
+Renderizado del diagrama de Gantt fuera de pantalla (sin Tk), para trabajos por
+lotes y reportes. Usa las mismas reglas de disposición que GanttChart.draw_gantt
+(view.gantt_layout): posiciones de las barras, colores por estado y etiquetas.
+
+- SVG: los elementos se escriben en el archivo a medida que se generan; la
+  memoria no depende de la cantidad de procesos (salvo el índice de intervalos).
+- PNG: se rasteriza por franjas horizontales en un buffer de píxeles de NumPy
+  que se comprimen y escriben una a una, así que solo una franja vive en memoria.
+  NumPy es opcional: solo se importa al pedir un PNG. El PNG no lleva texto
+  (no hay rasterizador de fuentes sin dependencias extra); para etiquetas, usar SVG.
+"""
+import struct
+import zlib
+from typing import Dict, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from model.indice import IndiceIntervalos
+from model.proceso import Proceso
+from view.gantt_layout import (
+    ALTO_BARRA, COLOR_GRILLA, COLOR_TIEMPO_ACTUAL, COLORES_ESTADO, FONDO_BARRA, PASO_FILA, X0, Y0,
+    Disposicion, calcular_disposicion, estados_tramos, filas_gantt,
+)
+
+SVG_MAX_ANCHO = 200000  # px
+PNG_MAX_ANCHO = 4000    # px
+PNG_MAX_ALTO = 20000    # px: con más procesos que píxeles, varias filas comparten píxel
+MAX_MARCAS = 200
+FILAS_POR_FRANJA = 512  # Filas de píxeles por franja del PNG
+
+
+def _instante(indice: IndiceIntervalos, tiempo_actual: Optional[int]) -> int:
+    """Por defecto se dibuja el final de la planificación (todo completado)"""
+    return indice.tiempo_final_max if tiempo_actual is None else tiempo_actual
+
+
+def renderizar_svg(
+    ruta: str,
+    procesos: Sequence[Proceso],
+    tiempo_actual: Optional[int] = None,
+    indice: Optional[IndiceIntervalos] = None,
+    ancho_max: float = SVG_MAX_ANCHO,
+    por_nucleo: bool = False,
+    nucleos: Optional[Dict[str, int]] = None,
+) -> None:
+    """Escribe el diagrama completo (todas las filas) como SVG"""
+    indice = indice or IndiceIntervalos(procesos)
+    tiempo_actual = _instante(indice, tiempo_actual)
+    disp = calcular_disposicion(procesos, tiempo_actual, ancho_max, MAX_MARCAS)
+    filas = filas_gantt(procesos, por_nucleo, nucleos)
+    alto_filas = len(filas) * PASO_FILA
+    ancho = disp.ancho() if disp else X0 + 100
+    alto = Y0 + alto_filas + 100
+    ejecutando = {id(p) for p in indice.en_ejecucion(tiempo_actual)}
+
+    with open(ruta, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        f.write(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{ancho}" height="{alto}" '
+            f'viewBox="0 0 {ancho} {alto}" font-family="Arial">\n'
+            f'<rect width="100%" height="100%" fill="white"/>\n'
+        )
+        if disp is None:
+            f.write("</svg>\n")
+            return
+
+        # Eje de tiempo
+        for t in disp.marcas():
+            xt = disp.x(t)
+            f.write(
+                f'<line x1="{xt:.1f}" y1="{Y0 - 20}" x2="{xt:.1f}" y2="{Y0 + alto_filas}" '
+                f'stroke="{COLOR_GRILLA}" stroke-dasharray="1,2"/>'
+                f'<text x="{xt:.1f}" y="{Y0 - 25}" font-size="9" text-anchor="middle">{t}</text>\n'
+            )
+
+        # Filas (un proceso, o todos los de un núcleo en la vista por núcleo)
+        for idx, (etiqueta, info, de_la_fila) in enumerate(filas):
+            y = Y0 + idx * PASO_FILA
+            partes = []
+            for p in de_la_fila:
+                if p.rafaga <= 0:
+                    continue
+                for n_tramo, (inicio, final, estado) in enumerate(estados_tramos(p, tiempo_actual, ejecutando)):
+                    x_inicio = disp.x(inicio)
+                    x_fin = disp.x(final)
+                    partes.append(
+                        f'<rect x="{x_inicio:.1f}" y="{y}" width="{x_fin - x_inicio:.1f}" height="{ALTO_BARRA}" '
+                        f'fill="{FONDO_BARRA[0]}" stroke="{FONDO_BARRA[1]}"/>'
+                    )
+                    if estado is not None:
+                        nombre_estado, fin = estado
+                        relleno, borde = COLORES_ESTADO[nombre_estado]
+                        partes.append(
+                            f'<rect x="{x_inicio:.1f}" y="{y}" width="{disp.x(fin) - x_inicio:.1f}" '
+                            f'height="{ALTO_BARRA}" fill="{relleno}" stroke="{borde}" stroke-width="2"/>'
+                        )
+                    if n_tramo == 0 or por_nucleo:
+                        partes.append(
+                            f'<text x="{(x_inicio + x_fin) / 2:.1f}" y="{y + ALTO_BARRA / 2}" font-size="10" '
+                            f'font-weight="bold" fill="white" text-anchor="middle" '
+                            f'dominant-baseline="middle">{escape(p.nombre)}</text>'
+                        )
+                    partes.append(
+                        f'<text x="{x_inicio:.1f}" y="{y + ALTO_BARRA + 18}" font-size="8" '
+                        f'text-anchor="middle">{inicio}</text>'
+                        f'<text x="{x_fin:.1f}" y="{y + ALTO_BARRA + 18}" font-size="8" '
+                        f'text-anchor="middle">{final}</text>'
+                    )
+            partes.append(
+                f'<text x="{X0 - 50}" y="{y + ALTO_BARRA / 2}" font-size="11" font-weight="bold" '
+                f'dominant-baseline="middle">{escape(etiqueta)}</text>'
+                f'<text x="{X0 - 50}" y="{y + ALTO_BARRA + 20}" font-size="8" fill="gray" '
+                f'dominant-baseline="middle">{escape(info)}</text>\n'
+            )
+            f.write("".join(partes))
+
+        # Línea de tiempo actual (encima de las barras)
+        x_actual = disp.x(tiempo_actual)
+        f.write(
+            f'<line x1="{x_actual:.1f}" y1="{Y0 - 30}" x2="{x_actual:.1f}" y2="{Y0 + alto_filas}" '
+            f'stroke="{COLOR_TIEMPO_ACTUAL}" stroke-width="3"/>'
+            f'<text x="{x_actual:.1f}" y="{Y0 - 35}" font-size="10" font-weight="bold" '
+            f'fill="{COLOR_TIEMPO_ACTUAL}" text-anchor="middle">T={tiempo_actual}</text>\n'
+            "</svg>\n"
+        )
+
+
+def _rgb(color: str) -> Tuple[int, int, int]:
+    nombres = {"red": "#ff0000", "white": "#ffffff"}
+    color = nombres.get(color, color).lstrip("#")
+    return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+
+def _chunk_png(f, tipo: bytes, datos: bytes) -> None:
+    f.write(struct.pack(">I", len(datos)) + tipo + datos + struct.pack(">I", zlib.crc32(tipo + datos)))
+
+
+def renderizar_png(
+    ruta: str,
+    procesos: Sequence[Proceso],
+    tiempo_actual: Optional[int] = None,
+    indice: Optional[IndiceIntervalos] = None,
+    ancho_max: float = PNG_MAX_ANCHO,
+    alto_max: int = PNG_MAX_ALTO,
+    por_nucleo: bool = False,
+    nucleos: Optional[Dict[str, int]] = None,
+) -> None:
+    """Rasteriza el diagrama completo (sin texto) a un PNG RGB, franja por franja"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Renderizar PNG requiere numpy (pip install numpy); use .svg en su lugar") from None
+
+    indice = indice or IndiceIntervalos(procesos)
+    tiempo_actual = _instante(indice, tiempo_actual)
+    disp = calcular_disposicion(procesos, tiempo_actual, ancho_max, MAX_MARCAS)
+    if disp is None:
+        disp = Disposicion(0, 1, 1.0, 1)
+    carriles = filas_gantt(procesos, por_nucleo, nucleos)
+
+    # Con muchas filas se reduce el paso entre ellas para acotar el alto de la imagen
+    n = max(len(carriles), 1)
+    paso_fila = min(float(PASO_FILA), (alto_max - Y0 - 100) / n)
+    alto_barra = max(1, int(round(ALTO_BARRA * paso_fila / PASO_FILA)))
+    ancho = disp.ancho()
+    alto = int(Y0 + n * paso_fila + 100)
+    ejecutando = {id(p) for p in indice.en_ejecucion(tiempo_actual)}
+
+    fondo = np.array(_rgb(FONDO_BARRA[0]), dtype=np.uint8)
+    colores = {estado: (np.array(_rgb(r), np.uint8), np.array(_rgb(b), np.uint8))
+               for estado, (r, b) in COLORES_ESTADO.items()}
+    grilla = np.array(_rgb(COLOR_GRILLA), dtype=np.uint8)
+    rojo = np.array(_rgb(COLOR_TIEMPO_ACTUAL), dtype=np.uint8)
+    marcas = [int(disp.x(t)) for t in disp.marcas()]
+    x_actual = int(disp.x(tiempo_actual))
+    y_eje_fin = int(Y0 + n * paso_fila)
+
+    def px(t: int) -> int:
+        return min(ancho - 1, max(0, int(disp.x(t))))
+
+    compresor = zlib.compressobj(6)
+    with open(ruta, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _chunk_png(f, b"IHDR", struct.pack(">IIBBBBB", ancho, alto, 8, 2, 0, 0, 0))
+
+        for y_a in range(0, alto, FILAS_POR_FRANJA):
+            y_b = min(alto, y_a + FILAS_POR_FRANJA)
+            franja = np.full((y_b - y_a, ancho, 3), 255, dtype=np.uint8)
+
+            # Grilla punteada del eje de tiempo
+            g_a, g_b = max(y_a, Y0 - 20), min(y_b, y_eje_fin)
+            if g_a < g_b:
+                for xt in marcas:
+                    if 0 <= xt < ancho:
+                        franja[g_a - y_a:g_b - y_a:2, xt] = grilla
+
+            # Filas que tocan la franja
+            primero = max(0, int((y_a - Y0 - alto_barra) // paso_fila))
+            ultimo = min(len(carriles), int((y_b - Y0) // paso_fila) + 1)
+            for idx in range(primero, ultimo):
+                y0 = int(Y0 + idx * paso_fila)
+                r_a, r_b = max(y0, y_a) - y_a, min(y0 + alto_barra, y_b) - y_a
+                if r_a >= r_b:
+                    continue
+                for inicio, final, estado in (
+                    tramo for p in carriles[idx][2] if p.rafaga > 0
+                    for tramo in estados_tramos(p, tiempo_actual, ejecutando)
+                ):
+                    x_a = px(inicio)
+                    franja[r_a:r_b, x_a:max(px(final), x_a + 1)] = fondo
+                    if estado is not None:
+                        relleno, borde = colores[estado[0]]
+                        x_e = max(px(estado[1]), x_a + 1)
+                        franja[r_a:r_b, x_a:x_e] = borde
+                        if alto_barra > 4 and x_e - x_a > 4:
+                            # Relleno dentro de un borde de 2 px
+                            i_a = max(y0 + 2, y_a) - y_a
+                            i_b = min(y0 + alto_barra - 2, y_b) - y_a
+                            if i_a < i_b:
+                                franja[i_a:i_b, x_a + 2:x_e - 2] = relleno
+
+            # Línea de tiempo actual (3 px)
+            l_a, l_b = max(y_a, Y0 - 30), min(y_b, y_eje_fin)
+            if l_a < l_b:
+                franja[l_a - y_a:l_b - y_a, max(0, x_actual - 1):min(ancho, x_actual + 2)] = rojo
+
+            # Cada fila de píxeles va precedida del byte de filtro (0 = ninguno)
+            filas = np.zeros((y_b - y_a, ancho * 3 + 1), dtype=np.uint8)
+            filas[:, 1:] = franja.reshape(y_b - y_a, ancho * 3)
+            datos = compresor.compress(filas.tobytes())
+            if datos:
+                _chunk_png(f, b"IDAT", datos)
+
+        _chunk_png(f, b"IDAT", compresor.flush())
+        _chunk_png(f, b"IEND", b"")
+
+
+def renderizar_gantt(ruta: str, procesos: Sequence[Proceso], tiempo_actual: Optional[int] = None,
+                     indice: Optional[IndiceIntervalos] = None, por_nucleo: bool = False,
+                     nucleos: Optional[Dict[str, int]] = None) -> None:
+    """Renderiza a PNG si la extensión es .png, a SVG en cualquier otro caso"""
+    if ruta.lower().endswith(".png"):
+        renderizar_png(ruta, procesos, tiempo_actual, indice, por_nucleo=por_nucleo, nucleos=nucleos)
+    else:
+        renderizar_svg(ruta, procesos, tiempo_actual, indice, por_nucleo=por_nucleo, nucleos=nucleos)
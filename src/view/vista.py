@@ -1,8 +1,28 @@
+import datetime
 import tkinter as tk
+from collections import deque
 from tkinter import ttk, messagebox
 from model.proceso import Proceso
-from typing import Callable, List, Optional, Any
+from model.indice import IndiceIntervalos
+from typing import Callable, List, Optional, Any, Sequence, Tuple
 from view.gantt import GanttChart
+from view.gantt_layout import texto_tramos
+from model.simulacion import (
+    CAMPOS_PARAMETROS, REQUIEREN_PRIORIDAD, ParametrosPlanificacion, nucleos_por_algoritmo,
+)
+from model.mlfq import ocupacion_por_nivel
+from utils.metricas import (
+    cambios_de_contexto, metricas_plazos, texto_plazos, texto_uso_cpu, uso_cpu, utilizacion_por_nucleo,
+)
+from utils.perfil import perfil
+
+# Panel de log: capacidad del buffer circular y niveles de filtrado
+LOG_CAPACIDAD = 500
+LOG_FLUSH_MS = 16  # Como mucho un volcado al widget por frame
+NIVELES_LOG = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Tabla: filas insertadas por ciclo del event loop (la interfaz sigue respondiendo)
+TABLA_BLOQUE = 1000
 
 class ProcesoTableView(tk.Frame):
     def __init__(
@@ -10,6 +30,7 @@ class ProcesoTableView(tk.Frame):
         master: Optional[tk.Misc] = None,
         procesos: Optional[List[Proceso]] = None,
         on_edit: Optional[Callable[[int, str, Any], None]] = None,
+        on_edit_batch: Optional[Callable[[List[Tuple[int, str, Any]]], None]] = None,
         on_add: Optional[Callable[[], None]] = None,
         on_run: Optional[Callable[[], None]] = None,
         on_pause: Optional[Callable[[], None]] = None,
@@ -17,12 +38,25 @@ class ProcesoTableView(tk.Frame):
         on_speed_change: Optional[Callable[[float], None]] = None,
         on_reset: Optional[Callable[[], None]] = None,
         on_add_fcfs: Optional[Callable[[], None]] = None,           # <-- Nuevo
-        on_add_prioridad: Optional[Callable[[], None]] = None       # <-- Nuevo
+        on_add_prioridad: Optional[Callable[[], None]] = None,      # <-- Nuevo
+        get_cache_stats: Optional[Callable[[], dict]] = None,
+        on_seek: Optional[Callable[[int], None]] = None,
+        on_replay: Optional[Callable[[str], None]] = None,
+        on_save_state: Optional[Callable[[str], None]] = None,
+        on_load_state: Optional[Callable[[str], None]] = None,
+        on_open_results: Optional[Callable[[str], None]] = None,
+        on_import: Optional[Callable[[List[Proceso]], None]] = None,
+        get_historial: Optional[Callable[[], dict]] = None,
+        get_parametros: Optional[Callable[[], dict]] = None,
+        on_parametros: Optional[Callable[[dict], None]] = None,
+        get_envejecimiento: Optional[Callable[[], dict]] = None,
+        algoritmos: Sequence[str] = ("FCFS", "Prioridades")
     ) -> None:
         super().__init__(master, bg="#1e1e2e")
         self.master: Optional[tk.Misc] = master #type: ignore
         self.procesos: List[Proceso] = procesos if procesos is not None else []
         self.on_edit: Optional[Callable[[int, str, Any], None]] = on_edit
+        self.on_edit_batch: Optional[Callable[[List[Tuple[int, str, Any]]], None]] = on_edit_batch
         self.on_add: Callable[[], None] | None = on_add
         self.on_run: Callable[[], None] | None = on_run
         self.on_pause: Callable[[], None] | None = on_pause
@@ -31,36 +65,50 @@ class ProcesoTableView(tk.Frame):
         self.on_reset: Callable[[], None] | None = on_reset
         self.on_add_fcfs: Callable[[], None] | None = on_add_fcfs
         self.on_add_prioridad: Callable[[], None] | None = on_add_prioridad
+        self.get_cache_stats: Callable[[], dict] | None = get_cache_stats
+        self.on_seek: Callable[[int], None] | None = on_seek
+        self.on_replay: Callable[[str], None] | None = on_replay
+        self.on_save_state: Callable[[str], None] | None = on_save_state
+        self.on_load_state: Callable[[str], None] | None = on_load_state
+        self.on_open_results: Callable[[str], None] | None = on_open_results
+        self.on_import: Callable[[List[Proceso]], None] | None = on_import
+        self.get_historial: Callable[[], dict] | None = get_historial
+        self.get_parametros: Callable[[], dict] | None = get_parametros
+        self.on_parametros: Callable[[dict], None] | None = on_parametros
+        self.get_envejecimiento: Callable[[], dict] | None = get_envejecimiento
+        self.algoritmos: Sequence[str] = algoritmos
         
         # Variables de estado
         self.ejecutando = False
         self.pausado = False
         self.tiempo_simulacion = 0
+        self._version_modelo: Optional[int] = None  # Última versión del modelo mostrada
+        self._indice: Optional[IndiceIntervalos] = None  # Índice por tiempo de la planificación mostrada
+        self._promedios = (0.0, 0.0)  # (espera, retorno), no dependen del instante
+        self._tabla_generacion = 0  # Invalida el llenado por bloques de un refresco anterior
+
+        # Log de eventos: buffer circular con volcado por lotes
+        self._log_pendientes: deque[str] = deque(maxlen=LOG_CAPACIDAD)
+        self._log_lineas = 0
+        self._log_flush_programado = False
+        self._log_nivel_minimo = NIVELES_LOG["INFO"]
         
         self.pack(fill="both", expand=True)
         self.create_widgets()
 
     def create_widgets(self) -> None:
-        # Configurar estilo
-        self.configure_styles()
-        
-        # Header con título y controles principales
-        self.create_header()
-        
-        # Panel de control de simulación
-        self.create_simulation_controls()
-        
-        # Tabla de procesos
-        self.create_process_table()
-        
-        # Panel de información en tiempo real
-        self.create_info_panel()
-        
-        # Diagrama de Gantt mejorado
-        self.create_gantt_section()
-        
-        # Log de eventos
-        self.create_log_section()
+        # Cada panel se mide por separado con --profile-startup
+        for nombre, crear in (
+            ("estilos", self.configure_styles),                  # Configurar estilo
+            ("encabezado", self.create_header),                  # Header con título y controles principales
+            ("controles", self.create_simulation_controls),      # Panel de control de simulación
+            ("tabla", self.create_process_table),                # Tabla de procesos
+            ("métricas", self.create_info_panel),                # Panel de información en tiempo real
+            ("gantt", self.create_gantt_section),                # Diagrama de Gantt mejorado
+            ("log", self.create_log_section),                    # Log de eventos
+        ):
+            with perfil.seccion(nombre):
+                crear()
 
     def configure_styles(self) -> None:
         """Configura los estilos personalizados para la interfaz"""
@@ -203,6 +251,59 @@ class ProcesoTableView(tk.Frame):
             command=self.on_reset_clicked
         )
         self.btn_reset.pack(side="left", padx=5)
+
+        # Botón de estadísticas
+        self.btn_stats = ttk.Button(
+            buttons_frame,
+            text="📊 Estadísticas",
+            style="Primary.TButton",
+            command=self.show_statistics
+        )
+        self.btn_stats.pack(side="left", padx=5)
+
+        # Historial de ejecuciones (SQLite)
+        self.btn_history = ttk.Button(
+            buttons_frame,
+            text="🗄️ Historial",
+            style="Primary.TButton",
+            command=self.show_history
+        )
+        self.btn_history.pack(side="left", padx=5)
+
+        # Parámetros de los planificadores (envejecimiento, ...)
+        self.btn_params = ttk.Button(
+            buttons_frame,
+            text="⚙️ Parámetros",
+            style="Primary.TButton",
+            command=self.show_parameters_dialog
+        )
+        self.btn_params.pack(side="left", padx=5)
+
+        # Exportar / abrir resultados
+        self.btn_export = ttk.Button(
+            buttons_frame,
+            text="📤 Exportar",
+            style="Primary.TButton",
+            command=self.export_results
+        )
+        self.btn_export.pack(side="left", padx=5)
+
+        self.btn_open_results = ttk.Button(
+            buttons_frame,
+            text="📥 Abrir resultados",
+            style="Primary.TButton",
+            command=self.on_open_results_clicked
+        )
+        self.btn_open_results.pack(side="left", padx=5)
+
+        # Botón de reproducción de trazas grabadas
+        self.btn_replay = ttk.Button(
+            buttons_frame,
+            text="🎞 Reproducir traza",
+            style="Primary.TButton",
+            command=self.on_replay_clicked
+        )
+        self.btn_replay.pack(side="left", padx=5)
         
         # Control de velocidad
         speed_frame = tk.Frame(inner_frame, bg="#313244")
@@ -279,13 +380,35 @@ class ProcesoTableView(tk.Frame):
             command=self.on_add_clicked
         ).pack(side="left", padx=(0, 5))
 
+        ttk.Button(
+            add_btn_frame,
+            text="📥 Importar workload",
+            style="Primary.TButton",
+            command=self.on_import_clicked
+        ).pack(side="left", padx=(0, 5))
+
+        # Checkpoints del estado de la simulación
+        ttk.Button(
+            add_btn_frame,
+            text="📂 Cargar estado",
+            style="Primary.TButton",
+            command=self.on_load_state_clicked
+        ).pack(side="right", padx=(5, 0))
+        ttk.Button(
+            add_btn_frame,
+            text="💾 Guardar estado",
+            style="Primary.TButton",
+            command=self.on_save_state_clicked
+        ).pack(side="right", padx=(5, 0))
+
         # Frame para la tabla con scrollbar
         table_container = tk.Frame(table_frame, bg="#1e1e2e")
         table_container.pack(fill="x", padx=10, pady=(0, 10))
         
         # Configurar tabla
-        columns = ("nombre", "tiempo_llegada", "rafaga", "prioridad", "algoritmo", 
-                  "tiempo_inicio", "tiempo_final", "tiempo_retorno", "tiempo_espera")
+        columns = ("nombre", "tiempo_llegada", "rafaga", "prioridad", "plazo", "algoritmo", 
+                  "tiempo_inicio", "tiempo_final", "tiempo_retorno", "tiempo_espera",
+                  "tiempo_respuesta", "tramos")
         
         self.tree = ttk.Treeview(
             table_container,
@@ -301,11 +424,14 @@ class ProcesoTableView(tk.Frame):
             "tiempo_llegada": 100,
             "rafaga": 80,
             "prioridad": 80,
+            "plazo": 70,
             "algoritmo": 100,
             "tiempo_inicio": 100,
             "tiempo_final": 100,
             "tiempo_retorno": 110,
-            "tiempo_espera": 110
+            "tiempo_espera": 110,
+            "tiempo_respuesta": 110,
+            "tramos": 140
         }
         
         column_names = {
@@ -313,11 +439,14 @@ class ProcesoTableView(tk.Frame):
             "tiempo_llegada": "T. Llegada",
             "rafaga": "Ráfaga",
             "prioridad": "Prioridad",
+            "plazo": "Plazo",
             "algoritmo": "Algoritmo",
             "tiempo_inicio": "T. Inicio",
             "tiempo_final": "T. Final",
             "tiempo_retorno": "T. Retorno",
-            "tiempo_espera": "T. Espera"
+            "tiempo_espera": "T. Espera",
+            "tiempo_respuesta": "T. Respuesta",
+            "tramos": "Tramos"
         }
         
         for col in columns:
@@ -335,6 +464,11 @@ class ProcesoTableView(tk.Frame):
         self.tree.bind('<Double-1>', self.on_double_click)
         self.tree.bind('<Button-3>', self.on_right_click)  # Menú contextual
         
+        # Colores por estado del proceso
+        self.tree.tag_configure("completed", foreground="#a6e3a1")  # Verde claro
+        self.tree.tag_configure("running", foreground="#89b4fa")  # Azul claro
+        self.tree.tag_configure("ready", foreground="#f9e2af")  # Amarillo
+        
         # Poblar tabla inicial
         self.refresh_table()
 
@@ -404,6 +538,46 @@ class ProcesoTableView(tk.Frame):
         )
         gantt_frame.pack(fill="both", expand=True, padx=20, pady=(0, 10))
         
+        # Línea de tiempo para saltar a cualquier instante de la planificación
+        timeline_frame = tk.Frame(gantt_frame, bg="#1e1e2e")
+        timeline_frame.pack(fill="x", padx=10, pady=(10, 0))
+        tk.Label(
+            timeline_frame,
+            text="Línea de tiempo:",
+            font=("Segoe UI", 10),
+            fg="#cdd6f4",
+            bg="#1e1e2e"
+        ).pack(side="left", padx=(0, 5))
+        self.timeline_var = tk.IntVar(value=0)
+        self.timeline_scale = tk.Scale(
+            timeline_frame,
+            from_=0,
+            to=0,
+            orient="horizontal",
+            variable=self.timeline_var,
+            command=self.on_timeline_moved,
+            showvalue=True,
+            bg="#1e1e2e",
+            fg="#cdd6f4",
+            highlightbackground="#1e1e2e",
+            troughcolor="#313244",
+            activebackground="#89b4fa"
+        )
+        self.timeline_scale.pack(side="left", fill="x", expand=True)
+        self.por_nucleo_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            timeline_frame,
+            text="Vista por núcleo",
+            variable=self.por_nucleo_var,
+            command=self.on_por_nucleo,
+            font=("Segoe UI", 10),
+            fg="#cdd6f4",
+            bg="#1e1e2e",
+            selectcolor="#313244",
+            activebackground="#1e1e2e",
+            activeforeground="#cdd6f4"
+        ).pack(side="left", padx=(10, 0))
+
         self.gantt = GanttChart(gantt_frame, self.procesos)
         self.gantt.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -419,6 +593,27 @@ class ProcesoTableView(tk.Frame):
             relief="flat"
         )
         log_frame.pack(fill="x", padx=20, pady=(0, 20))
+
+        # Filtro de nivel: los eventos por debajo no llegan a Tk
+        filter_frame = tk.Frame(log_frame, bg="#1e1e2e")
+        filter_frame.pack(fill="x", padx=10, pady=(10, 0))
+        tk.Label(
+            filter_frame,
+            text="Nivel:",
+            font=("Segoe UI", 9),
+            fg="#a6adc8",
+            bg="#1e1e2e"
+        ).pack(side="left")
+        self.log_nivel_var = tk.StringVar(value="INFO")
+        nivel_combo = ttk.Combobox(
+            filter_frame,
+            textvariable=self.log_nivel_var,
+            values=list(NIVELES_LOG),
+            state="readonly",
+            width=10
+        )
+        nivel_combo.pack(side="left", padx=5)
+        nivel_combo.bind("<<ComboboxSelected>>", self.on_log_level_changed)
         
         # Frame para el texto y scrollbar
         text_frame = tk.Frame(log_frame, bg="#1e1e2e")
@@ -481,6 +676,76 @@ class ProcesoTableView(tk.Frame):
             self.on_reset()
         self.add_log_entry("🔄 Simulación reiniciada")
 
+    def on_replay_clicked(self) -> None:
+        """Maneja el clic en reproducir traza"""
+        from tkinter import filedialog
+        from utils.traza import directorio_trazas
+
+        filename = filedialog.askopenfilename(
+            initialdir=directorio_trazas(),
+            filetypes=[("Trazas", "*.trc"), ("All files", "*.*")],
+            title="Reproducir traza"
+        )
+        if not filename or not self.on_replay:
+            return
+        try:
+            self.on_replay(filename)
+            self.pausado = False
+            self.btn_pause.configure(text="⏸ Pausar")
+            self.add_log_entry(f"🎞 Reproduciendo traza {filename}")
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudo reproducir la traza: {str(e)}")
+
+    def on_save_state_clicked(self) -> None:
+        """Maneja el clic en guardar estado"""
+        from tkinter import filedialog
+
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".fcs",
+            filetypes=[("Checkpoints", "*.fcs"), ("All files", "*.*")],
+            title="Guardar estado de la simulación"
+        )
+        if not filename or not self.on_save_state:
+            return
+        try:
+            self.on_save_state(filename)
+            self.add_log_entry(f"💾 Estado guardado en {filename}")
+        except (OSError, ValueError, OverflowError) as e:
+            messagebox.showerror("Error", f"No se pudo guardar el estado: {str(e)}")
+
+    def on_load_state_clicked(self) -> None:
+        """Maneja el clic en cargar estado"""
+        from tkinter import filedialog
+
+        filename = filedialog.askopenfilename(
+            filetypes=[("Checkpoints", "*.fcs"), ("All files", "*.*")],
+            title="Cargar estado de la simulación"
+        )
+        if not filename or not self.on_load_state:
+            return
+        try:
+            self.on_load_state(filename)
+            self.add_log_entry(f"📂 Estado restaurado desde {filename}")
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Error", f"No se pudo cargar el estado: {str(e)}")
+
+    def on_timeline_moved(self, value: str) -> None:
+        """Maneja el arrastre de la línea de tiempo"""
+        tiempo = int(float(value))
+        if tiempo == self.tiempo_simulacion:
+            return  # Cambio provocado por el propio avance de la simulación
+        if self.on_seek:
+            self.on_seek(tiempo)
+
+    def nucleos_por_algoritmo(self) -> dict:
+        """CPUs de cada algoritmo según los parámetros actuales"""
+        parametros = ParametrosPlanificacion.desde_dict(self.get_parametros()) if self.get_parametros else None
+        return nucleos_por_algoritmo(parametros)
+
+    def on_por_nucleo(self) -> None:
+        """Alterna el Gantt entre una fila por proceso y un carril por núcleo"""
+        self.gantt.set_por_nucleo(self.por_nucleo_var.get(), self.nucleos_por_algoritmo())
+
     def on_speed_changed(self, value: str) -> None:
         """Maneja el cambio de velocidad"""
         speed = float(value)
@@ -502,25 +767,57 @@ class ProcesoTableView(tk.Frame):
             self.btn_stop.configure(state="disabled")
             self.status_label.configure(text="Estado: Detenido", fg="#f38ba8")
 
+    def set_velocidad(self, velocidad: float) -> None:
+        """Refleja en el control la velocidad de simulación indicada"""
+        self.speed_var.set(velocidad)
+        self.speed_label.configure(text=f"{velocidad:.1f}x")
+
+    def set_estado_ejecucion(self, ejecutando: bool, pausado: bool) -> None:
+        """Sincroniza botones y estado con una simulación restaurada"""
+        self.update_control_buttons(ejecutando, not ejecutando)
+        self.pausado = pausado and ejecutando
+        self.btn_pause.configure(text="⏵ Reanudar" if self.pausado else "⏸ Pausar")
+
     def actualizar_tiempo_simulacion(self, tiempo: int) -> None:
         """Actualiza el tiempo de simulación en la interfaz"""
         self.tiempo_simulacion = tiempo
         self.time_label.configure(text=f"Tiempo: {tiempo}")
+        self.timeline_var.set(tiempo)
         self.update_metrics()
         if hasattr(self.gantt, 'actualizar_tiempo'):
             self.gantt.actualizar_tiempo(tiempo)
 
+    def mostrar_instante(self, tiempo: int) -> None:
+        """Dibuja directamente el estado de la planificación en el instante dado"""
+        self.actualizar_tiempo_simulacion(tiempo)
+        self.refresh_table()
+
+    def get_indice(self) -> IndiceIntervalos:
+        """Índice de la planificación mostrada (solo se construye si el controlador no lo proveyó)"""
+        if self._indice is None:
+            self._fijar_indice(IndiceIntervalos(self.procesos))
+        return self._indice  # type: ignore[return-value]
+
+    def _fijar_indice(self, indice: IndiceIntervalos) -> None:
+        """Adopta el índice de la planificación y recalcula los promedios, que no dependen del instante"""
+        self._indice = indice
+        procesos_con_datos = [p for p in self.procesos if p.tiempo_espera > 0]
+        if procesos_con_datos:
+            self._promedios = (
+                sum(p.tiempo_espera for p in procesos_con_datos) / len(procesos_con_datos),
+                sum(p.tiempo_retorno for p in procesos_con_datos) / len(procesos_con_datos),
+            )
+        else:
+            self._promedios = (0.0, 0.0)
+
     def update_metrics(self) -> None:
         """Actualiza las métricas en tiempo real"""
+        indice = self.get_indice()
         total = len(self.procesos)
-        completados = len([p for p in self.procesos if p.tiempo_final > 0 and p.tiempo_final <= self.tiempo_simulacion])
-        ejecutando = len([p for p in self.procesos if p.tiempo_inicio <= self.tiempo_simulacion < p.tiempo_final])
+        completados = indice.contar_finalizados(self.tiempo_simulacion)
+        ejecutando = len(indice.en_ejecucion(self.tiempo_simulacion))
         pendientes = total - completados - ejecutando
-        
-        # Calcular promedios
-        procesos_con_datos = [p for p in self.procesos if p.tiempo_espera > 0]
-        promedio_espera = sum(p.tiempo_espera for p in procesos_con_datos) / len(procesos_con_datos) if procesos_con_datos else 0
-        promedio_retorno = sum(p.tiempo_retorno for p in procesos_con_datos) / len(procesos_con_datos) if procesos_con_datos else 0
+        promedio_espera, promedio_retorno = self._promedios
         
         # Actualizar labels
         self.metrics["total_procesos"].configure(text=str(total))
@@ -530,22 +827,45 @@ class ProcesoTableView(tk.Frame):
         self.metrics["tiempo_promedio_espera"].configure(text=f"{promedio_espera:.1f}")
         self.metrics["tiempo_promedio_retorno"].configure(text=f"{promedio_retorno:.1f}")
 
-    def add_log_entry(self, message: str) -> None:
-        """Agrega una entrada al log"""
-        import datetime
+    def add_log_entry(self, message: str, nivel: str = "INFO") -> None:
+        """Agrega una entrada al log (se vuelca al widget por lotes)"""
+        if NIVELES_LOG.get(nivel, NIVELES_LOG["INFO"]) < self._log_nivel_minimo:
+            return
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        
+        self._log_pendientes.append(f"[{timestamp}] {message}\n")
+        if not self._log_flush_programado:
+            self._log_flush_programado = True
+            self.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Inserta de una vez las entradas pendientes y recorta las líneas más antiguas"""
+        self._log_flush_programado = False
+        if not self._log_pendientes:
+            return
+        lineas = list(self._log_pendientes)
+        self._log_pendientes.clear()
+
         self.log_text.configure(state="normal")
-        self.log_text.insert(tk.END, log_message)
+        self.log_text.insert(tk.END, "".join(lineas))
+        self._log_lineas += len(lineas)
+        exceso = self._log_lineas - LOG_CAPACIDAD
+        if exceso > 0:
+            self.log_text.delete("1.0", f"{exceso + 1}.0")
+            self._log_lineas = LOG_CAPACIDAD
         self.log_text.see(tk.END)
         self.log_text.configure(state="disabled")
 
+    def on_log_level_changed(self, event: Any = None) -> None:
+        """Cambia el nivel mínimo de los eventos que se muestran"""
+        self._log_nivel_minimo = NIVELES_LOG.get(self.log_nivel_var.get(), NIVELES_LOG["INFO"])
+
     def on_right_click(self, event: Any) -> None:
         """Maneja clic derecho para menú contextual"""
         item = self.tree.identify_row(event.y)
         if item:
-            self.tree.selection_set(item)
+            # Conservar la selección múltiple si se hace clic sobre una fila ya seleccionada
+            if item not in self.tree.selection():
+                self.tree.selection_set(item)
             self.show_context_menu(event, item)
 
     def show_context_menu(self, event: Any, item: str) -> None:
@@ -559,6 +879,15 @@ class ProcesoTableView(tk.Frame):
             label="📝 Editar Proceso",
             command=lambda: self.edit_process(int(item))
         )
+
+        # Edición de varias filas a la vez: se envía como un único lote
+        algo_menu = tk.Menu(context_menu, tearoff=0, bg="#313244", fg="#cdd6f4")
+        for algoritmo in self.algoritmos:
+            algo_menu.add_command(
+                label=algoritmo,
+                command=lambda a=algoritmo: self.edit_selection("algoritmo", a)
+            )
+        context_menu.add_cascade(label="🔀 Cambiar algoritmo (selección)", menu=algo_menu)
         
         try:
             context_menu.tk_popup(event.x_root, event.y_root)
@@ -571,9 +900,29 @@ class ProcesoTableView(tk.Frame):
             if 0 <= idx < len(self.procesos):
                 process_name = self.procesos[idx].nombre
                 del self.procesos[idx]
+                self._indice = None
                 self.refresh_table()
                 self.add_log_entry(f"🗑️ Proceso {process_name} eliminado")
 
+    def apply_edits(self, cambios: List[Tuple[int, str, Any]]) -> None:
+        """Envía un lote de ediciones al controlador (con recálculo único)"""
+        if self.on_edit_batch:
+            self.on_edit_batch(cambios)
+        elif self.on_edit:
+            for idx, field, value in cambios:
+                self.on_edit(idx, field, value)
+
+    def edit_selection(self, field: str, value: Any) -> None:
+        """Aplica el mismo valor a todas las filas seleccionadas"""
+        indices = [int(item) for item in self.tree.selection()]
+        if not indices:
+            return
+        try:
+            self.apply_edits([(idx, field, value) for idx in indices])
+            self.add_log_entry(f"📝 {len(indices)} procesos editados")
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+
     def edit_process(self, idx: int) -> None:
         """Abre diálogo para editar proceso"""
         if 0 <= idx < len(self.procesos):
@@ -585,7 +934,7 @@ class ProcesoTableView(tk.Frame):
         
         dialog = tk.Toplevel(self)
         dialog.title(f"Editar {proceso.nombre}")
-        dialog.geometry("300x250")
+        dialog.geometry("300x315")
         dialog.configure(bg="#1e1e2e")
         dialog.resizable(False, False)
         
@@ -598,7 +947,9 @@ class ProcesoTableView(tk.Frame):
             ("Nombre:", proceso.nombre, "str"),
             ("Tiempo de llegada:", str(proceso.tiempo_llegada), "int"),
             ("Ráfaga:", str(proceso.rafaga), "int"),
-            ("Prioridad:", str(proceso.prioridad) if proceso.prioridad else "", "int")
+            ("Prioridad:", str(proceso.prioridad) if proceso.prioridad else "", "int"),
+            ("Plazo:", str(proceso.plazo) if proceso.plazo is not None else "", "int"),
+            ("CPU, E/S, ..., CPU:", proceso.texto_secuencia(), "str")
         ]
         
         entries = {}
@@ -616,7 +967,7 @@ class ProcesoTableView(tk.Frame):
             row=len(fields), column=0, sticky="w", padx=10, pady=5
         )
         algo_var = tk.StringVar(value=proceso.algoritmo)
-        algo_combo = ttk.Combobox(dialog, textvariable=algo_var, values=["FCFS", "Prioridades"], state="readonly")
+        algo_combo = ttk.Combobox(dialog, textvariable=algo_var, values=list(self.algoritmos), state="readonly")
         algo_combo.grid(row=len(fields), column=1, padx=10, pady=5, sticky="ew")
         
         dialog.grid_columnconfigure(1, weight=1)
@@ -633,16 +984,32 @@ class ProcesoTableView(tk.Frame):
                 rafaga = int(entries["Ráfaga:"][0].get())
                 prioridad_str = entries["Prioridad:"][0].get().strip()
                 prioridad = int(prioridad_str) if prioridad_str else None
+                plazo_str = entries["Plazo:"][0].get().strip()
+                plazo = int(plazo_str) if plazo_str else None
+                secuencia = entries["CPU, E/S, ..., CPU:"][0].get().strip()
                 algoritmo = algo_var.get()
                 
                 if nombre and tiempo_llegada >= 0 and rafaga > 0:
+                    if algoritmo in REQUIEREN_PRIORIDAD and prioridad is None:
+                        messagebox.showerror("Error", f"Un proceso de {algoritmo} requiere prioridad")
+                        return
+                    cambios = [
+                        (idx, "nombre", nombre),
+                        (idx, "tiempo_llegada", tiempo_llegada),
+                        (idx, "rafaga", rafaga),
+                        (idx, "prioridad", prioridad),
+                        (idx, "plazo", plazo),
+                        (idx, "algoritmo", algoritmo),
+                    ]
+                    # La secuencia solo viaja si hay una (se valida contra la ráfaga) o se vació
+                    if secuencia or proceso.secuencia:
+                        cambios.insert(5, (idx, "secuencia", secuencia))
                     # Aplicar cambios usando el callback
-                    if self.on_edit:
-                        self.on_edit(idx, "nombre", nombre)
-                        self.on_edit(idx, "tiempo_llegada", tiempo_llegada)
-                        self.on_edit(idx, "rafaga", rafaga)
-                        self.on_edit(idx, "prioridad", prioridad)
-                        self.on_edit(idx, "algoritmo", algoritmo)
+                    try:
+                        self.apply_edits(cambios)
+                    except ValueError as e:
+                        messagebox.showerror("Error", str(e))
+                        return
                     
                     self.add_log_entry(f"📝 Proceso {nombre} editado")
                     dialog.destroy()
@@ -654,6 +1021,46 @@ class ProcesoTableView(tk.Frame):
         ttk.Button(btn_frame, text="Guardar", command=save_changes, style="Success.TButton").pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Cancelar", command=dialog.destroy, style="Error.TButton").pack(side="left", padx=5)
 
+    def show_parameters_dialog(self) -> None:
+        """Diálogo para editar los parámetros de planificación"""
+        if not self.get_parametros or not self.on_parametros:
+            return
+        valores = self.get_parametros()
+
+        dialog = tk.Toplevel(self)
+        dialog.title("Parámetros de planificación")
+        dialog.configure(bg="#1e1e2e")
+        dialog.resizable(False, False)
+        dialog.transient(self.master) # type: ignore
+        dialog.grab_set()
+
+        entries = {}
+        for i, (nombre, etiqueta, _) in enumerate(CAMPOS_PARAMETROS):
+            tk.Label(dialog, text=etiqueta, bg="#1e1e2e", fg="#cdd6f4").grid(
+                row=i, column=0, sticky="w", padx=10, pady=5
+            )
+            entry = tk.Entry(dialog, bg="#313244", fg="#cdd6f4", insertbackground="#cdd6f4")
+            valor = valores.get(nombre, "")
+            entry.insert(0, ", ".join(map(str, valor)) if isinstance(valor, (list, tuple)) else str(valor))
+            entry.grid(row=i, column=1, padx=10, pady=5, sticky="ew")
+            entries[nombre] = entry
+
+        dialog.grid_columnconfigure(1, weight=1)
+        btn_frame = tk.Frame(dialog, bg="#1e1e2e")
+        btn_frame.grid(row=len(CAMPOS_PARAMETROS), column=0, columnspan=2, pady=20)
+
+        def save_changes():
+            try:
+                self.on_parametros({nombre: entry.get().strip() for nombre, entry in entries.items()})  # type: ignore[misc]
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
+            self.add_log_entry("⚙️ Parámetros de planificación actualizados")
+            dialog.destroy()
+
+        ttk.Button(btn_frame, text="Guardar", command=save_changes, style="Success.TButton").pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Cancelar", command=dialog.destroy, style="Error.TButton").pack(side="left", padx=5)
+
     def on_double_click(self, event: Any) -> None:
         """Maneja doble clic para edición rápida"""
         item = self.tree.identify_row(event.y)
@@ -662,11 +1069,11 @@ class ProcesoTableView(tk.Frame):
             return
             
         col_index = int(column.replace('#', '')) - 1
-        columns = ("nombre", "tiempo_llegada", "rafaga", "prioridad", "algoritmo", 
+        columns = ("nombre", "tiempo_llegada", "rafaga", "prioridad", "plazo", "algoritmo", 
                   "tiempo_inicio", "tiempo_final", "tiempo_retorno", "tiempo_espera")
         
         # Solo permitir edición de campos específicos
-        if col_index in [0, 1, 2, 3, 4]:  # campos editables
+        if col_index in [0, 1, 2, 3, 4, 5]:  # campos editables
             self.edit_cell_inline(item, column, col_index, columns[col_index])
 
     def edit_cell_inline(self, item: str, column: str, col_index: int, field_name: str) -> None:
@@ -677,16 +1084,20 @@ class ProcesoTableView(tk.Frame):
             
             if field_name == "algoritmo":
                 # Combobox para algoritmo
-                cb = ttk.Combobox(self.tree, values=["FCFS", "Prioridades"], state="readonly")
+                cb = ttk.Combobox(self.tree, values=list(self.algoritmos), state="readonly")
                 cb.place(x=x, y=y, width=width, height=height)
                 cb.set(value)
                 cb.focus()
                 
                 def on_select(e):
                     new_value = cb.get()
-                    if self.on_edit:
-                        self.on_edit(int(item), field_name, new_value)
-                    cb.destroy()
+                    try:
+                        if self.on_edit:
+                            self.on_edit(int(item), field_name, new_value)
+                    except ValueError as error:
+                        messagebox.showerror("Error", str(error))
+                    finally:
+                        cb.destroy()
                 
                 cb.bind("<<ComboboxSelected>>", on_select)
                 cb.bind('<FocusOut>', lambda e: cb.destroy())
@@ -703,13 +1114,13 @@ class ProcesoTableView(tk.Frame):
                         new_value = entry.get().strip()
                         if field_name in ["tiempo_llegada", "rafaga"]:
                             new_value = int(new_value)
-                        elif field_name == "prioridad":
+                        elif field_name in ("prioridad", "plazo"):
                             new_value = int(new_value) if new_value else None
 
                         if self.on_edit:
                             self.on_edit(int(item), field_name, new_value)
-                    except ValueError:
-                        messagebox.showerror("Error", "Valor inválido")
+                    except ValueError as error:
+                        messagebox.showerror("Error", str(error) or "Valor inválido")
                     finally:
                         entry.destroy()
                 entry.bind('<Return>', on_enter)
@@ -720,13 +1131,29 @@ class ProcesoTableView(tk.Frame):
             pass
 
     def refresh_table(self) -> None:
-        """Refresca la tabla con los datos actuales"""
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Refresca la tabla con los datos actuales (por bloques si la lista es grande)"""
+        self._tabla_generacion += 1
+
+        # Limpiar tabla (un solo comando en lugar de uno por fila)
+        filas = self.tree.get_children()
+        if filas:
+            self.tree.delete(*filas)
         
-        # Repoblar tabla
-        for i, proceso in enumerate(self.procesos):
+        # Procesos en ejecución según el índice de intervalos (sin recorrer toda la lista)
+        ejecutando = {id(p) for p in self.get_indice().en_ejecucion(self.tiempo_simulacion)}
+
+        # El primer bloque se inserta ya; el resto en ciclos siguientes del event loop
+        self._poblar_tabla(self._tabla_generacion, self.procesos, 0, ejecutando)
+
+    def _poblar_tabla(self, generacion: int, procesos: List[Proceso], desde: int, ejecutando: set) -> None:
+        """Inserta un bloque de filas y programa el siguiente"""
+        if generacion != self._tabla_generacion:
+            return  # Un refresco más reciente reemplazó a este
+        hasta = min(desde + TABLA_BLOQUE, len(procesos))
+        tiempo = self.tiempo_simulacion
+
+        for i in range(desde, hasta):
+            proceso = procesos[i]
             # Solo mostrar procesos con ráfaga > 0
             if proceso.rafaga <= 0:
                 continue
@@ -737,40 +1164,59 @@ class ProcesoTableView(tk.Frame):
                 proceso.tiempo_llegada,
                 proceso.rafaga,
                 proceso.prioridad if proceso.prioridad is not None else "",
+                proceso.plazo if proceso.plazo is not None else "",
                 proceso.algoritmo,
                 proceso.tiempo_inicio,
                 proceso.tiempo_final,
                 proceso.tiempo_retorno,
-                proceso.tiempo_espera
+                proceso.tiempo_espera,
+                proceso.tiempo_respuesta if proceso.tiempo_final > 0 else 0,
+                texto_tramos(proceso)
             )
-            
-            item_id = self.tree.insert("", "end", iid=str(i), values=values)
-            
+
             # Colorear según estado del proceso
-            if proceso.tiempo_final > 0 and proceso.tiempo_final <= self.tiempo_simulacion:
-                # Proceso completado
-                self.tree.item(item_id, tags=("completed",))
-                self.tree.tag_configure("completed", foreground="#a6e3a1")  # Verde claro
-            elif proceso.tiempo_inicio > 0 and proceso.tiempo_inicio <= self.tiempo_simulacion < proceso.tiempo_final:
-                # Proceso en ejecución
-                self.tree.item(item_id, tags=("running",))
-                self.tree.tag_configure("running", foreground="#89b4fa")  # Azul claro
-            elif proceso.tiempo_llegada <= self.tiempo_simulacion:
-                # Proceso listo
-                self.tree.item(item_id, tags=("ready",))
-                self.tree.tag_configure("ready", foreground="#f9e2af")  # Amarillo
-
-    def refresh(self, procesos: List[Proceso]) -> None:
-        """Actualiza la vista con nuevos datos"""
+            if proceso.tiempo_final > 0 and proceso.tiempo_final <= tiempo:
+                tags: Tuple[str, ...] = ("completed",)
+            elif id(proceso) in ejecutando:
+                tags = ("running",)
+            elif proceso.tiempo_llegada <= tiempo:
+                tags = ("ready",)
+            else:
+                tags = ()
+            self.tree.insert("", "end", iid=str(i), values=values, tags=tags)
+
+        if hasta < len(procesos):
+            self.after(1, lambda: self._poblar_tabla(generacion, procesos, hasta, ejecutando))
+
+    def refresh(self, procesos: List[Proceso], indice: Optional[IndiceIntervalos] = None) -> None:
+        """
+        Actualiza la vista con nuevos datos. `indice` es el índice ya construido
+        para esta planificación; si se omite, se construye una vez al necesitarlo.
+        """
         self.procesos = procesos
+        self._indice = None
+        if indice is not None:
+            self._fijar_indice(indice)
         self.refresh_table()
         self.update_metrics()
+        self.timeline_scale.configure(to=max(self.get_indice().tiempo_final_max, self.tiempo_simulacion))
         
         # Actualizar Gantt
         if hasattr(self.gantt, 'procesos'):
             self.gantt.procesos = procesos
+            self.gantt.nucleos = self.nucleos_por_algoritmo()
+            self.gantt.set_indice(procesos, self.get_indice())
             self.gantt.draw_gantt(procesos, self.tiempo_simulacion)
 
+    def update_from_model(self, procesos: Sequence[Proceso]) -> None:
+        """Observer del planificador: solo copia y refresca si la versión cambió"""
+        version = getattr(procesos, "version", None)
+        if version is not None and version == self._version_modelo:
+            return
+        self._version_modelo = version
+        snapshot = getattr(procesos, "snapshot", None)
+        self.refresh(snapshot() if snapshot else list(procesos))
+
     def actualizar(self, data: Any) -> None:
         """Método observer para recibir actualizaciones del modelo"""
         if isinstance(data, list):
@@ -790,10 +1236,13 @@ class ProcesoTableView(tk.Frame):
         self.pausado = False
         
         # Resetear controles
+        self.timeline_var.set(0)
         self.update_control_buttons(False, True)
         self.btn_pause.configure(text="⏸ Pausar")
         
         # Limpiar log
+        self._log_pendientes.clear()
+        self._log_lineas = 0
         self.log_text.configure(state="normal")
         self.log_text.delete(1.0, tk.END)
         self.log_text.configure(state="disabled")
@@ -820,9 +1269,10 @@ class ProcesoTableView(tk.Frame):
             self.tree.focus(str(index))
 
     def export_results(self) -> None:
-        """Exporta los resultados a un archivo CSV"""
+        """Exporta los resultados a CSV o al formato binario columnar (.fcb) en segundo plano"""
         from tkinter import filedialog
-        import csv
+        import threading
+        from utils.resultados import exportar_resultados
         
         if not self.procesos:
             messagebox.showwarning("Advertencia", "No hay procesos para exportar")
@@ -830,40 +1280,108 @@ class ProcesoTableView(tk.Frame):
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=[("CSV files", "*.csv"), ("Resultados binarios", "*.fcb"), ("All files", "*.*")],
             title="Guardar resultados"
         )
         
-        if filename:
-            try:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Escribir encabezados
-                    headers = ["Proceso", "Tiempo Llegada", "Ráfaga", "Prioridad", "Algoritmo",
-                              "Tiempo Inicio", "Tiempo Final", "Tiempo Retorno", "Tiempo Espera"]
-                    writer.writerow(headers)
-                    
-                    # Escribir datos
-                    for proceso in self.procesos:
-                        row = [
-                            proceso.nombre,
-                            proceso.tiempo_llegada,
-                            proceso.rafaga,
-                            proceso.prioridad if proceso.prioridad is not None else "",
-                            proceso.algoritmo,
-                            proceso.tiempo_inicio,
-                            proceso.tiempo_final,
-                            proceso.tiempo_retorno,
-                            proceso.tiempo_espera
-                        ]
-                        writer.writerow(row)
-                
+        if not filename:
+            return
+
+        procesos = list(self.procesos)  # Referencias: la lista puede cambiar mientras se exporta
+        progreso_window, progreso_var = self._crear_ventana_progreso(f"Exportando {len(procesos)} procesos...")
+
+        def informar(fraccion: float) -> None:
+            self.after(0, lambda: progreso_var.set(fraccion * 100))
+
+        def terminar(error: Optional[Exception]) -> None:
+            progreso_window.destroy()
+            if error is None:
                 messagebox.showinfo("Éxito", f"Resultados exportados a {filename}")
                 self.add_log_entry(f"📊 Resultados exportados a {filename}")
-                
+            else:
+                messagebox.showerror("Error", f"Error al exportar: {str(error)}")
+
+        def exportar() -> None:
+            try:
+                exportar_resultados(filename, procesos, informar)
+                self.after(0, lambda: terminar(None))
+            except Exception as e:
+                self.after(0, lambda e=e: terminar(e))
+
+        threading.Thread(target=exportar, daemon=True).start()
+
+    def _crear_ventana_progreso(self, titulo: str, indeterminado: bool = False) -> Tuple[tk.Toplevel, tk.DoubleVar]:
+        """Crea una ventana pequeña con una barra de progreso"""
+        window = tk.Toplevel(self)
+        window.title("Progreso")
+        window.geometry("320x90")
+        window.configure(bg="#1e1e2e")
+        window.transient(self.master) # type: ignore
+        window.resizable(False, False)
+        tk.Label(window, text=titulo, bg="#1e1e2e", fg="#cdd6f4").pack(pady=(15, 5))
+        var = tk.DoubleVar(value=0.0)
+        barra = ttk.Progressbar(
+            window, variable=var, maximum=100, length=280,
+            mode="indeterminate" if indeterminado else "determinate"
+        )
+        barra.pack(padx=20)
+        if indeterminado:
+            barra.start(15)
+        return window, var
+
+    def on_import_clicked(self) -> None:
+        """Importa un workload CSV/JSON en segundo plano y lo entrega como un solo lote"""
+        from tkinter import filedialog
+        import threading
+        from utils.importacion import leer_workload
+
+        filename = filedialog.askopenfilename(
+            filetypes=[("Workloads", "*.csv *.json"), ("All files", "*.*")],
+            title="Importar workload"
+        )
+        if not filename or not self.on_import:
+            return
+
+        progreso_window, _ = self._crear_ventana_progreso("Importando procesos...", indeterminado=True)
+
+        def informar(leidos: int) -> None:
+            self.after(0, lambda: progreso_window.title(f"Progreso - {leidos} procesos"))
+
+        def terminar(procesos: Optional[List[Proceso]], error: Optional[Exception]) -> None:
+            progreso_window.destroy()
+            if error is not None:
+                messagebox.showerror("Error", f"Error al importar: {str(error)}")
+                return
+            try:
+                self.on_import(procesos)  # type: ignore[misc]
+                self.add_log_entry(f"📥 {len(procesos)} procesos importados desde {filename}")  # type: ignore[arg-type]
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+
+        def importar() -> None:
+            try:
+                procesos = leer_workload(filename, self.algoritmos, progreso=informar)
+                self.after(0, lambda: terminar(procesos, None))
             except Exception as e:
-                messagebox.showerror("Error", f"Error al exportar: {str(e)}")
+                self.after(0, lambda e=e: terminar(None, e))
+
+        threading.Thread(target=importar, daemon=True).start()
+
+    def on_open_results_clicked(self) -> None:
+        """Maneja el clic en abrir resultados binarios"""
+        from tkinter import filedialog
+
+        filename = filedialog.askopenfilename(
+            filetypes=[("Resultados binarios", "*.fcb"), ("All files", "*.*")],
+            title="Abrir resultados"
+        )
+        if not filename or not self.on_open_results:
+            return
+        try:
+            self.on_open_results(filename)
+            self.add_log_entry(f"📥 Resultados cargados desde {filename}")
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Error", f"No se pudieron abrir los resultados: {str(e)}")
 
     def show_statistics(self) -> None:
         """Muestra estadísticas detalladas"""
@@ -873,7 +1391,7 @@ class ProcesoTableView(tk.Frame):
         
         stats_window = tk.Toplevel(self)
         stats_window.title("Estadísticas Detalladas")
-        stats_window.geometry("400x300")
+        stats_window.geometry("640x560")
         stats_window.configure(bg="#1e1e2e")
         stats_window.transient(self.master) # type: ignore
         
@@ -885,9 +1403,22 @@ class ProcesoTableView(tk.Frame):
         
         tiempos_espera = [p.tiempo_espera for p in procesos_completados]
         tiempos_retorno = [p.tiempo_retorno for p in procesos_completados]
+        tiempos_respuesta = [p.tiempo_respuesta for p in procesos_completados]
         
         promedio_espera = sum(tiempos_espera) / len(tiempos_espera)
         promedio_retorno = sum(tiempos_retorno) / len(tiempos_retorno)
+        promedio_respuesta = sum(tiempos_respuesta) / len(tiempos_respuesta)
+        expulsados = sum(1 for p in procesos_completados if p.segmentos)
+
+        # Cambios de contexto por algoritmo (cada uno planifica su propia CPU)
+        costo_cambio = self.get_parametros().get("cambio_contexto", 0) if self.get_parametros else 0
+        grupos: dict = {}
+        for p in procesos_completados:
+            grupos.setdefault(p.algoritmo, []).append(p)
+        cambios = ", ".join(
+            f"{algoritmo} {cambios_de_contexto(grupo, costo_cambio if algoritmo == 'Round Robin' else 0)}"
+            for algoritmo, grupo in grupos.items()
+        )
         
         throughput = len(procesos_completados) / max(p.tiempo_final for p in procesos_completados)
         
@@ -901,15 +1432,82 @@ class ProcesoTableView(tk.Frame):
         TIEMPOS PROMEDIO:
         • Tiempo de Espera: {promedio_espera:.2f}
         • Tiempo de Retorno: {promedio_retorno:.2f}
+        • Tiempo de Respuesta: {promedio_respuesta:.2f}
         
         RENDIMIENTO:
         • Throughput: {throughput:.2f} procesos/unidad
+        • Procesos expulsados: {expulsados}
+        • Cambios de contexto: {cambios}
         
+        """
+
+        if self.get_cache_stats:
+            cache = self.get_cache_stats()
+            content += f"""
+        CACHÉ DE PLANIFICACIONES:
+        • Aciertos: {cache['hits']}  • Fallos: {cache['misses']}
+        • Tasa de aciertos: {cache['tasa_aciertos']:.0%}
+        • Entradas: {cache['entradas']} ({cache['bytes'] / 1024:.1f} KiB), Expulsiones: {cache['expulsiones']}
+        """
+
+        if any(p.plazo is not None for p in procesos_completados):
+            content += """
+        PLAZOS (tardanza = final - plazo; holgura = plazo - final):"""
+            for algoritmo, grupo in grupos.items():
+                plazos = metricas_plazos(grupo)
+                if plazos["con_plazo"]:
+                    content += f"\n        • {algoritmo}: {texto_plazos(plazos)}"
+            content += "\n"
+
+        nucleos = self.nucleos_por_algoritmo()
+        content += """
+        USO DE CPU (desde la primera llegada hasta el último final):"""
+        for algoritmo, grupo in grupos.items():
+            content += f"\n        • {algoritmo}: {texto_uso_cpu(uso_cpu(grupo, nucleos.get(algoritmo, 1)))}"
+        content += "\n"
+
+        if any(nucleos.get(algoritmo, 1) > 1 for algoritmo in grupos):
+            content += """
+        UTILIZACIÓN POR NÚCLEO (desde la primera llegada hasta el último final):"""
+            for algoritmo, grupo in grupos.items():
+                usos = utilizacion_por_nucleo(grupo, nucleos.get(algoritmo, 1))
+                content += f"\n        • {algoritmo}: " + ", ".join(
+                    f"CPU {nucleo} {uso:.0%}" for nucleo, uso in enumerate(usos)
+                )
+            content += "\n"
+
+        mlfq = grupos.get("MLFQ")
+        if mlfq and self.get_parametros:
+            parametros = self.get_parametros()
+            ocupacion = ocupacion_por_nivel(mlfq, parametros["quantums_mlfq"], parametros["boost_mlfq"])
+            total = sum(ocupacion) or 1
+            content += """
+        MLFQ (CPU ejecutada en cada nivel):"""
+            for nivel, (quantum, unidades) in enumerate(zip(parametros["quantums_mlfq"], ocupacion)):
+                content += f"\n        • Nivel {nivel} (quantum {quantum}): {unidades} u. ({unidades / total:.0%})"
+            content += "\n"
+
+        if self.get_envejecimiento and any(p.algoritmo in REQUIEREN_PRIORIDAD for p in self.procesos):
+            envejecimiento = self.get_envejecimiento()
+            sin, con = envejecimiento["sin"], envejecimiento["con"]
+            content += f"""
+        ENVEJECIMIENTO (procesos con prioridad, desde t=0):
+        • Sin envejecimiento: espera máx = {sin['espera_max']:.0f}, p99 = {sin['espera_p99']:.0f}, media = {sin['espera_media']:.2f}
+        • Tasa {envejecimiento['tasa']:g}: espera máx = {con['espera_max']:.0f}, p99 = {con['espera_p99']:.0f}, media = {con['espera_media']:.2f}
+        """
+
+        content += """
         DETALLES POR PROCESO:
         """
         
         for p in procesos_completados:
-            content += f"\n{p.nombre}: Espera={p.tiempo_espera}, Retorno={p.tiempo_retorno}"
+            content += f"\n{p.nombre}: Espera={p.tiempo_espera}, Retorno={p.tiempo_retorno}, Respuesta={p.tiempo_respuesta}"
+            if p.segmentos:
+                content += f", Tramos={texto_tramos(p)}"
+            if p.plazo is not None:
+                content += f", Plazo={p.plazo}, Tardanza={p.tardanza}"
+            if p.secuencia:
+                content += f", Ráfagas={p.texto_secuencia()}, E/S={p.tiempo_es}"
         
         text_widget = tk.Text(
             stats_window,
@@ -926,6 +1524,49 @@ class ProcesoTableView(tk.Frame):
         text_widget.insert(1.0, content)
         text_widget.configure(state="disabled")
 
+    def show_history(self) -> None:
+        """Muestra las últimas ejecuciones guardadas y la comparación entre algoritmos"""
+        import sqlite3
+
+        if not self.get_historial:
+            return
+        try:
+            historial = self.get_historial()
+        except sqlite3.Error as e:
+            messagebox.showerror("Error", f"No se pudo leer el historial: {str(e)}")
+            return
+        if not historial["ejecuciones"]:
+            messagebox.showinfo("Historial", "Aún no hay ejecuciones terminadas guardadas")
+            return
+
+        history_window = tk.Toplevel(self)
+        history_window.title("Historial de Ejecuciones")
+        history_window.geometry("640x480")
+        history_window.configure(bg="#1e1e2e")
+        history_window.transient(self.master) # type: ignore
+
+        # Resumen: promedio de cada métrica por algoritmo en las ejecuciones listadas
+        content = f"\n        COMPARACIÓN (últimas {len(historial['ejecuciones'])} ejecuciones):\n"
+        for algoritmo, serie in sorted(historial["espera_p95"].items()):
+            medias = [v for _, v in historial["espera_media"].get(algoritmo, [])]
+            content += (
+                f"        • {algoritmo}: p95 espera = {sum(v for _, v in serie) / len(serie):.2f}"
+                f" | espera media = {sum(medias) / max(len(medias), 1):.2f} ({len(serie)} ejecuciones)\n"
+            )
+        tk.Label(
+            history_window, text=content, justify="left", anchor="w",
+            bg="#1e1e2e", fg="#cdd6f4", font=("JetBrains Mono", 10)
+        ).pack(fill="x", padx=20, pady=(10, 0))
+
+        columns = ("id", "fecha", "procesos", "tiempo_total")
+        tree = ttk.Treeview(history_window, columns=columns, show="headings", style="Custom.Treeview")
+        for col, titulo in zip(columns, ("Ejecución", "Fecha", "Procesos", "Tiempo total")):
+            tree.heading(col, text=titulo)
+            tree.column(col, anchor="center", width=140)
+        for ejecucion_id, fecha, _, procesos, tiempo_total in historial["ejecuciones"]:
+            tree.insert("", "end", values=(ejecucion_id, fecha, procesos, tiempo_total))
+        tree.pack(fill="both", expand=True, padx=20, pady=20)
+
     def toggle_dark_mode(self) -> None:
         """Alterna entre modo oscuro y claro"""
         # Esta funcionalidad se puede implementar cambiando los colores de todos los widgets
@@ -953,22 +1594,51 @@ class ProcesoTableView(tk.Frame):
         • Agregar Proceso: Crea un nuevo proceso
         • Doble clic: Edita un proceso inline
         • Clic derecho: Menú contextual con opciones
+        • Plazo: instante en que el proceso debería terminar (opcional);
+          las estadísticas informan plazos incumplidos, tardanza y holgura
+        • CPU, E/S, ..., CPU (en Editar): ráfagas alternadas de CPU
+          y E/S; el proceso se bloquea durante cada E/S y la CPU
+          queda libre para otro (la ráfaga es el total de CPU)
         
         📊 ALGORITMOS SOPORTADOS:
         • FCFS: First Come First Served
         • Prioridades: Planificación por prioridades
+        • Prioridades expulsivo: una llegada de mayor prioridad
+          expulsa al proceso en CPU (varios tramos por proceso)
+        • SJF: al liberarse la CPU se despacha la ráfaga más corta
+        • SRTF: SJF expulsivo; una llegada con ráfaga menor que
+          lo que le resta al proceso en CPU lo expulsa
+        • Round Robin: turnos de un quantum en cola circular;
+          cada cambio de proceso cuesta el cambio de contexto
+        • MLFQ: colas multinivel; un proceso baja de nivel al
+          agotar su quantum y el boost periódico los sube a todos
+        • EDF: se despacha el plazo más cercano (los procesos sin
+          plazo van al final); EDF expulsivo: una llegada con plazo
+          anterior expulsa al proceso en CPU
+        • ⚙️ Parámetros: envejecimiento de prioridades (la prioridad
+          efectiva mejora mientras el proceso espera; evita la inanición),
+          quantum y costo del cambio de contexto de Round Robin,
+          quantums por nivel y período del boost de MLFQ, y núcleos
+          de CPU de FCFS, Prioridades, SJF y EDF (los expulsivos usan uno)
         
         📈 DIAGRAMA DE GANTT:
         • Verde: Proceso completado
         • Azul: Proceso en ejecución
         • Amarillo: Proceso pendiente
         • Línea roja: Tiempo actual
+        • Línea de tiempo: arrastre para saltar a cualquier instante
+        • Vista por núcleo: un carril por CPU de cada algoritmo,
+          con su utilización
+
+        🎞 TRAZAS:
+        • Cada ejecución se graba en una traza binaria (carpeta trazas/)
+        • Reproducir traza: anima una ejecución grabada sin recalcularla
         
         💡 CONSEJOS:
         • Los procesos se pueden agregar durante la ejecución
         • Los cambios se aplican dinámicamente
         • Use el log para seguir los eventos
-        • Exporte los resultados para análisis
+        • Exporte los resultados para análisis (CSV o binario columnar .fcb)
         """
         
         text_widget = tk.Text(
@@ -995,6 +1665,7 @@ class ProcesoTableView(tk.Frame):
         
         # Limpiar callbacks
         self.on_edit = None
+        self.on_edit_batch = None
         self.on_add = None
         self.on_run = None
         self.on_pause = None